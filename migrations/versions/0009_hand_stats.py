@@ -0,0 +1,63 @@
+"""Add hand_stats: the hero's stat counters per hand, written at persist time.
+
+Revision ID: 0009_hand_stats
+Revises: 0008_player_profiles
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0009_hand_stats"
+down_revision = "0008_player_profiles"
+branch_labels = None
+depends_on = None
+
+_COUNTERS = (
+    "hands_dealt",
+    "vpip_hands",
+    "pfr_hands",
+    "three_bet_opportunities",
+    "three_bet_hands",
+    "faced_3bet_after_raise",
+    "folded_to_3bet",
+    "cbet_flop",
+    "cbet_turn",
+    "cbet_river",
+    "cbet_opportunities_flop",
+    "cbet_opportunities_turn",
+    "cbet_opportunities_river",
+    "faced_cbet_flop",
+    "faced_cbet_turn",
+    "faced_cbet_river",
+    "faced_cbet_opportunities_flop",
+    "faced_cbet_opportunities_turn",
+    "faced_cbet_opportunities_river",
+    "folded_to_cbet_flop",
+    "folded_to_cbet_turn",
+    "folded_to_cbet_river",
+    "saw_flop_hands",
+    "wtsd_hands",
+    "showdown_hands",
+    "won_at_showdown_hands",
+    "postflop_bets_raises",
+    "postflop_calls",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "hand_stats",
+        sa.Column("hand_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("hands.id"), primary_key=True),
+        sa.Column(
+            "game_player_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("game_players.id"), primary_key=True,
+        ),
+        sa.Column("position", sa.String(10), nullable=True),
+        *[sa.Column(name, sa.Integer(), nullable=False, server_default="0") for name in _COUNTERS],
+    )
+    op.create_index("ix_hand_stats_game_player_id", "hand_stats", ["game_player_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_hand_stats_game_player_id", table_name="hand_stats")
+    op.drop_table("hand_stats")
@@ -0,0 +1,36 @@
+"""Add user_stats: per-user, per-position lifetime stat counter rollups.
+
+Run ``scripts/rebuild_stat_rollups.py`` once after upgrading to fill it from
+the games already recorded.
+
+Revision ID: 0010_user_stats
+Revises: 0009_hand_stats
+Create Date: 2026-10-18
+"""
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0010_user_stats"
+down_revision = "0009_hand_stats"
+branch_labels = None
+depends_on = None
+
+
+def _counters() -> tuple[str, ...]:
+    """The counter columns, exactly as 0009 gave them to hand_stats."""
+    return context.script.get_revision(down_revision).module._COUNTERS
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_stats",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("position", sa.String(10), primary_key=True),
+        *[sa.Column(name, sa.Integer(), nullable=False, server_default="0") for name in _counters()],
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_stats")
@@ -0,0 +1,37 @@
+"""Add games.num_hands (denormalized hand count) and the game-listing index.
+
+Existing games are backfilled from ``hands``; the recorder keeps the count
+current from then on.
+
+Revision ID: 0011_game_num_hands
+Revises: 0010_user_stats
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0011_game_num_hands"
+down_revision = "0010_user_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "games", sa.Column("num_hands", sa.Integer(), nullable=False, server_default="0")
+    )
+    op.execute(
+        "UPDATE games SET num_hands = counts.n "
+        "FROM (SELECT game_id, count(*) AS n FROM hands GROUP BY game_id) AS counts "
+        "WHERE games.id = counts.game_id"
+    )
+    op.create_index(
+        "ix_games_hero_started",
+        "games",
+        ["hero_user_id", sa.text("started_at DESC NULLS LAST"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_games_hero_started", table_name="games")
+    op.drop_column("games", "num_hands")
@@ -0,0 +1,33 @@
+"""Cascade hand_stats deletes from hands and game_players.
+
+0009 created both foreign keys without ``ON DELETE``, so deleting a hand or
+game that had stats rows failed with a foreign key violation.
+
+Revision ID: 0012_hand_stats_cascade
+Revises: 0011_game_num_hands
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0012_hand_stats_cascade"
+down_revision = "0011_game_num_hands"
+branch_labels = None
+depends_on = None
+
+# (column, referenced table); the constraints keep Postgres' default names.
+_FOREIGN_KEYS = (("hand_id", "hands"), ("game_player_id", "game_players"))
+
+
+def _recreate(ondelete: str | None) -> None:
+    for column, target in _FOREIGN_KEYS:
+        name = f"hand_stats_{column}_fkey"
+        op.drop_constraint(name, "hand_stats", type_="foreignkey")
+        op.create_foreign_key(name, "hand_stats", target, [column], ["id"], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    _recreate("CASCADE")
+
+
+def downgrade() -> None:
+    _recreate(None)
@@ -0,0 +1,201 @@
+"""Micro-benchmarks for the hand evaluators and equity estimation in pk_adapter.
+
+Times ``_best7_int``, ``hand_strength_key``, ``winners_from_cards``,
+``best_five`` and ``mc_win_rate`` across streets and 2/6/9 players and prints
+machine-readable JSON: evaluations/second plus p50/p99 latency per call for
+every case. With ``--compare`` the run fails (exit 1) if any case's
+throughput fell more than ``--tolerance`` below the stored baseline.
+
+Usage:
+  uv run python scripts/bench_pk_adapter.py                          # JSON to stdout
+  uv run python scripts/bench_pk_adapter.py --save-baseline          # refresh the baseline
+  uv run python scripts/bench_pk_adapter.py --compare --tolerance 0.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from poker_engine import pk_adapter
+
+BASELINE_PATH = Path(__file__).resolve().parent.parent / "benchmarks" / "pk_adapter_baseline.json"
+
+_STREET_BOARD = {"preflop": 0, "flop": 3, "turn": 4, "river": 5}
+_PLAYER_COUNTS = (2, 6, 9)
+_MC_SIMS = 1000
+
+
+def _deal(rng: random.Random, n_players: int, n_board: int) -> tuple[list[list[str]], list[str]]:
+    cards = rng.sample(pk_adapter.ALL_52, 2 * n_players + n_board)
+    holes = [cards[2 * i:2 * i + 2] for i in range(n_players)]
+    return holes, cards[2 * n_players:]
+
+
+def _time_case(
+    make_args: Callable[[random.Random], tuple],
+    fn: Callable,
+    evals_per_call: Callable[[tuple], int],
+    budget_s: float,
+    seed: int,
+) -> dict:
+    """Call ``fn`` on fresh arguments until ``budget_s`` is spent; time each call."""
+    rng = random.Random(seed)
+    latencies: list[int] = []
+    evals = 0
+    spent = 0
+    budget_ns = int(budget_s * 1e9)
+    while spent < budget_ns or len(latencies) < 20:
+        args = make_args(rng)
+        start = time.perf_counter_ns()
+        fn(*args)
+        elapsed = time.perf_counter_ns() - start
+        latencies.append(elapsed)
+        evals += evals_per_call(args)
+        spent += elapsed
+    lat = np.array(latencies) / 1000.0
+    return {
+        "calls": len(latencies),
+        "evals_per_s": round(evals / (spent / 1e9), 1),
+        "p50_us": round(float(np.percentile(lat, 50)), 2),
+        "p99_us": round(float(np.percentile(lat, 99)), 2),
+    }
+
+
+def run_benchmarks(budget_s: float, seed: int = 0) -> dict[str, dict]:
+    results: dict[str, dict] = {}
+    pk_adapter._rank_table()  # map the lookup table outside the timings
+    pk_adapter._preflop_table()
+
+    def best7_args(rng):
+        return pk_adapter._decode_cards(rng.sample(pk_adapter.ALL_52, 7))
+
+    results["_best7_int"] = _time_case(best7_args, pk_adapter._best7_int, lambda a: 1, budget_s, seed)
+
+    for street in ("flop", "turn", "river"):
+        n_board = _STREET_BOARD[street]
+
+        def hand_args(rng, n_board=n_board):
+            holes, board = _deal(rng, 1, n_board)
+            return holes[0], board
+
+        results[f"hand_strength_key/{street}"] = _time_case(
+            hand_args, pk_adapter.hand_strength_key, lambda a: 1, budget_s, seed,
+        )
+        results[f"best_five/{street}"] = _time_case(
+            hand_args, pk_adapter.best_five, lambda a: 1, budget_s, seed,
+        )
+        for n_players in _PLAYER_COUNTS:
+            def showdown_args(rng, n_board=n_board, n_players=n_players):
+                holes, board = _deal(rng, n_players, n_board)
+                return {f"p{i}": h for i, h in enumerate(holes)}, board
+
+            results[f"winners_from_cards/{street}/{n_players}p"] = _time_case(
+                showdown_args, pk_adapter.winners_from_cards, lambda a: len(a[0]), budget_s, seed,
+            )
+
+    for street, n_board in _STREET_BOARD.items():
+        for n_players in _PLAYER_COUNTS:
+            def equity_args(rng, n_board=n_board, n_players=n_players):
+                holes, board = _deal(rng, 1, n_board)
+                return holes[0], board, n_players, rng
+
+            def hands_scored(args):
+                # Exact spots score every deal rather than n_sim; a table
+                # lookup counts as one evaluation.
+                hole, board, n_players, _ = args
+                est = pk_adapter.equity_estimate(hole, board, n_players, n_sim=_MC_SIMS, cache=None)
+                return est.trials * n_players if est.trials else 1
+
+            results[f"mc_win_rate/{street}/{n_players}p"] = _time_case(
+                equity_args,
+                _mc_win_rate_uncached,
+                _memoised_count(hands_scored),
+                budget_s,
+                seed,
+            )
+    return results
+
+
+def _mc_win_rate_uncached(hole, board, n_players, rng) -> float:
+    # Measure the evaluator, not the equity cache.
+    return pk_adapter.mc_win_rate(hole, board, n_players, n_sim=_MC_SIMS, rng=rng, cache=None)
+
+
+def _memoised_count(count: Callable[[tuple], int]) -> Callable[[tuple], int]:
+    """Per-case evals are the same for every spot of a case; compute them once."""
+    cached: list[int] = []
+
+    def wrapper(args: tuple) -> int:
+        if not cached:
+            cached.append(count(args))
+        return cached[0]
+
+    return wrapper
+
+
+def compare(current: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Cases whose throughput dropped more than ``tolerance`` below the baseline."""
+    regressions = []
+    for name, base in sorted(baseline.items()):
+        now = current.get(name)
+        if now is None:
+            continue
+        floor = base["evals_per_s"] * (1.0 - tolerance)
+        if now["evals_per_s"] < floor:
+            regressions.append(
+                f"{name}: {now['evals_per_s']:.0f} evals/s < {floor:.0f} "
+                f"(baseline {base['evals_per_s']:.0f}, tolerance {tolerance:.0%})"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark pk_adapter evaluators.")
+    parser.add_argument("--budget", type=float, default=0.3, help="seconds of timed calls per case")
+    parser.add_argument("--seed", type=int, default=0, help="rng seed for the dealt spots")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="write this run as the baseline")
+    parser.add_argument("--compare", action="store_true", help="fail on regression vs the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed throughput drop (0-1)")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().astimezone().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "budget_s": args.budget,
+            "mc_sims": _MC_SIMS,
+        },
+        "results": run_benchmarks(args.budget, seed=args.seed),
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote baseline {args.baseline}", file=sys.stderr)
+
+    if args.compare:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(report["results"], baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} vs {args.baseline}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Build the preflop equity table shipped with pk_adapter.
+
+Simulates every one of the 169 starting-hand classes against 1-8 random
+opponents and writes ``src/poker_engine/data/preflop_equity_v1.npy``
+(uint16 equity * 65535, shape 169 x 8). Re-run only when the evaluator or
+the table format changes.
+
+Usage:
+  uv run python scripts/build_preflop_table.py
+  uv run python scripts/build_preflop_table.py --sims 50000 --seed 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+
+import numpy as np
+
+from poker_engine import pk_adapter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the preflop equity table.")
+    parser.add_argument("--sims", type=int, default=200_000, help="trials per class and player count")
+    parser.add_argument("--seed", type=int, default=0, help="rng seed")
+    parser.add_argument("--out", type=Path, default=pk_adapter.PREFLOP_TABLE_PATH, help="output .npy path")
+    args = parser.parse_args()
+
+    def progress(index: int, name: str, row: np.ndarray) -> None:
+        equities = " ".join(f"{v / 65535:.3f}" for v in row)
+        print(f"{index + 1:>3}/169 {name:>4}: {equities}", flush=True)
+
+    table = pk_adapter.build_preflop_table(args.sims, seed=args.seed, progress=progress)
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = args.out.with_suffix(".tmp")
+    with open(tmp, "wb") as fh:
+        np.save(fh, table)
+    os.replace(tmp, args.out)
+    print(f"Wrote {args.out} ({args.out.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Build the hand-rank lookup table shipped with pk_adapter.
+
+Scores every flush rank mask and every 5/6/7-card rank-count vector and
+writes ``src/poker_engine/data/rank_table_v1.npy`` (int32 packed strengths,
+memory-mapped at runtime). Deterministic; re-run only when the evaluator or
+the table layout changes.
+
+Usage:
+  uv run python scripts/build_rank_table.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+
+import numpy as np
+
+from poker_engine import pk_adapter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the hand-rank lookup table.")
+    parser.add_argument("--out", type=Path, default=pk_adapter.RANK_TABLE_PATH, help="output .npy path")
+    args = parser.parse_args()
+
+    table = pk_adapter._build_rank_table()
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = args.out.with_suffix(".tmp")
+    with open(tmp, "wb") as fh:
+        np.save(fh, table)
+    os.replace(tmp, args.out)
+    print(f"Wrote {args.out} ({args.out.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Export recorded games to Parquet / Arrow files for offline analytics.
+
+Writes one part file per table per ``--chunk-games`` games under ``--out``
+(see ``poker_engine.export``). With ``--stats``, also prints each hero's
+lifetime VPIP / PFR / 3-bet from the export, computed column-wise.
+
+Needs the ``analytics`` extra:
+  uv sync --extra analytics
+
+Usage:
+  uv run python scripts/export_analytics.py --out exports/2026-10
+  uv run python scripts/export_analytics.py --out exports/live --format arrow --include-live
+  uv run python scripts/export_analytics.py --out exports/2026-10 --stats
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from poker_engine.db.base import SessionLocal
+from poker_engine.export import EXPORT_CHUNK_GAMES, FORMATS, export_dataset, population_stats
+from poker_engine.stats import to_display
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Columnar export of recorded games.")
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--format", choices=FORMATS, default="parquet")
+    parser.add_argument("--chunk-games", type=int, default=EXPORT_CHUNK_GAMES)
+    parser.add_argument("--include-live", action="store_true", help="also export unfinished games")
+    parser.add_argument("--stats", action="store_true", help="print per-hero stats from the export")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        counts = export_dataset(
+            db, args.out, fmt=args.format, chunk_games=args.chunk_games, include_live=args.include_live,
+        )
+    for table, n in counts.items():
+        print(f"{table}: {n} rows")
+
+    if args.stats:
+        for user_id, raw in sorted(population_stats(args.out).items()):
+            s = to_display(raw)
+            print(
+                f"{user_id}: {s['hands_dealt']} hands  VPIP {s['vpip']['pct']}  "
+                f"PFR {s['pfr']['pct']}  3-bet {s['three_bet']['pct']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
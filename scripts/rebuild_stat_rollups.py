@@ -0,0 +1,46 @@
+"""Rebuild the per-user lifetime stat rollups (``user_stats``).
+
+Writes the missing ``hand_stats`` rows for hands recorded before that table
+existed, then recomputes each user's rollup from them. Run once after
+upgrading to migration 0010, or any time a rollup is suspected to be off.
+Each user is rebuilt in its own transaction.
+
+Usage:
+  uv run python scripts/rebuild_stat_rollups.py
+  uv run python scripts/rebuild_stat_rollups.py --email hero@example.com
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy import select
+
+from poker_engine.db.base import SessionLocal
+from poker_engine.db.models import Game, User
+from poker_engine.stats import rebuild_player_rollup
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild per-user stat rollups.")
+    parser.add_argument("--email", default=None, help="only rebuild this user")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        query = select(User.id, User.email).where(User.id.in_(select(Game.hero_user_id)))
+        if args.email:
+            query = query.where(User.email == args.email)
+        users = db.execute(query.order_by(User.email)).all()
+
+    for user_id, email in users:
+        with SessionLocal() as db:
+            counts = rebuild_player_rollup(db, user_id)
+            db.commit()
+        print(f"{email}: {counts.hands_dealt} hands")
+    print(f"Rebuilt {len(users)} rollup(s).")
+
+
+if __name__ == "__main__":
+    main()
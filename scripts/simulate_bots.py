@@ -0,0 +1,89 @@
+"""Headless batch bot-vs-bot simulation.
+
+Plays many seeded games across a process pool, optionally streams one JSON
+line per hand to ``--out``, and prints bb/100 with a 95% confidence interval
+for each bot style. Never touches the database.
+
+Usage:
+  uv run python scripts/simulate_bots.py --games 200 --hands 100
+  uv run python scripts/simulate_bots.py --seats tag,lag,station,rock --out hands.jsonl
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from poker_engine.config import GameConfig, SeatKind, SeatSpec
+from poker_engine.simulate import aggregate, run_simulation
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a batch of bot-vs-bot games.")
+    parser.add_argument("--seats", default="tag,lag,station,rock", help="comma-separated bot styles")
+    parser.add_argument("--games", type=int, default=50, help="number of games")
+    parser.add_argument("--hands", type=int, default=100, help="hands per game")
+    parser.add_argument("--small-blind", type=int, default=5)
+    parser.add_argument("--buy-in", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0, help="base seed; game i uses seed + 100*i")
+    parser.add_argument("--workers", type=int, default=None, help="processes (0 = in-process)")
+    parser.add_argument(
+        "--state-machine", choices=("native", "pokerkit"), default="native",
+        help="hand state machine (native is faster; pokerkit is the reference)",
+    )
+    parser.add_argument("--out", type=Path, default=None, help="write per-hand JSONL records here")
+    args = parser.parse_args()
+
+    config = GameConfig(
+        small_blind=args.small_blind,
+        buy_in=args.buy_in,
+        seats=[
+            SeatSpec(name=f"{style}-{i}", kind=SeatKind(style))
+            for i, style in enumerate(args.seats.split(","))
+        ],
+    )
+
+    out = args.out.open("w") if args.out else None
+    n_hands = 0
+
+    def stream():
+        # Fold each record into the aggregate as it arrives; nothing is kept.
+        nonlocal n_hands
+        for game_index, record in run_simulation(
+            config, args.games, args.hands, seed=args.seed, workers=args.workers,
+            state_machine=args.state_machine,
+        ):
+            n_hands += 1
+            if out:
+                out.write(json.dumps({
+                    "game": game_index,
+                    "hand": record.hand,
+                    "stacks": record.stacks,
+                    "deltas": record.deltas,
+                    "winners": record.winners,
+                    "showdown": record.showdown,
+                    "street": record.street,
+                }) + "\n")
+            yield record
+
+    start = time.perf_counter()
+    try:
+        results = aggregate(config, stream())
+    finally:
+        if out:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"{n_hands} hands in {elapsed:.1f}s ({n_hands / elapsed:.0f} hands/s)")
+    for style, result in sorted(results.items()):
+        print(
+            f"{style:>8}: {result.bb_per_100:+8.2f} ± {result.ci95:6.2f} bb/100"
+            f"  (n={result.hands}, showdown {result.showdown_rate:.0%}, won {result.win_rate:.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 """Synthesis agent — the one LLM stage that PULLS via tools.
 
 Receives the stats snapshot, session dynamics, and all merged leak tags as
-pinned context, and has all five tools (hand_lookup, equity_calculator,
-stats_query, pot_odds, hand_search) to verify claims before making them.
+pinned context, and has all six tools (hand_lookup, equity_calculator,
+range_equity, stats_query, pot_odds, hand_search) to verify claims before
+making them.
 Severity/kind/citations for each report section always come from the
 already-merged ``leak_tags`` (code), never from the model — the model only
 supplies the narrative text per tag and must ground every number in pinned
@@ -24,6 +25,7 @@ from ai_functions.tools.executors import (
     make_hand_lookup_tool,
     make_hand_search_tool,
     make_pot_odds_tool,
+    make_range_equity_tool,
     make_stats_query_tool,
 )
 from ai_functions.tools.loop import run_tool_loop
@@ -44,8 +46,8 @@ Rules you MUST follow:
 amount) must come directly from the pinned context or from a tool result you \
 obtained in this conversation. Never state a number you did not get from one \
 of those two sources. Use the tools (hand_lookup, equity_calculator, \
-stats_query, pot_odds, hand_search) to verify specific claims before making \
-them, rather than asserting them from memory.
+range_equity, stats_query, pot_odds, hand_search) to verify specific claims \
+before making them, rather than asserting them from memory.
 - Reconcile findings from multiple street agents on the same hand into one \
 coherent, line-level narrative rather than listing them separately.
 - Structure your report around the highest-severity leak tags first.
@@ -167,6 +169,7 @@ async def run_synthesis(
     executors = {
         "hand_lookup": make_hand_lookup_tool(db, game_id, user),
         "equity_calculator": make_equity_calculator_tool(),
+        "range_equity": make_range_equity_tool(),
         "stats_query": make_stats_query_tool(db, game_id, user),
         "pot_odds": make_pot_odds_tool(),
         "hand_search": make_hand_search_tool(db, game_id, user),
@@ -13,7 +13,7 @@ from typing import Callable
 
 from sqlalchemy.orm import Session
 
-from poker_engine import pk_adapter, stats
+from poker_engine import equity_pool, pk_adapter, stats
 from poker_engine.db.models import User
 
 
@@ -32,15 +32,31 @@ def make_hand_lookup_tool(db: Session, game_id: str, user: User) -> Callable[[in
 
 def make_equity_calculator_tool() -> Callable[[list[str], list[str], int], dict]:
     def _equity_calculator(hole: list[str], board: list[str], n_active_players: int) -> dict:
-        win_rate = pk_adapter.mc_win_rate(hole, board, n_active_players)
+        result = equity_pool.estimate(hole, board, n_active_players)
         return {
-            "win_rate": win_rate,
+            "win_rate": result.win_rate,
+            "exact": result.method == "exact",
             "note": "Equity vs random opponent hands, not a specific or hypothesized villain range.",
         }
 
     return _equity_calculator
 
 
+def make_range_equity_tool() -> Callable[[str, str, list[str]], dict]:
+    def _range_equity(hero: str, villain_range: str, board: list[str]) -> dict:
+        try:
+            result = pk_adapter.range_equity(hero, villain_range, board)
+        except ValueError as exc:
+            return {"error": str(exc)}
+        return {
+            "equity": result.win_rate,
+            "exact": result.method == "exact",
+            "note": "Heads-up equity vs the given villain range, card removal applied.",
+        }
+
+    return _range_equity
+
+
 def make_pot_odds_tool() -> Callable[[int, int], dict]:
     def _pot_odds(pot_size: int, amount_to_call: int) -> dict:
         denominator = pot_size + amount_to_call
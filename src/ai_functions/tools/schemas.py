@@ -36,7 +36,9 @@ EQUITY_CALCULATOR_SCHEMA = {
     "function": {
         "name": "equity_calculator",
         "description": (
-            "Estimate hero's equity via Monte Carlo simulation. This is "
+            "Compute hero's equity: exact enumeration when few run-outs "
+            "remain (e.g. heads-up on the turn or river, flagged by "
+            "\"exact\": true), Monte Carlo simulation otherwise. This is "
             "equity vs random opponent hands, NOT vs a specific or "
             "action-implied villain range — it does not model what "
             "opponents' actions imply about their holdings."
@@ -69,6 +71,44 @@ EQUITY_CALCULATOR_SCHEMA = {
     },
 }
 
+RANGE_EQUITY_SCHEMA = {
+    "type": "function",
+    "function": {
+        "name": "range_equity",
+        "description": (
+            "Compute heads-up equity of hero's hand (or range) against a "
+            "hypothesized villain range, with card removal from the board "
+            "and between the two hands. Ranges use standard shorthand, "
+            "comma-separated: pairs \"QQ+\" / \"99-66\", suited or offsuit "
+            "\"AKs\" / \"KQo\" / \"ATs+\" / \"A5s-A2s\", both suitednesses "
+            "\"AK\", exact hands \"AhKh\", and optional weights \"KQo:0.5\". "
+            "Exact when few combinations remain, Monte Carlo otherwise."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "hero": {
+                    "type": "string",
+                    "description": "Hero's exact hand, e.g. \"AsKh\", or a range.",
+                },
+                "villain_range": {
+                    "type": "string",
+                    "description": "Villain's range, e.g. \"QQ+, AKs, 76s\".",
+                },
+                "board": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "minItems": 0,
+                    "maxItems": 5,
+                    "description": "Community cards revealed so far (0-5 cards).",
+                },
+            },
+            "required": ["hero", "villain_range", "board"],
+            "additionalProperties": False,
+        },
+    },
+}
+
 STATS_QUERY_SCHEMA = {
     "type": "function",
     "function": {
@@ -177,6 +217,7 @@ HAND_SEARCH_SCHEMA = {
 ALL_TOOL_SCHEMAS = [
     HAND_LOOKUP_SCHEMA,
     EQUITY_CALCULATOR_SCHEMA,
+    RANGE_EQUITY_SCHEMA,
     STATS_QUERY_SCHEMA,
     POT_ODDS_SCHEMA,
     HAND_SEARCH_SCHEMA,
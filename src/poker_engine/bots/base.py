@@ -11,7 +11,7 @@ from __future__ import annotations
 import random
 from dataclasses import asdict, dataclass
 
-from poker_engine.pk_adapter import mc_win_rate
+from poker_engine import equity_pool
 
 
 @dataclass
@@ -22,7 +22,7 @@ class StyleParams:
     aggression: float = 0.5     # propensity to raise rather than call
     bluff_freq: float = 0.05    # chance to bluff-raise a weak hand
     raise_sizing: float = 0.6   # raise target as a fraction of the pot
-    nb_simulation: int = 200    # Monte Carlo trials for the equity estimate
+    nb_simulation: int = 200    # max Monte Carlo trials for the equity estimate
 
     def as_dict(self) -> dict[str, float]:
         return asdict(self)
@@ -60,13 +60,17 @@ class StyleBot:
                                   {"action": "raise", "amount": {"min": M, "max": X}}]``.
         """
         community = round_state.get("community_card", [])
-        win_rate = mc_win_rate(
+        # Runs on the shared equity pool when the web app has one.
+        win_rate = equity_pool.estimate(
             hole=list(hole_card),
             board=list(community),
             n_active_players=self._n_players,
             n_sim=self.params.nb_simulation,
             rng=self._rng,
-        )
+            # Only which side of ``tightness`` equity falls on matters, so
+            # sampling stops as soon as that is statistically clear.
+            threshold=self.params.tightness,
+        ).win_rate
 
         call = _find_action(valid_actions, "call")
         fold = _find_action(valid_actions, "fold")
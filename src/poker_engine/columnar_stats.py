@@ -0,0 +1,243 @@
+"""Vectorized ``compute_hand_stats`` over columnar hand data.
+
+The same counters as ``stats.compute_hand_stats``, computed for every
+``hand_players`` row at once from plain column arrays (as read back from an
+analytics export, see ``export.py``) instead of one ORM ``Hand`` at a time.
+Inputs are mappings of column name -> 1-D array:
+
+    hands         id, street_reached, had_showdown
+    hand_players  hand_id, game_player_id, position, is_winner, amount_won
+    actions       hand_id, game_player_id, street, action, amount, seq
+
+Ids may be any comparable values (the export writes UUIDs as strings);
+streets and actions are their lowercase string values. ``hand_stat_matrix``
+returns one row of ``COUNTER_FIELDS`` per ``hand_players`` row;
+``sum_by`` folds rows into ``RawStatCounts`` per key (e.g. per user).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import numpy as np
+
+from poker_engine.stats import COUNTER_FIELDS, RawStatCounts
+
+_STREETS = {"preflop": 0, "flop": 1, "turn": 2, "river": 3}  # any other street -> 4
+_REACHED = {"preflop": 0, "flop": 1, "turn": 2, "river": 3, "showdown": 4}  # unknown -> 0
+_RAISE, _CALL, _FOLD = 0, 1, 2  # any other action -> 3
+_ACTIONS = {"raise": _RAISE, "call": _CALL, "fold": _FOLD}
+_COL = {name: i for i, name in enumerate(COUNTER_FIELDS)}
+
+
+def _codes(values, mapping: dict[str, int], default: int) -> np.ndarray:
+    """Map string values to small int codes (one dict lookup per distinct value)."""
+    values = np.asarray(values).astype(str)
+    if not len(values):
+        return np.zeros(0, dtype=np.int64)
+    distinct, inverse = np.unique(values, return_inverse=True)
+    table = np.array([mapping.get(v, default) for v in distinct], dtype=np.int64)
+    return table[inverse]
+
+
+def _index_of(keys: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Position of each of ``values`` in ``keys`` (-1 where absent)."""
+    if not len(keys):
+        return np.full(len(values), -1, dtype=np.int64)
+    order = np.argsort(keys, kind="stable")
+    ordered = keys[order]
+    pos = np.minimum(np.searchsorted(ordered, values), len(ordered) - 1)
+    return np.where(ordered[pos] == values, order[pos], -1)
+
+
+def _first_after(keys: np.ndarray, payload: np.ndarray, lo: np.ndarray, hi: np.ndarray):
+    """For sorted ``keys``: whether a key lies in ``(lo, hi)``, the first such
+    key and its payload, aligned with ``lo``/``hi``.
+    """
+    if not len(keys):
+        none = np.zeros(len(lo), dtype=np.int64)
+        return np.zeros(len(lo), dtype=bool), none, none
+    idx = np.searchsorted(keys, lo, side="right")
+    clipped = np.minimum(idx, len(keys) - 1)
+    found = (idx < len(keys)) & (keys[clipped] < hi)
+    return found, keys[clipped], payload[clipped]
+
+
+def hand_stat_matrix(
+    hands: Mapping[str, np.ndarray],
+    hand_players: Mapping[str, np.ndarray],
+    actions: Mapping[str, np.ndarray],
+) -> np.ndarray:
+    """``compute_hand_stats`` for every ``hand_players`` row, as an int matrix.
+
+    Row ``i`` holds the counters (in ``COUNTER_FIELDS`` order) of
+    ``hand_players`` row ``i``'s seat in its hand. Actions by seats without
+    a ``hand_players`` row still count as other players' actions, so the
+    rows may be pre-filtered (e.g. to hero seats only).
+    """
+    hand_ids = np.asarray(hands["id"]).astype(str)
+    n_hands = len(hand_ids)
+    reached = _codes(hands["street_reached"], _REACHED, 0)
+    showdown = np.asarray(hands["had_showdown"], dtype=bool)
+
+    hp_hand = _index_of(hand_ids, np.asarray(hand_players["hand_id"]).astype(str))
+    act_hand = _index_of(hand_ids, np.asarray(actions["hand_id"]).astype(str))
+    if (hp_hand < 0).any() or (act_hand < 0).any():
+        raise ValueError("hand_players/actions reference hands that are not in `hands`")
+
+    # One int code per game_player across both tables.
+    hp_gp_raw = np.asarray(hand_players["game_player_id"]).astype(str)
+    act_gp_raw = np.asarray(actions["game_player_id"]).astype(str)
+    _, gp_codes = np.unique(np.concatenate([hp_gp_raw, act_gp_raw]), return_inverse=True)
+    n_gps = int(gp_codes.max()) + 1 if len(gp_codes) else 1
+    hp_gp, act_gp = gp_codes[:len(hp_gp_raw)], gp_codes[len(hp_gp_raw):]
+
+    n_rows = len(hp_hand)
+    out = np.zeros((n_rows, len(COUNTER_FIELDS)), dtype=np.int64)
+    out[:, _COL["hands_dealt"]] = 1
+    rows = np.arange(n_rows)
+
+    # Actions, sorted by (hand, seq) like the per-hand walk.
+    seq = np.asarray(actions["seq"], dtype=np.int64)
+    order = np.lexsort((seq, act_hand))
+    a_hand, a_gp, a_seq = act_hand[order], act_gp[order], seq[order]
+    a_street = _codes(actions["street"], _STREETS, 4)[order]
+    a_kind = _codes(actions["action"], _ACTIONS, 3)[order]
+    a_amount = np.asarray(actions["amount"], dtype=np.int64)[order]
+    a_row = _index_of(hp_hand * n_gps + hp_gp, a_hand * n_gps + a_gp)  # acting seat's row, or -1
+    mine = a_row >= 0
+    span = int(a_seq.max()) + 2 if len(a_seq) else 2  # seq sentinel "after everything" = span - 1
+    after_all = span - 1
+
+    # -- VPIP / PFR --------------------------------------------------------------
+    preflop = a_street == 0
+    pf_raise = preflop & (a_kind == _RAISE)
+    out[a_row[mine & preflop & ((a_kind == _RAISE) | (a_kind == _CALL))], _COL["vpip_hands"]] = 1
+    out[a_row[mine & pf_raise], _COL["pfr_hands"]] = 1
+
+    # -- 3-bet opportunity / hit / fold-to-3bet ----------------------------------
+    first_raise = np.full(n_rows, after_all, dtype=np.int64)
+    np.minimum.at(first_raise, a_row[mine & pf_raise], a_seq[mine & pf_raise])
+    raised = first_raise < after_all
+    raise_keys = np.sort(a_hand[pf_raise] * span + a_seq[pf_raise])
+    hp_base = hp_hand * span
+
+    def raises_between(lo_excl, hi_excl):
+        return (np.searchsorted(raise_keys, hp_base + hi_excl, side="left")
+                - np.searchsorted(raise_keys, hp_base + lo_excl, side="right"))
+
+    # The seat's own raises never precede its first raise, so any raise before
+    # it is someone else's (and with no raise of its own, any raise at all).
+    faced = raises_between(-1, first_raise) >= 1
+    out[faced, _COL["three_bet_opportunities"]] = 1
+    out[faced & raised, _COL["three_bet_hands"]] = 1
+
+    own_pf = mine & preflop
+    own_keys = a_row[own_pf] * span + a_seq[own_pf]
+    own_order = np.argsort(own_keys, kind="stable")
+    own_keys, own_kind = own_keys[own_order], a_kind[own_pf][own_order]
+    found, key, kind = _first_after(own_keys, own_kind, rows * span + first_raise, (rows + 1) * span)
+    next_seq = np.where(found, key - rows * span, after_all)
+    further = raised & (raises_between(first_raise, next_seq) >= 1)
+    out[further, _COL["faced_3bet_after_raise"]] = 1
+    out[further & found & (kind == _FOLD), _COL["folded_to_3bet"]] = 1
+
+    # -- c-bet / fold-to-cbet per street -----------------------------------------
+    # Per-(hand, street) lookups index the action arrays, with -1 (the
+    # appended last element) standing for "no such action".
+    n_actions = len(a_hand)
+    positions = np.arange(n_actions)
+    hand_street = a_hand * 5 + a_street
+    is_raise = a_kind == _RAISE
+    gp_or_none = np.append(a_gp, -1)
+    last_raise = np.full(n_hands * 5, -1, dtype=np.int64)
+    np.maximum.at(last_raise, hand_street[is_raise], positions[is_raise])
+    last_raiser = gp_or_none[last_raise].reshape(n_hands, 5)
+    aggressor = np.full((n_hands, 4), -1, dtype=np.int64)  # aggressor going into each street
+    aggressor[:, 1] = last_raiser[:, 0]
+    for street in (2, 3):
+        prev = last_raiser[:, street - 1]
+        aggressor[:, street] = np.where(prev >= 0, prev, aggressor[:, street - 1])
+
+    first_act = np.full(n_hands * 5, n_actions, dtype=np.int64)
+    np.minimum.at(first_act, hand_street, positions)
+    first_act[first_act == n_actions] = -1
+    first_act = first_act.reshape(n_hands, 5)
+    kind_or_none = np.append(a_kind, -1)
+    amount_or_none = np.append(a_amount, 0)
+    own_street_keys = (a_row[mine] * 5 + a_street[mine]) * span + a_seq[mine]
+    own_street_order = np.argsort(own_street_keys, kind="stable")
+    own_street_keys = own_street_keys[own_street_order]
+    own_street_kind = a_kind[mine][own_street_order]
+
+    hp_reached = reached[hp_hand]
+    for street, name in ((1, "flop"), (2, "turn"), (3, "river")):
+        street_reached = hp_reached >= street
+        agg = aggressor[hp_hand, street]
+
+        own_opp = street_reached & (agg == hp_gp)
+        first = first_act[hp_hand, street]
+        cbet = own_opp & (gp_or_none[first] == hp_gp) & (kind_or_none[first] == _RAISE) & (amount_or_none[first] > 0)
+        out[own_opp, _COL[f"cbet_opportunities_{name}"]] += 1
+        out[cbet, _COL[f"cbet_{name}"]] += 1
+
+        # The aggressor's first sized raise on this street, per hand.
+        bet = (a_street == street) & is_raise & (a_amount > 0) & (a_gp == aggressor[a_hand, street])
+        bet_seq = np.full(n_hands, after_all, dtype=np.int64)
+        np.minimum.at(bet_seq, a_hand[bet], a_seq[bet])
+        seen = bet_seq[hp_hand] < after_all
+        faced_cbet = street_reached & (agg >= 0) & (agg != hp_gp) & seen
+        street_base = (rows * 5 + street) * span
+        found, _, kind = _first_after(
+            own_street_keys, own_street_kind, street_base + bet_seq[hp_hand], street_base + span,
+        )
+        out[faced_cbet, _COL[f"faced_cbet_opportunities_{name}"]] += 1
+        out[faced_cbet, _COL[f"faced_cbet_{name}"]] += 1
+        out[faced_cbet & found & (kind == _FOLD), _COL[f"folded_to_cbet_{name}"]] += 1
+
+    # -- WTSD / showdown / won-at-showdown ---------------------------------------
+    saw_flop = hp_reached >= 1
+    out[saw_flop, _COL["saw_flop_hands"]] = 1
+    folded = np.zeros(n_rows, dtype=bool)
+    folded[a_row[mine & (a_kind == _FOLD)]] = True
+    at_showdown = showdown[hp_hand] & ~folded
+    won = np.asarray(hand_players["is_winner"], dtype=bool) & (np.asarray(hand_players["amount_won"]) > 0)
+    out[at_showdown, _COL["showdown_hands"]] = 1
+    out[at_showdown & saw_flop, _COL["wtsd_hands"]] = 1
+    out[at_showdown & won, _COL["won_at_showdown_hands"]] = 1
+
+    # -- aggression factor components --------------------------------------------
+    postflop = mine & (a_street >= 1) & (a_street <= 3)
+    np.add.at(out[:, _COL["postflop_bets_raises"]], a_row[postflop & is_raise], 1)
+    np.add.at(out[:, _COL["postflop_calls"]], a_row[postflop & (a_kind == _CALL)], 1)
+    return out
+
+
+def sum_by(keys, matrix: np.ndarray, positions) -> dict[str, RawStatCounts]:
+    """Fold ``hand_stat_matrix`` rows into one ``RawStatCounts`` per key.
+
+    ``keys`` (e.g. each row's user id) are compared as strings and returned
+    as such. ``positions`` is the rows' ``hand_players.position`` column;
+    rows with no position count toward the totals only, as in
+    ``compute_hand_stats``.
+    """
+    keys = np.asarray(keys)
+    if not len(keys):
+        return {}
+    names, key_ix = np.unique(keys.astype(str), return_inverse=True)
+    positions = np.asarray(positions, dtype=object)
+    positions = np.where(np.equal(positions, None), "", positions).astype(str)
+    pos_names, pos_ix = np.unique(positions, return_inverse=True)
+
+    cells = key_ix * len(pos_names) + pos_ix
+    totals = np.zeros((len(names), matrix.shape[1]), dtype=np.int64)
+    np.add.at(totals, key_ix, matrix)
+    by_pos = np.zeros((len(names) * len(pos_names), matrix.shape[1]), dtype=np.int64)
+    np.add.at(by_pos, cells, matrix)
+
+    out = {str(name): RawStatCounts._from_values(totals[k].tolist()) for k, name in enumerate(names)}
+    for cell in np.unique(cells).tolist():
+        pos = str(pos_names[cell % len(pos_names)])
+        if pos:
+            out[str(names[cell // len(pos_names)])]._positions[pos] = by_pos[cell].tolist()
+    return out
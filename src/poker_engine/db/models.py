@@ -8,6 +8,8 @@ Modeled for a future online, multi-user platform:
   hands          one row per hand, from the hero's perspective
   hand_players   per-hand participation; hidden-info rule lives here
   actions        one row per betting action (full replay)
+  hand_stats     the hero's stat counters per hand, summed for game stats
+  user_stats     a user's lifetime stat counters per position (rollup)
 
 The hidden-information rule: an opponent's ``hole_cards`` are only stored when
 that seat reached showdown (its uuid appears in PyPokerEngine's ``hand_info``);
@@ -26,6 +28,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -169,6 +172,9 @@ class Game(Base):
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
     )
     rule: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # Denormalized count of recorded hands, bumped by the recorder with each
+    # bulk insert so game listings never count (or load) the hands.
+    num_hands: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -182,6 +188,15 @@ class Game(Base):
     )
 
 
+# Backs the keyset-paginated game listing (newest first, per hero).
+Index(
+    "ix_games_hero_started",
+    Game.hero_user_id,
+    Game.started_at.desc().nullslast(),
+    Game.id.desc(),
+)
+
+
 class GamePlayer(Base):
     """A seat in a game plus its per-game stats.
 
@@ -252,6 +267,9 @@ class Hand(Base):
     actions: Mapped[list["Action"]] = relationship(
         back_populates="hand", cascade="all, delete-orphan"
     )
+    stats: Mapped[list["HandStat"]] = relationship(
+        back_populates="hand", cascade="all, delete-orphan"
+    )
 
 
 class HandPlayer(Base):
@@ -356,6 +374,80 @@ class Action(Base):
     game_player: Mapped["GamePlayer"] = relationship(back_populates="actions")
 
 
+class StatCounters:
+    """One integer column per ``poker_engine.stats.RawStatCounts`` counter."""
+
+    hands_dealt: Mapped[int] = mapped_column(Integer, default=0)
+    vpip_hands: Mapped[int] = mapped_column(Integer, default=0)
+    pfr_hands: Mapped[int] = mapped_column(Integer, default=0)
+    three_bet_opportunities: Mapped[int] = mapped_column(Integer, default=0)
+    three_bet_hands: Mapped[int] = mapped_column(Integer, default=0)
+    faced_3bet_after_raise: Mapped[int] = mapped_column(Integer, default=0)
+    folded_to_3bet: Mapped[int] = mapped_column(Integer, default=0)
+
+    cbet_flop: Mapped[int] = mapped_column(Integer, default=0)
+    cbet_turn: Mapped[int] = mapped_column(Integer, default=0)
+    cbet_river: Mapped[int] = mapped_column(Integer, default=0)
+    cbet_opportunities_flop: Mapped[int] = mapped_column(Integer, default=0)
+    cbet_opportunities_turn: Mapped[int] = mapped_column(Integer, default=0)
+    cbet_opportunities_river: Mapped[int] = mapped_column(Integer, default=0)
+    faced_cbet_flop: Mapped[int] = mapped_column(Integer, default=0)
+    faced_cbet_turn: Mapped[int] = mapped_column(Integer, default=0)
+    faced_cbet_river: Mapped[int] = mapped_column(Integer, default=0)
+    faced_cbet_opportunities_flop: Mapped[int] = mapped_column(Integer, default=0)
+    faced_cbet_opportunities_turn: Mapped[int] = mapped_column(Integer, default=0)
+    faced_cbet_opportunities_river: Mapped[int] = mapped_column(Integer, default=0)
+    folded_to_cbet_flop: Mapped[int] = mapped_column(Integer, default=0)
+    folded_to_cbet_turn: Mapped[int] = mapped_column(Integer, default=0)
+    folded_to_cbet_river: Mapped[int] = mapped_column(Integer, default=0)
+
+    saw_flop_hands: Mapped[int] = mapped_column(Integer, default=0)
+    wtsd_hands: Mapped[int] = mapped_column(Integer, default=0)
+    showdown_hands: Mapped[int] = mapped_column(Integer, default=0)
+    won_at_showdown_hands: Mapped[int] = mapped_column(Integer, default=0)
+
+    postflop_bets_raises: Mapped[int] = mapped_column(Integer, default=0)
+    postflop_calls: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class HandStat(StatCounters, Base):
+    """The hero's ``RawStatCounts`` for one hand, computed once at persist time.
+
+    Game stats are a ``SUM`` over these rows grouped by ``position``; each
+    insert is also added to the hero's ``UserStat`` rollup.
+    """
+
+    __tablename__ = "hand_stats"
+
+    hand_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("hands.id", ondelete="CASCADE"), primary_key=True
+    )
+    game_player_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("game_players.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    position: Mapped[str | None] = mapped_column(String(10), nullable=True)
+
+    hand: Mapped["Hand"] = relationship(back_populates="stats")
+
+
+class UserStat(StatCounters, Base):
+    """A user's lifetime stat counters for one position (``""`` = no position).
+
+    Kept up to date additively as hands are persisted; the user's totals are
+    the sum of their rows. ``scripts/rebuild_stat_rollups.py`` recomputes it.
+    """
+
+    __tablename__ = "user_stats"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True
+    )
+    position: Mapped[str] = mapped_column(String(10), primary_key=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
 class GameEvaluation(Base):
     """A game-level coaching evaluation run (background job, resumable)."""
 
@@ -10,14 +10,17 @@ import random
 import warnings
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Iterator
 
 from pokerkit import Automation, NoLimitTexasHoldem
 
 from poker_engine import pk_adapter
 from poker_engine.bots.styles import STYLE_REGISTRY
 from poker_engine.config import GameConfig, SeatSpec
+from poker_engine.holdem import HoldemState
 from poker_engine.players.console import ConsolePlayer
 from poker_engine.recorder import PerspectiveRecorder
+from poker_engine.replay import ReplayLog
 
 _AUTOMATIONS = (
     Automation.ANTE_POSTING,
@@ -30,16 +33,33 @@ _AUTOMATIONS = (
     # CARD_BURNING is NOT automated: we burn manually so indices stay aligned.
 )
 
+# "pokerkit" is the reference implementation; "native" is the slim
+# HoldemState, for bot-only tables and bulk simulation.
+STATE_MACHINES = ("pokerkit", "native")
+
 _STREET_NAMES = {0: "preflop", 1: "flop", 2: "turn", 3: "river"}
 _BOARD_CARDS_PER_STREET = {1: 3, 2: 1, 3: 1}
 
 
 @dataclass
 class GameResult:
-    """Outcome of a run: final player stacks plus the persisted game id."""
+    """Outcome of a run: final player stacks, the persisted game id and replay log."""
 
     players: list[dict]  # [{"name": str, "stack": int}, ...]
     game_id: object | None = None
+    replay: ReplayLog | None = None
+
+
+@dataclass(slots=True)
+class HandRecord:
+    """Compact outcome of one hand, indexed by seat (never persisted)."""
+
+    hand: int
+    stacks: tuple[int, ...]  # stacks after the hand
+    deltas: tuple[int, ...]  # chips won (+) or lost (-) this hand
+    winners: tuple[int, ...]  # seats with a positive payoff
+    showdown: tuple[int, ...]  # seats that reached showdown (empty if won uncontested)
+    street: int  # last street dealt: 0 preflop .. 3 river
 
 
 class GameEngine:
@@ -48,11 +68,17 @@ class GameEngine:
         config: GameConfig,
         seed: int | None = None,
         hero_index: int | None = None,
+        state_machine: str = "pokerkit",
     ):
         config.validate()
+        if state_machine not in STATE_MACHINES:
+            raise ValueError(f"Unknown state machine {state_machine!r}; expected one of {STATE_MACHINES}.")
         self.config = config
+        self.state_machine = state_machine
         self.seed = seed
-        self._rng = random.Random(seed)
+        # The deal is always seeded so every game can be replayed from its log.
+        self.deal_seed = seed if seed is not None else random.getrandbits(64)
+        self._rng = random.Random(self.deal_seed)
         self._hero_index = hero_index
 
         n = len(config.seats)
@@ -74,6 +100,13 @@ class GameEngine:
         if hero_index is not None:
             self._hero_player_index = hero_index
 
+        self.replay: ReplayLog | None = ReplayLog(
+            self.deal_seed, config, hero_index=self._hero_player_index, state_machine=state_machine,
+        )
+        # The hand in progress (PokerKit or native state), for replay and debugging.
+        self.state = None
+        self.pk_to_seat: list[int] = []
+
     def run(self, record: bool = True, session_factory=None) -> GameResult:
         from poker_engine.recorder import PerspectiveRecorder
 
@@ -100,149 +133,7 @@ class GameEngine:
         started_at = datetime.now().astimezone()
 
         for hand_num in range(1, config.max_round + 1):
-            sb_pos = (hand_num - 1) % n
-            bb_pos = (hand_num) % n
-
-            rotated = [stacks[(sb_pos + i) % n] for i in range(n)]
-            pk_to_seat = [(sb_pos + i) % n for i in range(n)]
-            seat_to_pk = [0] * n
-            for pk_i, seat_i in enumerate(pk_to_seat):
-                seat_to_pk[seat_i] = pk_i
-
-            state = NoLimitTexasHoldem.create_state(
-                automations=_AUTOMATIONS,
-                ante_trimming_status=True,
-                raw_antes=config.ante,
-                raw_blinds_or_straddles=(config.small_blind, config.big_blind),
-                min_bet=config.big_blind,
-                raw_starting_stacks=rotated,
-                player_count=n,
-            )
-
-            deck = list(state.deck_cards)
-            self._rng.shuffle(deck)
-            card_idx = 0
-            for _ in range(2):
-                for i in range(n):
-                    state.deal_hole(deck[card_idx])
-                    card_idx += 1
-            remaining = deck[card_idx:]
-            rem_idx = 0
-
-            if recorder:
-                hero_hole = pk_adapter.cards_to_strs(state.hole_cards[seat_to_pk[self._hero_player_index]])
-                seats_rec = [
-                    {"name": spec.name, "uuid": f"seat-{i}-engine", "stack": stacks[i]}
-                    for i, (spec, _) in enumerate(self._players)
-                ]
-                recorder._record_round_start(hand_num, hero_hole, seats_rec)
-
-            action_histories: dict[str, list] = {s: [] for s in ("preflop", "flop", "turn", "river")}
-            current_street = 0
-
-            while state.status:
-                actor = state.actor_index
-                if actor is None:
-                    if state.can_burn_card():
-                        state.burn_card(remaining[rem_idx]); rem_idx += 1
-                    elif state.can_deal_board():
-                        next_street = current_street + 1
-                        n_cards = _BOARD_CARDS_PER_STREET.get(next_street, 0)
-                        for _ in range(n_cards):
-                            state.deal_board(remaining[rem_idx]); rem_idx += 1
-                        current_street = next_street
-                    continue
-
-                seat_i = pk_to_seat[actor]
-                spec, player = self._players[seat_i]
-                uuid_ = f"seat-{seat_i}-engine"
-
-                community = pk_adapter.cards_to_strs(c for g in state.board_cards for c in g)
-                hole_strs = pk_adapter.cards_to_strs(state.hole_cards[actor])
-                round_state_dict = {
-                    "street": _STREET_NAMES.get(current_street, "preflop"),
-                    "community_card": community,
-                    "pot": {"main": {"amount": state.total_pot_amount}, "side": []},
-                }
-
-                if spec.is_bot:
-                    valid_actions = [
-                        {"action": "fold", "amount": 0},
-                        {"action": "call", "amount": state.checking_or_calling_amount},
-                        {"action": "raise", "amount": {
-                            "min": state.min_completion_betting_or_raising_to_amount if state.can_complete_bet_or_raise_to() else -1,
-                            "max": state.max_completion_betting_or_raising_to_amount if state.can_complete_bet_or_raise_to() else -1,
-                        }},
-                    ]
-                    action_name, amount = player.declare_action(valid_actions, hole_strs, round_state_dict)
-                else:
-                    # Console player — pass PyPE-style dicts
-                    valid_actions = [
-                        {"action": "fold", "amount": 0},
-                        {"action": "call", "amount": state.checking_or_calling_amount},
-                        {"action": "raise", "amount": {
-                            "min": state.min_completion_betting_or_raising_to_amount if state.can_complete_bet_or_raise_to() else -1,
-                            "max": state.max_completion_betting_or_raising_to_amount if state.can_complete_bet_or_raise_to() else -1,
-                        }},
-                    ]
-                    action_name, amount = player.declare_action(valid_actions, hole_strs, round_state_dict)
-
-                street_key = _STREET_NAMES.get(current_street, "preflop")
-                if action_name == "fold":
-                    state.fold()
-                    action_histories[street_key].append({"uuid": uuid_, "action": "FOLD", "amount": 0})
-                elif action_name in ("call", "check"):
-                    call_amt = state.checking_or_calling_amount
-                    state.check_or_call()
-                    action_histories[street_key].append({"uuid": uuid_, "action": "CALL", "amount": call_amt})
-                else:
-                    if state.can_complete_bet_or_raise_to():
-                        lo = state.min_completion_betting_or_raising_to_amount
-                        hi = state.max_completion_betting_or_raising_to_amount
-                        clamped = max(lo, min(int(amount), hi))
-                        state.complete_bet_or_raise_to(clamped)
-                        action_histories[street_key].append({"uuid": uuid_, "action": "RAISE", "amount": clamped})
-                    else:
-                        call_amt = state.checking_or_calling_amount
-                        state.check_or_call()
-                        action_histories[street_key].append({"uuid": uuid_, "action": "CALL", "amount": call_amt})
-
-            # Hand finished: update stacks
-            for pk_i, new_stack in enumerate(state.stacks):
-                stacks[pk_to_seat[pk_i]] = new_stack
-
-            if recorder:
-                community = pk_adapter.cards_to_strs(c for g in state.board_cards for c in g)
-                hole_by_pk = {
-                    pk_i: pk_adapter.cards_to_strs(cards)
-                    for pk_i, cards in enumerate(state.hole_cards) if cards
-                }
-                winner_uuids = [
-                    f"seat-{pk_to_seat[pk_i]}-engine"
-                    for pk_i, p in enumerate(state.payoffs or []) if p > 0
-                ]
-                hand_info = [
-                    {"uuid": f"seat-{pk_to_seat[pk_i]}-engine", "hole_card": hole}
-                    for pk_i, hole in hole_by_pk.items()
-                ]
-                rs = {
-                    "street": _STREET_NAMES.get(current_street, "preflop"),
-                    "community_card": community,
-                    "pot": {"main": {"amount": 0}, "side": []},
-                    "dealer_btn": (sb_pos - 1) % n,
-                    "small_blind_pos": sb_pos,
-                    "big_blind_pos": bb_pos,
-                    "seats": [
-                        {"uuid": f"seat-{i}-engine", "name": spec.name, "stack": stacks[i], "state": "participating"}
-                        for i, (spec, _) in enumerate(self._players)
-                    ],
-                    "action_histories": action_histories,
-                    "round_count": hand_num,
-                    "small_blind_amount": config.small_blind,
-                }
-                recorder._record_round_result(
-                    [{"uuid": u} for u in winner_uuids], hand_info, rs
-                )
+            stacks = list(self._play_hand(hand_num, stacks, recorder, self.replay).stacks)
 
             players_with_chips = sum(1 for s in stacks if s > 0)
             if players_with_chips <= 1:
@@ -275,4 +166,205 @@ class GameEngine:
                 )
                 game_id = game.id if game else None
 
-        return GameResult(players=final_players, game_id=game_id)
+        return GameResult(players=final_players, game_id=game_id, replay=self.replay)
+
+    def simulate(self, n_hands: int) -> Iterator[HandRecord]:
+        """Play ``n_hands`` hands headlessly, yielding one ``HandRecord`` each.
+
+        Every hand starts from ``buy_in`` for every seat, so nobody busts and
+        the per-hand deltas are independent samples of each style's win rate.
+        Nothing is recorded or written to the database, and no replay log is
+        kept: a simulated game is reproduced from its seed alone.
+        """
+        stacks = [self.config.buy_in] * len(self.config.seats)
+        for hand_num in range(1, n_hands + 1):
+            yield self._play_hand(hand_num, stacks)
+
+    def _create_state(self, starting_stacks: list[int]):
+        config = self.config
+        if self.state_machine == "native":
+            return HoldemState(
+                config.ante, (config.small_blind, config.big_blind), config.big_blind, starting_stacks,
+            )
+        return NoLimitTexasHoldem.create_state(
+            automations=_AUTOMATIONS,
+            ante_trimming_status=True,
+            raw_antes=config.ante,
+            raw_blinds_or_straddles=(config.small_blind, config.big_blind),
+            min_bet=config.big_blind,
+            raw_starting_stacks=starting_stacks,
+            player_count=len(starting_stacks),
+        )
+
+    def _play_hand(
+        self,
+        hand_num: int,
+        stacks: list[int],
+        recorder: PerspectiveRecorder | None = None,
+        replay: ReplayLog | None = None,
+    ) -> HandRecord:
+        """Deal and play one hand from ``stacks`` (per seat); return its outcome.
+
+        The hand is appended to ``recorder`` and ``replay`` when given.
+        """
+        config = self.config
+        n = len(config.seats)
+        stacks = list(stacks)
+        starting = list(stacks)
+        folded: set[int] = set()
+
+        sb_pos = (hand_num - 1) % n
+        bb_pos = (hand_num) % n
+
+        rotated = [stacks[(sb_pos + i) % n] for i in range(n)]
+        pk_to_seat = [(sb_pos + i) % n for i in range(n)]
+        seat_to_pk = [0] * n
+        for pk_i, seat_i in enumerate(pk_to_seat):
+            seat_to_pk[seat_i] = pk_i
+
+        state = self._create_state(rotated)
+        self.state = state
+        self.pk_to_seat = pk_to_seat
+        if replay is not None:
+            replay.start_hand()
+
+        # PokerKit pre-shuffles deck_cards with the global random module; put
+        # them in card-id order first so the deal depends only on our seed
+        # (and is the same for either state machine).
+        deck = sorted(state.deck_cards, key=pk_adapter.card_id)
+        self._rng.shuffle(deck)
+        card_idx = 0
+        for _ in range(2):
+            for i in range(n):
+                state.deal_hole(deck[card_idx])
+                card_idx += 1
+        remaining = deck[card_idx:]
+        rem_idx = 0
+
+        if recorder:
+            hero_hole = pk_adapter.cards_to_strs(state.hole_cards[seat_to_pk[self._hero_player_index]])
+            seats_rec = [
+                {"name": spec.name, "uuid": f"seat-{i}-engine", "stack": stacks[i]}
+                for i, (spec, _) in enumerate(self._players)
+            ]
+            recorder._record_round_start(hand_num, hero_hole, seats_rec)
+
+        action_histories: dict[str, list] = {s: [] for s in ("preflop", "flop", "turn", "river")}
+        current_street = 0
+
+        while state.status:
+            actor = state.actor_index
+            if actor is None:
+                if state.can_burn_card():
+                    state.burn_card(remaining[rem_idx]); rem_idx += 1
+                elif state.can_deal_board():
+                    next_street = current_street + 1
+                    n_cards = _BOARD_CARDS_PER_STREET.get(next_street, 0)
+                    for _ in range(n_cards):
+                        state.deal_board(remaining[rem_idx]); rem_idx += 1
+                    current_street = next_street
+                continue
+
+            seat_i = pk_to_seat[actor]
+            spec, player = self._players[seat_i]
+            uuid_ = f"seat-{seat_i}-engine"
+
+            community = pk_adapter.cards_to_strs(c for g in state.board_cards for c in g)
+            hole_strs = pk_adapter.cards_to_strs(state.hole_cards[actor])
+            round_state_dict = {
+                "street": _STREET_NAMES.get(current_street, "preflop"),
+                "community_card": community,
+                "pot": {"main": {"amount": state.total_pot_amount}, "side": []},
+            }
+
+            if spec.is_bot:
+                valid_actions = [
+                    {"action": "fold", "amount": 0},
+                    {"action": "call", "amount": state.checking_or_calling_amount},
+                    {"action": "raise", "amount": {
+                        "min": state.min_completion_betting_or_raising_to_amount if state.can_complete_bet_or_raise_to() else -1,
+                        "max": state.max_completion_betting_or_raising_to_amount if state.can_complete_bet_or_raise_to() else -1,
+                    }},
+                ]
+                action_name, amount = player.declare_action(valid_actions, hole_strs, round_state_dict)
+            else:
+                # Console player — pass PyPE-style dicts
+                valid_actions = [
+                    {"action": "fold", "amount": 0},
+                    {"action": "call", "amount": state.checking_or_calling_amount},
+                    {"action": "raise", "amount": {
+                        "min": state.min_completion_betting_or_raising_to_amount if state.can_complete_bet_or_raise_to() else -1,
+                        "max": state.max_completion_betting_or_raising_to_amount if state.can_complete_bet_or_raise_to() else -1,
+                    }},
+                ]
+                action_name, amount = player.declare_action(valid_actions, hole_strs, round_state_dict)
+
+            street_key = _STREET_NAMES.get(current_street, "preflop")
+            if action_name == "fold":
+                state.fold()
+                folded.add(seat_i)
+                entry = {"uuid": uuid_, "action": "FOLD", "amount": 0}
+            elif action_name in ("call", "check"):
+                call_amt = state.checking_or_calling_amount
+                state.check_or_call()
+                entry = {"uuid": uuid_, "action": "CALL", "amount": call_amt}
+            else:
+                if state.can_complete_bet_or_raise_to():
+                    lo = state.min_completion_betting_or_raising_to_amount
+                    hi = state.max_completion_betting_or_raising_to_amount
+                    clamped = max(lo, min(int(amount), hi))
+                    state.complete_bet_or_raise_to(clamped)
+                    entry = {"uuid": uuid_, "action": "RAISE", "amount": clamped}
+                else:
+                    call_amt = state.checking_or_calling_amount
+                    state.check_or_call()
+                    entry = {"uuid": uuid_, "action": "CALL", "amount": call_amt}
+            action_histories[street_key].append(entry)
+            if replay is not None:
+                replay.record(entry["action"], entry["amount"])
+
+        # Hand finished: update stacks
+        for pk_i, new_stack in enumerate(state.stacks):
+            stacks[pk_to_seat[pk_i]] = new_stack
+
+        if recorder:
+            community = pk_adapter.cards_to_strs(c for g in state.board_cards for c in g)
+            hole_by_pk = {
+                pk_i: pk_adapter.cards_to_strs(cards)
+                for pk_i, cards in enumerate(state.hole_cards) if cards
+            }
+            winner_uuids = [
+                f"seat-{pk_to_seat[pk_i]}-engine"
+                for pk_i, p in enumerate(state.payoffs or []) if p > 0
+            ]
+            hand_info = [
+                {"uuid": f"seat-{pk_to_seat[pk_i]}-engine", "hole_card": hole}
+                for pk_i, hole in hole_by_pk.items()
+            ]
+            rs = {
+                "street": _STREET_NAMES.get(current_street, "preflop"),
+                "community_card": community,
+                "pot": {"main": {"amount": 0}, "side": []},
+                "dealer_btn": (sb_pos - 1) % n,
+                "small_blind_pos": sb_pos,
+                "big_blind_pos": bb_pos,
+                "seats": [
+                    {"uuid": f"seat-{i}-engine", "name": spec.name, "stack": stacks[i], "state": "participating"}
+                    for i, (spec, _) in enumerate(self._players)
+                ],
+                "action_histories": action_histories,
+                "round_count": hand_num,
+                "small_blind_amount": config.small_blind,
+            }
+            recorder._record_round_result(
+                [{"uuid": u} for u in winner_uuids], hand_info, rs
+            )
+
+        return HandRecord(
+            hand=hand_num,
+            stacks=tuple(stacks),
+            deltas=tuple(after - before for after, before in zip(stacks, starting)),
+            winners=tuple(pk_to_seat[pk_i] for pk_i, p in enumerate(state.payoffs or []) if p > 0),
+            showdown=tuple(i for i in range(n) if i not in folded) if n - len(folded) > 1 else (),
+            street=current_street,
+        )
@@ -0,0 +1,149 @@
+"""Process-pool equity service shared by every game in the process.
+
+Equity estimation is CPU-bound, and the web app runs each bot step in a
+thread, so under the GIL all live tables would contend for one core. When
+a pool is running (the FastAPI app starts one for its lifetime) equity
+requests are shipped to worker processes instead; the calling thread just
+waits on the result with the GIL released. Without a pool (scripts, tests,
+the arq worker) everything falls back to in-process ``pk_adapter`` calls,
+so callers never need to know which mode they are in.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import random
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+
+from poker_engine import pk_adapter
+from poker_engine.pk_adapter import EquityEstimate
+
+log = logging.getLogger(__name__)
+
+# Worker processes for the shared pool; 0 disables it (in-process equity).
+EQUITY_POOL_WORKERS = int(os.environ.get("POKER_EQUITY_WORKERS", str(os.cpu_count() or 1)))
+
+
+@dataclass(frozen=True)
+class EquityRequest:
+    """One equity query, picklable so it can cross the process boundary."""
+
+    hole: tuple[str, ...]
+    board: tuple[str, ...]
+    n_active_players: int
+    n_sim: int = 200
+    seed: int | None = None  # NumPy generator seed for a sampled spot
+    threshold: float | None = None
+
+
+def _run_request(request: EquityRequest) -> EquityEstimate:
+    """Worker-side entry point: answer one request with the local evaluator."""
+    return pk_adapter.equity_estimate(
+        list(request.hole),
+        list(request.board),
+        request.n_active_players,
+        n_sim=request.n_sim,
+        threshold=request.threshold,
+        seed=request.seed,
+    )
+
+
+def _init_worker() -> None:
+    # Map the lookup tables once per worker rather than on the first request.
+    pk_adapter._rank_table()
+    pk_adapter._preflop_table()
+
+
+class EquityPool:
+    """A ``ProcessPoolExecutor`` of equity workers."""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        # spawn, not fork: the web process has threads (and an event loop)
+        # that must not be duplicated into the workers.
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+
+    def submit(self, request: EquityRequest) -> Future:
+        """Queue one request; the future resolves to an ``EquityEstimate``."""
+        return self._executor.submit(_run_request, request)
+
+    def estimate(self, request: EquityRequest) -> EquityEstimate:
+        return self.submit(request).result()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pool: EquityPool | None = None
+
+
+def start_pool(max_workers: int | None = None) -> EquityPool | None:
+    """Start the process-wide pool (idempotent). ``0`` workers leaves it off."""
+    global _pool
+    if _pool is None:
+        workers = EQUITY_POOL_WORKERS if max_workers is None else max_workers
+        if workers > 0:
+            _pool = EquityPool(workers)
+            log.info("equity pool started with %d workers", workers)
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        pool.shutdown()
+
+
+def get_pool() -> EquityPool | None:
+    return _pool
+
+
+def estimate(
+    hole: list[str],
+    board: list[str],
+    n_active_players: int,
+    n_sim: int = 200,
+    rng: random.Random | None = None,
+    threshold: float | None = None,
+) -> EquityEstimate:
+    """``pk_adapter.equity_estimate`` on the shared pool if running, else in-process.
+
+    Table lookups are answered locally either way; they cost less than the
+    round trip to a worker. ``rng`` is drawn from exactly as in-process (once,
+    and only for a sampled spot) and the draw is the worker's generator seed,
+    so a seeded bot makes the same decisions with or without the pool.
+    This process's ``EQUITY_CACHE`` is checked before a request is shipped
+    and filled with the worker's answer, so pooled bots share cache hits
+    with in-process ones.
+    """
+    pool = _pool
+    if pool is None:
+        return pk_adapter.equity_estimate(
+            hole, board, n_active_players, n_sim=n_sim, rng=rng, threshold=threshold,
+        )
+    if not board:
+        equity = pk_adapter.preflop_equity(hole, n_active_players)
+        if equity is not None:
+            return EquityEstimate(equity, 0, 0.0, "preflop_table")
+    exact = pk_adapter.uses_exact_equity(board, n_active_players)
+    seed = None
+    if not exact:
+        seed = (rng or random.Random()).getrandbits(64)
+    cache = pk_adapter.EQUITY_CACHE
+    key = pk_adapter.equity_cache_key(hole, board, n_active_players, n_sim, exact)
+    cached = pk_adapter.cached_equity(cache, key, n_sim, threshold)
+    if cached is not None:
+        return cached
+    estimate = pool.estimate(EquityRequest(
+        tuple(hole), tuple(board), n_active_players, n_sim=n_sim, seed=seed, threshold=threshold,
+    ))
+    cache.put(key, estimate)
+    return estimate
@@ -0,0 +1,213 @@
+"""Columnar analytics export of recorded games (Parquet or Arrow IPC).
+
+Streams ``games``, ``game_players``, ``hands``, ``hand_players`` and
+``actions`` out of Postgres in chunks of ``chunk_games`` games and writes
+each chunk as one part file per table::
+
+    <out>/games/part-00000.parquet
+    <out>/hands/part-00000.parquet
+    ...
+
+Part ``N`` of every table covers the same games, so a part can be analysed
+on its own and memory stays bounded by the chunk size on both the export and
+the read side. UUIDs are written as strings and enums as their values.
+``population_stats`` runs the vectorized counters (``columnar_stats``) over
+an export, part by part, and returns every hero's lifetime ``RawStatCounts``.
+
+Needs the ``analytics`` extra (pyarrow).
+"""
+
+from __future__ import annotations
+
+import enum
+import os
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from sqlalchemy import select
+
+from poker_engine.columnar_stats import hand_stat_matrix, sum_by
+from poker_engine.db.models import Action, Game, GamePlayer, Hand, HandPlayer
+from poker_engine.stats import RawStatCounts
+
+EXPORT_CHUNK_GAMES = int(os.environ.get("POKER_EXPORT_CHUNK_GAMES", "500"))
+
+FORMATS = ("parquet", "arrow")
+
+_TS = pa.timestamp("us", tz="UTC")
+
+# table -> (model, [(column, arrow type)]); the model's foreign key to the
+# chunk (game id or hand id) is how rows are selected.
+_TABLES = {
+    "games": (Game, [
+        ("id", pa.string()),
+        ("hero_user_id", pa.string()),
+        ("small_blind", pa.int64()),
+        ("big_blind", pa.int64()),
+        ("ante", pa.int64()),
+        ("buy_in", pa.int64()),
+        ("max_round", pa.int64()),
+        ("started_at", _TS),
+        ("ended_at", _TS),
+        ("created_at", _TS),
+    ]),
+    "game_players": (GamePlayer, [
+        ("id", pa.string()),
+        ("game_id", pa.string()),
+        ("seat_index", pa.int32()),
+        ("user_id", pa.string()),
+        ("is_bot", pa.bool_()),
+        ("bot_style", pa.string()),
+        ("starting_stack", pa.int64()),
+        ("final_stack", pa.int64()),
+    ]),
+    "hands": (Hand, [
+        ("id", pa.string()),
+        ("game_id", pa.string()),
+        ("round_count", pa.int32()),
+        ("button_pos", pa.int32()),
+        ("street_reached", pa.string()),
+        ("board", pa.list_(pa.string())),
+        ("pot_total", pa.int64()),
+        ("had_showdown", pa.bool_()),
+    ]),
+    "hand_players": (HandPlayer, [
+        ("hand_id", pa.string()),
+        ("game_player_id", pa.string()),
+        ("position", pa.string()),
+        ("hole_cards", pa.list_(pa.string())),
+        ("revealed", pa.bool_()),
+        ("is_winner", pa.bool_()),
+        ("amount_won", pa.int64()),
+        ("starting_stack", pa.int64()),
+        ("final_stack", pa.int64()),
+    ]),
+    "actions": (Action, [
+        ("hand_id", pa.string()),
+        ("game_player_id", pa.string()),
+        ("street", pa.string()),
+        ("action", pa.string()),
+        ("amount", pa.int64()),
+        ("seq", pa.int32()),
+        ("pot_after", pa.int64()),
+        ("stack_after", pa.int64()),
+    ]),
+}
+
+
+def _plain(value):
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _chunk_query(name: str, game_ids: list):
+    model, columns = _TABLES[name]
+    stmt = select(*(getattr(model, c) for c, _ in columns))
+    if model is Game:
+        return stmt.where(Game.id.in_(game_ids)).order_by(Game.id)
+    if model is GamePlayer:
+        return stmt.where(GamePlayer.game_id.in_(game_ids)).order_by(GamePlayer.game_id, GamePlayer.seat_index)
+    if model is Hand:
+        return stmt.where(Hand.game_id.in_(game_ids)).order_by(Hand.game_id, Hand.round_count)
+    hand_ids = select(Hand.id).where(Hand.game_id.in_(game_ids))
+    return stmt.where(model.hand_id.in_(hand_ids)).order_by(model.hand_id)
+
+
+def _to_table(name: str, rows) -> pa.Table:
+    _, columns = _TABLES[name]
+    data = list(zip(*rows)) if rows else [()] * len(columns)
+    return pa.table(
+        {c: pa.array([_plain(v) for v in values], type=t) for (c, t), values in zip(columns, data)},
+        schema=pa.schema(columns),
+    )
+
+
+def _write(table: pa.Table, path: Path, fmt: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    if fmt == "parquet":
+        pq.write_table(table, tmp)
+    else:
+        feather.write_feather(table, tmp, compression="zstd")
+    os.replace(tmp, path)
+
+
+def export_dataset(
+    db,
+    out_dir,
+    *,
+    fmt: str = "parquet",
+    chunk_games: int = EXPORT_CHUNK_GAMES,
+    include_live: bool = False,
+) -> dict[str, int]:
+    """Write every (finished, unless ``include_live``) game to ``out_dir``.
+
+    Games are paged by id (keyset), ``chunk_games`` at a time; returns the
+    row count written per table.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown export format {fmt!r}; expected one of {list(FORMATS)}")
+    out = Path(out_dir)
+    counts = dict.fromkeys(_TABLES, 0)
+    last_id, part = None, 0
+    while True:
+        page = select(Game.id).order_by(Game.id).limit(chunk_games)
+        if not include_live:
+            page = page.where(Game.ended_at.is_not(None))
+        if last_id is not None:
+            page = page.where(Game.id > last_id)
+        game_ids = db.scalars(page).all()
+        if not game_ids:
+            return counts
+        last_id = game_ids[-1]
+        for name in _TABLES:
+            rows = db.execute(_chunk_query(name, game_ids)).all()
+            _write(_to_table(name, rows), out / name / f"part-{part:05d}.{fmt}", fmt)
+            counts[name] += len(rows)
+        part += 1
+
+
+def _parts(out_dir: Path) -> list[str]:
+    return sorted(p.name for p in (out_dir / "games").glob("part-*.*") if p.suffix in (".parquet", ".arrow"))
+
+
+def read_part(out_dir, name: str, part: str) -> dict[str, np.ndarray]:
+    """One part file of table ``name`` as column name -> numpy array."""
+    path = Path(out_dir) / name / part
+    table = pq.read_table(path) if path.suffix == ".parquet" else feather.read_table(path)
+    return {c: table.column(c).to_numpy(zero_copy_only=False) for c in table.column_names}
+
+
+def population_stats(out_dir) -> dict[str, RawStatCounts]:
+    """Every human hero's ``RawStatCounts`` across an export, keyed by user id."""
+    out_dir = Path(out_dir)
+    totals: dict[str, RawStatCounts] = {}
+    for part in _parts(out_dir):
+        seats = read_part(out_dir, "game_players", part)
+        hands = read_part(out_dir, "hands", part)
+        hand_players = read_part(out_dir, "hand_players", part)
+        actions = read_part(out_dir, "actions", part)
+
+        human = ~seats["is_bot"].astype(bool) & ~np.equal(seats["user_id"], None)
+        hero_ids, hero_users = seats["id"][human].astype(str), seats["user_id"][human].astype(str)
+        order = np.argsort(hero_ids)
+        seat_ids = hand_players["game_player_id"].astype(str)
+        pos = np.minimum(np.searchsorted(hero_ids[order], seat_ids), max(len(hero_ids) - 1, 0))
+        is_hero = (hero_ids[order][pos] == seat_ids) if len(hero_ids) else np.zeros(len(seat_ids), bool)
+        if not is_hero.any():
+            continue
+
+        rows = {c: v[is_hero] for c, v in hand_players.items()}
+        matrix = hand_stat_matrix(hands, rows, actions)
+        users = hero_users[order][pos[is_hero]]
+        for user_id, counts in sum_by(users, matrix, rows["position"]).items():
+            totals.setdefault(user_id, RawStatCounts())
+            totals[user_id] += counts
+    return totals
@@ -0,0 +1,429 @@
+"""Slim no-limit hold'em state machine for bot-only play.
+
+``HoldemState`` is a drop-in for the part of PokerKit's ``State`` that
+``GameEngine`` drives, as created by ``NoLimitTexasHoldem.create_state``
+with the engine's automations: antes, blinds, bet collection, showdown,
+hand killing and chip pushing/pulling happen automatically; hole dealing,
+card burning, board dealing and player actions are driven by the caller.
+It applies the same legality rules to fold / check-call /
+complete-bet-or-raise-to, builds the same main and side pots and pays the
+same amounts (odd chips to the lowest player index). Cards are card ids
+(0-51, see ``pk_adapter``) rather than PokerKit ``Card`` objects.
+
+PokerKit's general-purpose state dominates per-hand cost in bot-only play;
+this one keeps only what hold'em needs. It is cross-checked against
+PokerKit action by action in tests/poker_engine/test_holdem.py.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Iterator, NamedTuple
+
+from poker_engine import pk_adapter
+
+_FLOP, _RIVER = 1, 3
+
+
+class Pot(NamedTuple):
+    """Mirrors ``pokerkit.Pot``; there is no rake, so ``raked_amount`` is 0."""
+
+    raked_amount: int
+    unraked_amount: int
+    player_indices: tuple[int, ...]
+
+    @property
+    def amount(self) -> int:
+        return self.raked_amount + self.unraked_amount
+
+
+class HoldemState:
+    """One hand of no-limit hold'em; players are indexed as in PokerKit.
+
+    With more than two players index 0 posts the small blind and index 1 the
+    big blind; heads-up the blinds are reversed (index 1 is the small blind
+    and acts first preflop), as in PokerKit.
+    """
+
+    __slots__ = (
+        "player_count", "min_bet", "starting_stacks", "stacks", "bets", "payoffs",
+        "statuses", "hole_cards", "board_cards", "deck_cards", "burn_cards",
+        "status", "street_index", "_blinds", "_actors", "_acted",
+        "_short_all_ins", "_raise_amount", "_holes_pending",
+        "_burn_pending", "_board_pending", "_final_pots",
+    )
+
+    def __init__(
+        self,
+        ante: int,
+        blinds: tuple[int, int],
+        min_bet: int,
+        starting_stacks: Iterable[int],
+    ):
+        stacks = list(starting_stacks)
+        n = len(stacks)
+        if n < 2:
+            raise ValueError("At least two players are needed.")
+        if min(stacks) <= 0:
+            raise ValueError("Non-positive starting stacks was supplied.")
+
+        self.player_count = n
+        self.min_bet = min_bet
+        self.starting_stacks = tuple(stacks)
+        self.stacks = stacks
+        self.bets = [0] * n
+        self.payoffs = [0] * n
+        self.statuses = [True] * n
+        self.hole_cards: list[list[int]] = [[] for _ in range(n)]
+        self.board_cards: list[list[int]] = []
+        self.deck_cards = list(range(52))
+        self.burn_cards: list[int] = []
+        self.status = True
+        self.street_index: int | None = None
+        self._actors: deque[int] = deque()
+        self._acted: set[int] = set()
+        self._short_all_ins: list[int] = []
+        self._raise_amount = 0
+        self._burn_pending = False
+        self._board_pending = 0
+        self._final_pots: list[Pot] | None = None
+
+        small, big = blinds
+        self._blinds = [0] * n
+        self._blinds[0], self._blinds[1] = (big, small) if n == 2 else (small, big)
+
+        antes = [min(ante, stack) for stack in self.starting_stacks]
+        for i, amount in enumerate(antes):
+            if amount > 0:
+                self._put(i, amount)
+        self._collect_bets()
+        for i, blind in enumerate(self._blinds):
+            amount = min(blind, self.starting_stacks[i] - antes[i])
+            if amount > 0:
+                self._put(i, amount)
+
+        self.street_index = 0
+        self._holes_pending = 2 * n
+
+    # -- chips ----------------------------------------------------------------
+
+    def _put(self, i: int, amount: int) -> None:
+        self.bets[i] += amount
+        self.stacks[i] -= amount
+        self.payoffs[i] -= amount
+
+    def _collect_bets(self) -> None:
+        """Sweep bets into the pot, returning any uncalled excess."""
+        bets = self.bets
+        if not any(bets):
+            return
+        indices = list(range(self.player_count))
+        if sum(self.statuses) == 1:
+            # The last player standing keeps their bet; it is pushed back.
+            indices.remove(self.statuses.index(True))
+        cutoff = sorted(bets)[-2]
+        for i in indices:
+            if bets[i] > cutoff:
+                overbet = bets[i] - cutoff
+                self.stacks[i] += overbet
+                self.payoffs[i] += overbet
+                bets[i] = cutoff
+        for i in indices:
+            bets[i] = 0
+
+    @property
+    def pots(self) -> Iterator[Pot]:
+        """Main pot then side pots, from the chips collected so far."""
+        if self._final_pots is not None:
+            yield from self._final_pots
+            return
+        if sum(self.payoffs) == -sum(self.bets):
+            return
+        n = self.player_count
+        pending = [-p for p in self.payoffs]
+        contributions = [pending[i] - self.bets[i] for i in range(n)]
+        pots: list[Pot] = []
+        previous = 0
+        for level in sorted(set(contributions)):
+            amount = sum(level - previous for c in contributions if c >= level)
+            eligible = tuple(i for i in range(n) if pending[i] >= level and self.statuses[i])
+            while pots and pots[-1].player_indices == eligible:
+                amount += pots.pop().amount
+            if amount:
+                pots.append(Pot(0, amount, eligible))
+            previous = level
+        yield from pots
+
+    @property
+    def total_pot_amount(self) -> int:
+        """Chips in the pots plus outstanding bets."""
+        return sum(self.bets) + sum(pot.amount for pot in self.pots)
+
+    # -- dealing --------------------------------------------------------------
+
+    def _consume(self, card: int) -> None:
+        if card in self.deck_cards:
+            self.deck_cards.remove(card)
+
+    def can_deal_hole(self) -> bool:
+        return self._holes_pending > 0
+
+    def deal_hole(self, card: int) -> None:
+        """Deal one hole card; players are dealt round-robin from index 0."""
+        if not self._holes_pending:
+            raise ValueError("Currently, nobody can be dealt hole cards.")
+        n = self.player_count
+        player = (2 * n - self._holes_pending) % n
+        self._consume(card)
+        self.hole_cards[player].append(card)
+        self._holes_pending -= 1
+        if not self._holes_pending:
+            self._begin_betting()
+
+    def _begin_dealing(self) -> None:
+        self.street_index += 1
+        self._burn_pending = True
+        self._board_pending = 3 if self.street_index == _FLOP else 1
+
+    def can_burn_card(self) -> bool:
+        return self._burn_pending
+
+    def burn_card(self, card: int) -> None:
+        if not self._burn_pending:
+            raise ValueError("No card burning is pending.")
+        self._consume(card)
+        self.burn_cards.append(card)
+        self._burn_pending = False
+
+    def can_deal_board(self) -> bool:
+        return not self._burn_pending and self._board_pending > 0
+
+    def deal_board(self, cards: int | Iterable[int]) -> None:
+        """Deal one or more board cards (card ids) for the current street."""
+        if self._burn_pending:
+            raise ValueError("A card must be burnt before board dealing.")
+        cards = [cards] if isinstance(cards, int) else list(cards)
+        if not 0 < len(cards) <= self._board_pending:
+            raise ValueError(
+                f"The number of dealt cards must be non-zero and less than or equal to "
+                f"{self._board_pending}, not {len(cards)}."
+            )
+        for card in cards:
+            self._consume(card)
+            self.board_cards.append([card])
+        self._board_pending -= len(cards)
+        if not self._board_pending:
+            self._begin_betting()
+
+    # -- betting --------------------------------------------------------------
+
+    @property
+    def actor_index(self) -> int | None:
+        return self._actors[0] if self._actors else None
+
+    def _effective_stack(self, i: int) -> int:
+        """What player ``i`` can still lose to the active players."""
+        if not self.statuses[i]:
+            return 0
+        totals = sorted(self.bets[j] + self.stacks[j] for j in range(self.player_count) if self.statuses[j])
+        return min(self.stacks[i], max(0, totals[-2] - self.bets[i]))
+
+    def _begin_betting(self) -> None:
+        n = self.player_count
+        bets = self.bets
+        if self.street_index == 0:
+            # Action opens left of the largest blind actually posted.
+            opener = (max(range(n), key=lambda i: (bets[i] if self._blinds[i] else 0, i)) + 1) % n
+        else:
+            opener = 0
+        self._actors = deque(
+            i for i in (*range(opener, n), *range(opener))
+            if self.statuses[i] and self.stacks[i] and self._effective_stack(i)
+        )
+        self._raise_amount = 0
+        self._acted.clear()
+        self._short_all_ins.clear()
+        actors = self._actors
+        self._update_betting(len(actors) == 1 and bets[actors[0]] >= max(bets))
+
+    def _update_betting(self, done: bool = False) -> None:
+        if done or not self._actors or sum(self.statuses) <= 1:
+            self._end_betting()
+
+    def _end_betting(self) -> None:
+        self._actors.clear()
+        self._collect_bets()
+        if sum(self.statuses) == 1:
+            self._finish()
+        elif self.street_index == _RIVER:
+            self._kill_hands()
+            self._finish()
+        else:
+            # Once all-in, later streets find nobody to act and run out.
+            self._begin_dealing()
+
+    def _pop_actor(self) -> int:
+        if not self._actors:
+            raise ValueError("There is no player to act.")
+        actor = self._actors.popleft()
+        self._acted.add(actor)
+        return actor
+
+    def fold(self) -> None:
+        if not self._actors:
+            raise ValueError("There is no player to act.")
+        if self.bets[self._actors[0]] >= max(self.bets):
+            raise ValueError("There is no reason for this player to fold.")
+        actor = self._pop_actor()
+        self.statuses[actor] = False
+        self.hole_cards[actor].clear()
+        self._update_betting()
+
+    @property
+    def checking_or_calling_amount(self) -> int | None:
+        if not self._actors:
+            return None
+        actor = self._actors[0]
+        return min(self.stacks[actor], max(self.bets) - self.bets[actor])
+
+    def check_or_call(self) -> None:
+        amount = self.checking_or_calling_amount
+        actor = self._pop_actor()
+        self._put(actor, amount)
+        self._update_betting()
+
+    def _verify_raise(self) -> int:
+        if not self._actors:
+            raise ValueError("There is no player to act.")
+        actor = self._actors[0]
+        bets = self.bets
+        top = max(bets)
+        if min(self.stacks[actor], top - bets[actor]) < self._raise_amount:
+            raise ValueError("Short all-in cannot be raised.")
+        if (
+            self._short_all_ins
+            and sum(self._short_all_ins) < self._raise_amount
+            and actor in self._acted
+        ):
+            raise ValueError(
+                "The player already acted and hence cannot raise in face of a non-full all-in wager"
+            )
+        if self.stacks[actor] <= top - bets[actor]:
+            raise ValueError("The player is already covered by a previous bet/raise.")
+        if not any(
+            i != actor and self.statuses[i] and self.stacks[i] + bets[i] > top
+            for i in range(self.player_count)
+        ):
+            raise ValueError(
+                "There is no reason to complete, bet, or raise since every other "
+                "player has either folded or gone all-in."
+            )
+        return actor
+
+    @property
+    def min_completion_betting_or_raising_to_amount(self) -> int | None:
+        try:
+            actor = self._verify_raise()
+        except ValueError:
+            return None
+        amount = max(self._raise_amount, self.min_bet) + max(self.bets)
+        return min(self.stacks[actor] + self.bets[actor], amount)
+
+    @property
+    def max_completion_betting_or_raising_to_amount(self) -> int | None:
+        try:
+            actor = self._verify_raise()
+        except ValueError:
+            return None
+        return self.stacks[actor] + self.bets[actor]
+
+    def _verify_raise_to(self, amount: int | None) -> int:
+        self._verify_raise()
+        lo = self.min_completion_betting_or_raising_to_amount
+        hi = self.max_completion_betting_or_raising_to_amount
+        if amount is None:
+            return lo
+        if amount < lo:
+            raise ValueError(f"The amount {amount} is below the minimum allowed {lo}.")
+        if amount > hi:
+            raise ValueError(f"The amount {amount} is above the maximum allowed {hi}.")
+        return amount
+
+    def can_complete_bet_or_raise_to(self, amount: int | None = None) -> bool:
+        try:
+            self._verify_raise_to(amount)
+        except ValueError:
+            return False
+        return True
+
+    def complete_bet_or_raise_to(self, amount: int | None = None) -> None:
+        amount = self._verify_raise_to(amount)
+        actor = self._pop_actor()
+        raise_size = amount - max(self.bets)
+        self._put(actor, amount - self.bets[actor])
+
+        n = self.player_count
+        self._actors = deque(
+            i for i in (*range(actor + 1, n), *range(actor))
+            if self.statuses[i] and self.stacks[i]
+        )
+        if raise_size >= self._raise_amount:
+            # A full raise reopens the action to everyone.
+            self._acted = {actor}
+        self._raise_amount = max(self._raise_amount, raise_size)
+        if self.stacks[actor]:
+            self._short_all_ins.clear()
+        else:
+            self._short_all_ins.append(raise_size)
+        if sum(self._short_all_ins) >= self._raise_amount:
+            self._short_all_ins.clear()
+        self._update_betting()
+
+    # -- showdown -------------------------------------------------------------
+
+    def _kill_hands(self) -> None:
+        """Muck every hand that cannot win a share of any pot it is in."""
+        board = [c for cards in self.board_cards for c in cards]
+        strength = {
+            i: pk_adapter._strength(self.hole_cards[i] + board)
+            for i in range(self.player_count) if self.statuses[i]
+        }
+        keep: set[int] = set()
+        for pot in self.pots:
+            if not pot.player_indices:
+                continue
+            best = max(strength[i] for i in pot.player_indices)
+            keep.update(i for i in pot.player_indices if strength[i] == best)
+        for i in strength:
+            if i not in keep:
+                self.statuses[i] = False
+                self.hole_cards[i].clear()
+
+    def _finish(self) -> None:
+        """Push every pot to its winners, pull chips into stacks, end the hand."""
+        pots = list(self.pots)
+        self.street_index = None
+        if sum(self.statuses) == 1:
+            for pot in pots:
+                self.bets[pot.player_indices[0]] += pot.amount
+        else:
+            board = [c for cards in self.board_cards for c in cards]
+            strength = {
+                i: pk_adapter._strength(self.hole_cards[i] + board)
+                for i in range(self.player_count) if self.statuses[i]
+            }
+            for pot in pots:
+                if not pot.player_indices:
+                    continue  # everyone eligible folded: the chips are burned
+                best = max(strength[i] for i in pot.player_indices)
+                winners = [i for i in pot.player_indices if strength[i] == best]
+                share, odd = divmod(pot.amount, len(winners))
+                for i in winners:
+                    self.bets[i] += share
+                self.bets[winners[0]] += odd
+        self._final_pots = [pot._replace(unraked_amount=0) for pot in pots]
+        for i, amount in enumerate(self.bets):
+            self.stacks[i] += amount
+            self.payoffs[i] += amount
+            self.bets[i] = 0
+        self.status = False
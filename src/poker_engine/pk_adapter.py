@@ -12,22 +12,34 @@ and sent directly to the browser.
 
 from __future__ import annotations
 
+import functools
 import itertools
+import logging
+import math
+import os
 import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Generator
 
+import numpy as np
 from pokerkit.hands import StandardHighHand
 from pokerkit.lookups import Label
 from pokerkit.utilities import Card
 
+log = logging.getLogger(__name__)
+
 
 # ---------------------------------------------------------------------------
 # Card string helpers
 # ---------------------------------------------------------------------------
 
 def cards_to_strs(cards) -> list[str]:
-    """Convert an iterable of PokerKit Card objects to card strings."""
-    return [repr(c) for c in cards]
+    """Convert an iterable of PokerKit Card objects or card ids to card strings."""
+    return [CARD_STRS[c] if isinstance(c, (int, np.integer)) else repr(c) for c in cards]
 
 
 def parse_cards(card_strings: list[str]) -> list[Card]:
@@ -38,6 +50,55 @@ def parse_cards(card_strings: list[str]) -> list[Card]:
     return result
 
 
+# ---------------------------------------------------------------------------
+# Integer card encoding
+# ---------------------------------------------------------------------------
+# Inside the evaluator and equity code a card is an int 0-51:
+#
+#   card_id = (rank - 2) * 4 + suit      rank 2-14, suit c=0 d=1 h=2 s=3
+#
+# A set of cards is a 64-bit mask with bit ``suit * 16 + (rank - 2)`` set per
+# card, so ``(mask >> 16 * suit) & 0x1FFF`` is that suit's 13-bit rank plane.
+# Strings only appear at the API boundary (``card_ids`` / ``cards_to_strs``).
+
+CARD_STRS: tuple[str, ...] = tuple(r + s for r in "23456789TJQKA" for s in "cdhs")
+CARD_IDS: dict[str, int] = {c: i for i, c in enumerate(CARD_STRS)}
+_PLANE_MASK = (1 << 13) - 1
+
+
+def card_ids(card_strings) -> list[int]:
+    """Encode card strings as card ids (0-51)."""
+    return [CARD_IDS[c] for c in card_strings]
+
+
+def card_id(card) -> int:
+    """Card id of a card id or a PokerKit ``Card``."""
+    return card if isinstance(card, (int, np.integer)) else CARD_IDS[repr(card)]
+
+
+def card_bit(card: int) -> int:
+    """The single-bit hand mask of one card id."""
+    return 1 << ((card & 3) * 16 + (card >> 2))
+
+
+def hand_mask(cards) -> int:
+    """64-bit hand mask of an iterable of card ids."""
+    mask = 0
+    for c in cards:
+        mask |= 1 << ((c & 3) * 16 + (c >> 2))
+    return mask
+
+
+def suit_plane(mask: int, suit: int) -> int:
+    """13-bit rank plane (bit ``rank - 2``) of one suit in a hand mask."""
+    return (mask >> (16 * suit)) & _PLANE_MASK
+
+
+# Per-id lookup arrays for vectorized code.
+_ID_RANK_IDX = np.arange(52, dtype=np.int64) >> 2
+_ID_BIT = np.left_shift(1, (np.arange(52, dtype=np.int64) & 3) * 16 + _ID_RANK_IDX)
+
+
 # All 52 card strings in rank+suit format (internal).
 _RANKS = "A23456789TJQK"
 _SUITS = "cdhs"
@@ -161,11 +222,12 @@ def best_five(hole: list[str], community: list[str]) -> dict:
 
 
 # ---------------------------------------------------------------------------
-# Fast pure-Python hand evaluator for the MC hot path
+# Pure-Python reference hand evaluator
 # ---------------------------------------------------------------------------
 # Operates on card strings with minimal allocation. Each card is encoded as
-# two integers (rank 2-14, suit 0-3) to avoid repeated dict lookups inside
-# the hot loop.
+# two integers (rank 2-14, suit 0-3) to avoid repeated dict lookups. The tuple
+# scores from ``_rank5_int`` define hand ordering; the rank table below is
+# built to reproduce them exactly.
 
 _RANK_VAL: dict[str, int] = {
     "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7,
@@ -297,26 +359,17 @@ def _decode_cards(card_strs: list[str]) -> tuple[list[int], list[int]]:
     return ranks, suits
 
 
-def hand_strength_key(hole: list[str], community: list[str]):
-    """Comparable key for ranking/tie detection."""
-    all_cards = list(hole) + list(community)
-    n = len(all_cards)
-    if n < 5:
-        return (0,)
-    ranks, suits = _decode_cards(all_cards)
-    if n == 7:
+def _best5_tuple(ranks: list[int], suits: list[int]) -> tuple:
+    """Reference ``_rank5_int`` score of the best 5 of 5-7 pre-decoded cards.
+
+    Tries every 5-card subset; the rank table is built to order identically.
+    """
+    if len(ranks) == 7:
         return _best7_int(ranks, suits)
-    if n == 5:
-        ranks.sort(reverse=True)
-        flush = suits[0] == suits[1] == suits[2] == suits[3] == suits[4]
-        return _rank5_int(ranks, flush)
-    # n == 6
-    from itertools import combinations as _comb
     best = (-1,)
-    for idx in _comb(range(6), 5):
-        r5 = [ranks[i] for i in idx]
+    for idx in itertools.combinations(range(len(ranks)), 5):
+        r5 = sorted((ranks[i] for i in idx), reverse=True)
         s5 = [suits[i] for i in idx]
-        r5.sort(reverse=True)
         flush = s5[0] == s5[1] == s5[2] == s5[3] == s5[4]
         score = _rank5_int(r5, flush)
         if score > best:
@@ -324,6 +377,18 @@ def hand_strength_key(hole: list[str], community: list[str]):
     return best
 
 
+def hand_strength_key(hole: list[str], community: list[str]) -> int:
+    """Comparable integer strength for ranking/tie detection (higher wins).
+
+    One rank-table lookup for 5-7 cards; ``0`` (below every real hand) for
+    fewer than 5.
+    """
+    cards = card_ids(hole) + card_ids(community)
+    if len(cards) < 5:
+        return 0
+    return _strength(cards)
+
+
 def winners_from_cards(player_cards: dict[str, list[str]], community: list[str]) -> list[str]:
     """Given ``{key: hole_cards}`` and the board, return the winning key(s).
 
@@ -331,14 +396,599 @@ def winners_from_cards(player_cards: dict[str, list[str]], community: list[str])
     """
     if not player_cards:
         return []
-    scored = {k: hand_strength_key(h, community) for k, h in player_cards.items()}
+    board = card_ids(community)
+    scored = {}
+    for k, h in player_cards.items():
+        cards = card_ids(h) + board
+        scored[k] = _strength(cards) if len(cards) >= 5 else 0
     best = max(scored.values())
     return [k for k, s in scored.items() if s == best]
 
 
 # ---------------------------------------------------------------------------
-# Monte Carlo equity estimation
+# Vectorized (NumPy) batch evaluator
+# ---------------------------------------------------------------------------
+# Scores many hands at once with integer bit operations instead of trying 21
+# five-card subsets; used to fill the rank table. Each hand is reduced to its
+# 64-bit mask and split into four 13-bit suit planes; pairs/trips/quads fall out of AND/OR
+# combinations of the planes, and everything rank-order related is an
+# 8192-entry table lookup. A score is a single int that orders exactly like
+# the tuples from ``_rank5_int``: the category in bits 20+, then up to five
+# kickers (ranks 2-14) packed four bits each, most significant first.
+
+
+def _pack_score(score: tuple) -> int:
+    """Pack a ``_rank5_int`` tuple into the batch evaluator's int encoding."""
+    packed = score[0] << 20
+    for i, r in enumerate(score[1:]):
+        packed |= r << (16 - 4 * i)
+    return packed
+
+
+def _build_mask_tables() -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Per-13-bit-rank-mask tables: popcount, top-five packed, high bit, straight high."""
+    masks = np.arange(1 << 13)
+    bits = (masks[:, None] >> np.arange(12, -1, -1)) & 1  # column 0 = ace
+    popcount = bits.sum(axis=1)
+
+    cum = np.cumsum(bits, axis=1)
+    top5 = np.zeros(len(masks), dtype=np.int64)
+    for i in range(5):
+        hit = (bits == 1) & (cum == i + 1)
+        value = np.where(hit.any(axis=1), 14 - hit.argmax(axis=1), 0)
+        top5 |= value << (16 - 4 * i)
+    high = top5 >> 16
+    high_bit = np.where(high > 0, 1 << np.maximum(high - 2, 0), 0)
+
+    ext = np.concatenate([bits, bits[:, :1]], axis=1).astype(bool)  # ace plays low too
+    windows = ext[:, 0:10] & ext[:, 1:11] & ext[:, 2:12] & ext[:, 3:13] & ext[:, 4:14]
+    straight = np.where(windows.any(axis=1), 14 - windows.argmax(axis=1), 0)
+    return popcount, top5, high_bit, straight.astype(np.int64)
+
+
+_POPCOUNT13, _TOP5_PACKED, _HIGH_BIT13, _STRAIGHT_HIGH13 = _build_mask_tables()
+
+
+def _kick(mask: np.ndarray, slot: int, k: int) -> np.ndarray:
+    """The top ``k`` ranks of ``mask`` packed into kicker slots ``slot..slot+k-1``."""
+    low = 4 * (5 - slot - k)
+    return ((_TOP5_PACKED[mask] >> (4 * slot)) >> low) << low
+
+
+def _masks_batch(cards: np.ndarray) -> np.ndarray:
+    """64-bit hand masks for an ``(n, k)`` array of distinct card ids."""
+    return _ID_BIT[cards].sum(axis=1)
+
+
+def _planes_batch(masks: np.ndarray) -> tuple[np.ndarray, ...]:
+    """The four 13-bit suit planes of each hand mask."""
+    return tuple((masks >> (16 * s)) & _PLANE_MASK for s in range(4))
+
+
+def _score_batch(cards: np.ndarray) -> np.ndarray:
+    """Packed best-5 scores for a batch of 5-7 card hands.
+
+    ``cards`` is an ``(n, k)`` array of card ids. Returns an ``(n,)`` int64
+    array comparable with ``_pack_score`` output.
+    """
+    p0, p1, p2, p3 = _planes_batch(_masks_batch(cards))
+
+    present = p0 | p1 | p2 | p3
+    quads = p0 & p1 & p2 & p3
+    three_plus = (p0 & p1 & p2) | (p0 & p1 & p3) | (p0 & p2 & p3) | (p1 & p2 & p3)
+    two_plus = (p0 & p1) | (p0 & p2) | (p0 & p3) | (p1 & p2) | (p1 & p3) | (p2 & p3)
+    trips = three_plus & ~quads
+    pairs = two_plus & ~three_plus
+
+    flush_plane = np.zeros_like(present)
+    for plane in (p0, p1, p2, p3):
+        flush_plane = np.where(_POPCOUNT13[plane] >= 5, plane, flush_plane)
+
+    sf_high = _STRAIGHT_HIGH13[flush_plane]
+    st_high = _STRAIGHT_HIGH13[present]
+    quad_bit = _HIGH_BIT13[quads]
+    trip_bit = _HIGH_BIT13[trips]
+    fh_pair = two_plus & ~trip_bit
+    pair1_bit = _HIGH_BIT13[pairs]
+    pair2_bit = _HIGH_BIT13[pairs & ~pair1_bit]
+
+    conditions = [
+        sf_high > 0,
+        quads > 0,
+        (trips > 0) & (fh_pair > 0),
+        flush_plane > 0,
+        st_high > 0,
+        trips > 0,
+        pair2_bit > 0,
+        pairs > 0,
+    ]
+    choices = [
+        (_SF << 20) | (sf_high << 16),
+        (_QD << 20) | _kick(quad_bit, 0, 1) | _kick(present & ~quad_bit, 1, 1),
+        (_FH << 20) | _kick(trip_bit, 0, 1) | _kick(fh_pair, 1, 1),
+        (_FL << 20) | _kick(flush_plane, 0, 5),
+        (_ST << 20) | (st_high << 16),
+        (_TR << 20) | _kick(trip_bit, 0, 1) | _kick(present & ~trip_bit, 1, 2),
+        (_2P << 20) | _kick(pair1_bit | pair2_bit, 0, 2)
+        | _kick(present & ~(pair1_bit | pair2_bit), 2, 1),
+        (_1P << 20) | _kick(pair1_bit, 0, 1) | _kick(present & ~pair1_bit, 1, 3),
+    ]
+    return np.select(conditions, choices, default=(_HC << 20) | _kick(present, 0, 5))
+
+
+# ---------------------------------------------------------------------------
+# Rank lookup table: any 5/6/7-card set -> packed strength in O(1)
+# ---------------------------------------------------------------------------
+# One int32 array, built by ``scripts/build_rank_table.py``, shipped as
+# package data and memory-mapped so every process (web workers, equity pool
+# workers) shares the same pages:
+#
+#   [0, 8192)            flush table, indexed by a suit's 13-bit rank mask
+#   [offset[n], ...)     non-flush table for n = 5, 6, 7 cards, indexed by a
+#                        perfect hash of the 13 per-rank counts
+#
+# The perfect hash is the lexicographic index of the count vector among all
+# vectors with the same card total (each count 0-4), so the non-flush part is
+# dense: 6175 + 18395 + 49205 entries. With at most 7 cards a flush and a
+# full house/quads can never coexist, so a hand's strength is the max of its
+# flush entry (if any suit has 5+ cards) and its non-flush entry.
+
+RANK_TABLE_PATH = Path(os.environ.get(
+    "POKER_RANK_TABLE",
+    Path(__file__).parent / "data" / "rank_table_v1.npy",
+))
+
+
+def _count_vectors(n_ranks: int, total: int) -> list[list[int]]:
+    """All per-rank count vectors (each 0-4) summing to ``total``, in hash order."""
+    if n_ranks == 0:
+        return [[]] if total == 0 else []
+    out = []
+    for c in range(min(4, total) + 1):
+        out.extend([c] + rest for rest in _count_vectors(n_ranks - 1, total - c))
+    return out
+
+
+@functools.lru_cache(maxsize=None)
+def _ways(n_ranks: int, total: int) -> int:
+    """Number of count vectors over ``n_ranks`` ranks summing to ``total``."""
+    if total < 0:
+        return 0
+    if n_ranks == 0:
+        return 1 if total == 0 else 0
+    return sum(_ways(n_ranks - 1, total - c) for c in range(min(4, total) + 1))
+
+
+# _QHASH[i][remaining][q]: hash contribution of count ``q`` at rank index ``i``
+# when ``remaining`` cards are still to be placed from rank ``i`` upward.
+_QHASH: list[list[list[int]]] = [
+    [
+        [sum(_ways(12 - i, rem - c) for c in range(q)) for q in range(5)]
+        for rem in range(8)
+    ]
+    for i in range(13)
+]
+_QHASH_NP = np.array(_QHASH, dtype=np.int32)
+
+_FLUSH_TABLE_SIZE = 1 << 13
+_NONFLUSH_OFFSET: dict[int, int] = {}
+_offset = _FLUSH_TABLE_SIZE
+for _n in (5, 6, 7):
+    _NONFLUSH_OFFSET[_n] = _offset
+    _offset += _ways(13, _n)
+_RANK_TABLE_SIZE = _offset
+_NONFLUSH_OFFSET_NP = np.zeros(8, dtype=np.int32)
+for _n, _off in _NONFLUSH_OFFSET.items():
+    _NONFLUSH_OFFSET_NP[_n] = _off
+
+
+def _build_rank_table() -> np.ndarray:
+    """Compute the full lookup table (flush + non-flush parts)."""
+    table = np.zeros(_RANK_TABLE_SIZE, dtype=np.int32)
+
+    masks = np.arange(_FLUSH_TABLE_SIZE)
+    sf_high = _STRAIGHT_HIGH13[masks]
+    flush = np.where(
+        sf_high > 0,
+        (_SF << 20) | (sf_high << 16),
+        (_FL << 20) | _TOP5_PACKED[masks],
+    )
+    table[:_FLUSH_TABLE_SIZE] = np.where(_POPCOUNT13[masks] >= 5, flush, 0)
+
+    for n, offset in _NONFLUSH_OFFSET.items():
+        vectors = _count_vectors(13, n)
+        # Deal the ranks round-robin across suits: copies of one rank land on
+        # distinct suits and no suit gets five cards, so nothing is a flush.
+        rank_idx = np.array(
+            [[i for i, q in enumerate(v) for _ in range(q)] for v in vectors],
+            dtype=np.int64,
+        )
+        cards = rank_idx * 4 + np.arange(n) % 4
+        table[offset:offset + len(vectors)] = _score_batch(cards)
+    return table
+
+
+_RANK_TABLE: np.ndarray | None = None
+
+
+def _rank_table() -> np.ndarray:
+    """The rank table, memory-mapped from ``RANK_TABLE_PATH`` on first use.
+
+    A missing file (a checkout that never ran the build script) is built in
+    memory instead, once per process, and nothing is written to disk.
+    """
+    global _RANK_TABLE
+    if _RANK_TABLE is None:
+        if RANK_TABLE_PATH.exists():
+            _RANK_TABLE = np.load(RANK_TABLE_PATH, mmap_mode="r")
+        else:
+            log.warning(
+                "rank table %s missing; building it in memory (run scripts/build_rank_table.py)",
+                RANK_TABLE_PATH,
+            )
+            _RANK_TABLE = _build_rank_table()
+    return _RANK_TABLE
+
+
+def _strength(cards: list[int]) -> int:
+    """Packed strength of 5-7 card ids via the rank table."""
+    table = _rank_table()
+    counts = [0] * 13
+    mask = 0
+    for c in cards:
+        counts[c >> 2] += 1
+        mask |= 1 << ((c & 3) * 16 + (c >> 2))
+
+    rem = len(cards)
+    index = _NONFLUSH_OFFSET[rem]
+    for i, q in enumerate(counts):
+        if q:
+            index += _QHASH[i][rem][q]
+            rem -= q
+    best = int(table[index])
+    for s in range(4):
+        plane = (mask >> (16 * s)) & _PLANE_MASK
+        if plane.bit_count() >= 5:
+            best = max(best, int(table[plane]))
+    return best
+
+
+def _strength_batch(cards: np.ndarray) -> np.ndarray:
+    """Packed strengths for an ``(n, k)`` batch of 5-7 card ids via the rank table."""
+    table = _rank_table()
+    n, k = cards.shape
+    cells = (np.arange(n, dtype=np.int64)[:, None] * 13 + _ID_RANK_IDX[cards]).ravel()
+    counts = np.bincount(cells, minlength=n * 13).reshape(n, 13).astype(np.int32)
+
+    rem = np.full(n, k, dtype=np.int32)
+    index = np.full(n, _NONFLUSH_OFFSET[k], dtype=np.int64)
+    for i in range(13):
+        q = counts[:, i]
+        index += _QHASH_NP[i, rem, q]
+        rem -= q
+    best = table[index].astype(np.int64)
+
+    for plane in _planes_batch(_masks_batch(cards)):
+        best = np.maximum(best, table[np.where(_POPCOUNT13[plane] >= 5, plane, 0)])
+    return best
+
+
+# ---------------------------------------------------------------------------
+# Equity estimation (exact enumeration or Monte Carlo)
+# ---------------------------------------------------------------------------
+# A "deal" fills in the unknown cards: the rest of the board plus one hole
+# pair per opponent. When the number of distinct deals is at most
+# ``EXACT_EQUITY_MAX_COMBOS`` (e.g. heads-up on the turn or river) every deal
+# is enumerated and the equity is exact; otherwise ``n_sim`` random deals are
+# sampled. Both paths score deals the same way.
+
+EXACT_EQUITY_MAX_COMBOS = int(os.environ.get("POKER_EXACT_EQUITY_MAX_COMBOS", "50000"))
+
+
+def n_equity_deals(n_unknown: int, board_needed: int, n_opponents: int) -> int:
+    """Number of distinct deals from ``n_unknown`` unseen cards."""
+    total = math.comb(n_unknown, board_needed)
+    left = n_unknown - board_needed
+    for _ in range(n_opponents):
+        total *= math.comb(left, 2)
+        left -= 2
+    return total
+
+
+def uses_exact_equity(
+    board: list[str],
+    n_active_players: int,
+    max_exact_combos: int | None = None,
+) -> bool:
+    """Whether ``mc_win_rate`` enumerates this spot exactly instead of sampling."""
+    if max_exact_combos is None:
+        max_exact_combos = EXACT_EQUITY_MAX_COMBOS
+    n_opponents = max(1, n_active_players - 1)
+    deals = n_equity_deals(50 - len(board), 5 - len(board), n_opponents)
+    return deals <= max_exact_combos
+
+
+@functools.lru_cache(maxsize=16)
+def _enumerate_deals(n_cards: int, board_needed: int, n_opponents: int) -> np.ndarray:
+    """Every deal as an ``(n_deals, n_draw)`` array of positions into the unseen cards.
+
+    Board cards come first (as an unordered combination), then one unordered
+    pair per opponent, so each row is equally likely. Depends only on the
+    shape of the spot, so results are cached (read-only).
+    """
+    deals = np.array(list(itertools.combinations(range(n_cards), board_needed)), dtype=np.int64)
+    deals = deals.reshape(math.comb(n_cards, board_needed), board_needed)
+    for _ in range(n_opponents):
+        used = np.zeros((len(deals), n_cards), dtype=bool)
+        np.put_along_axis(used, deals, True, axis=1)
+        # Unused positions of each row, in ascending order.
+        free = np.argsort(used, axis=1, kind="stable")[:, :n_cards - deals.shape[1]]
+        i, j = np.triu_indices(free.shape[1], k=1)
+        pairs = np.stack([free[:, i], free[:, j]], axis=2)  # (rows, n_pairs, 2)
+        deals = np.concatenate([
+            np.repeat(deals, len(i), axis=0),
+            pairs.reshape(-1, 2),
+        ], axis=1)
+    deals.setflags(write=False)
+    return deals
+
+
+def _deal_shares(hole: list[int], board: list[int], drawn: np.ndarray, n_opponents: int) -> np.ndarray:
+    """Hero's pot share (1, 1/n_winners or 0) for each row of dealt card ids."""
+    n_deals = len(drawn)
+    board_needed = 5 - len(board)
+
+    def fixed(cards: list[int]) -> np.ndarray:
+        return np.broadcast_to(np.array(cards, dtype=np.int64), (n_deals, len(cards)))
+
+    full_board = np.concatenate([fixed(board), drawn[:, :board_needed]], axis=1)
+    holes = [fixed(hole)] + [
+        drawn[:, board_needed + 2 * i:board_needed + 2 * i + 2] for i in range(n_opponents)
+    ]
+
+    cards = np.concatenate([np.concatenate([h, full_board], axis=1) for h in holes])
+    scores = _strength_batch(cards).reshape(n_opponents + 1, n_deals)
+
+    hero, opponents = scores[0], scores[1:]
+    best_opp = opponents.max(axis=0)
+    n_tied = (opponents == hero).sum(axis=0)
+    return np.where(hero > best_opp, 1.0, np.where(hero == best_opp, 1.0 / (1 + n_tied), 0.0))
+
+
+# ---------------------------------------------------------------------------
+# Equity cache keyed on suit-isomorphic spots
 # ---------------------------------------------------------------------------
+# Equity vs random hands is unchanged by relabelling suits or reordering the
+# hole/board cards. ``canonical_spot`` describes each suit by its pair of
+# rank planes (hole, board) and sorts those pairs: suits with equal pairs are
+# interchangeable, so any two isomorphic spots get the same key. Cached
+# values are keyed on (canonical spot, n_opponents, precision tier).
+
+def canonical_spot(hole: list[str], board: list[str]) -> tuple:
+    """Suit-isomorphism-invariant key for a (hole, board) spot."""
+    hole_mask = hand_mask(card_ids(hole))
+    board_mask = hand_mask(card_ids(board))
+    return tuple(sorted(
+        ((suit_plane(hole_mask, s), suit_plane(board_mask, s)) for s in range(4)),
+        reverse=True,
+    ))
+
+
+def precision_tier(n_sim: int | None) -> int:
+    """Cache tier of an estimate: ``0`` when exact, else ``n_sim``'s power-of-two bucket."""
+    return 0 if n_sim is None else max(1, n_sim).bit_length()
+
+
+@dataclass(frozen=True)
+class EquityEstimate:
+    """An equity answer plus how it was obtained."""
+
+    win_rate: float
+    trials: int         # deals scored (0 for a table lookup)
+    std_error: float    # standard error of ``win_rate``; 0.0 when exact
+    method: str         # "exact" | "preflop_table" | "monte_carlo"
+
+    def excludes(self, threshold: float, z: float) -> bool:
+        """Whether the ``z``-sigma interval around ``win_rate`` excludes ``threshold``."""
+        return abs(self.win_rate - threshold) > z * self.std_error
+
+
+class EquityCache:
+    """Bounded LRU cache of ``EquityEstimate`` values with per-entry TTL and hit/miss counters.
+
+    Thread-safe; shared by every bot in the process. ``put`` keeps an
+    existing entry built from more trials.
+    """
+
+    def __init__(self, maxsize: int = 50_000, ttl_s: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[tuple, tuple[EquityEstimate, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, accept=None) -> EquityEstimate | None:
+        """The live entry for ``key``; an entry ``accept`` rejects counts as a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] < now:
+                del self._data[key]
+                entry = None
+            if entry is None or (accept is not None and not accept(entry[0])):
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, value: EquityEstimate) -> None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] >= now and entry[0].trials > value.trials:
+                return
+            self._data[key] = (value, now + self.ttl_s)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+EQUITY_CACHE = EquityCache(
+    maxsize=int(os.environ.get("POKER_EQUITY_CACHE_SIZE", "50000")),
+    ttl_s=float(os.environ.get("POKER_EQUITY_CACHE_TTL_S", "3600")),
+)
+
+
+# Sequential mode: the first chunk, and the z-score of the stopping interval.
+SEQUENTIAL_MIN_TRIALS = 200
+SEQUENTIAL_Z = 2.58
+
+
+def equity_cache_key(hole: list[str], board: list[str], n_active_players: int, n_sim: int, exact: bool) -> tuple:
+    """``EquityCache`` key of a spot: (canonical spot, n_opponents, precision tier)."""
+    return (canonical_spot(hole, board), max(1, n_active_players - 1), precision_tier(None if exact else n_sim))
+
+
+def cached_equity(
+    cache: EquityCache, key: tuple, n_sim: int, threshold: float | None = None,
+) -> EquityEstimate | None:
+    """``cache``'s entry for ``key`` if it is precise enough for this query.
+
+    Exact entries always are; a sampled one if it ran to ``n_sim`` trials or
+    already excludes ``threshold``.
+    """
+    def usable(cached: EquityEstimate) -> bool:
+        return (
+            cached.method == "exact"
+            or cached.trials >= n_sim
+            or (threshold is not None and cached.excludes(threshold, SEQUENTIAL_Z))
+        )
+
+    return cache.get(key, accept=usable)
+
+
+def _sample_estimate(
+    hole: list[int],
+    board: list[int],
+    deck: np.ndarray,
+    n_opponents: int,
+    n_sim: int,
+    seed: int,
+    threshold: float | None,
+) -> EquityEstimate:
+    """Monte Carlo estimate; with ``threshold``, stop once the interval excludes it.
+
+    Chunks double in size, so an early stop wastes at most half the trials.
+    """
+    gen = np.random.default_rng(seed)
+    n_draw = 5 - len(board) + 2 * n_opponents
+    chunk = n_sim if threshold is None else min(n_sim, SEQUENTIAL_MIN_TRIALS)
+    total = total_sq = 0.0
+    trials = 0
+    while True:
+        order = np.tile(np.arange(len(deck)), (chunk, 1))
+        drawn = deck[gen.permuted(order, axis=1)[:, :n_draw]]
+        shares = _deal_shares(hole, board, drawn, n_opponents)
+        total += float(shares.sum())
+        total_sq += float(np.square(shares).sum())
+        trials += chunk
+
+        mean = total / trials
+        std_error = math.sqrt(max(total_sq / trials - mean * mean, 0.0) / trials)
+        estimate = EquityEstimate(mean, trials, std_error, "monte_carlo")
+        if trials >= n_sim or (threshold is not None and estimate.excludes(threshold, SEQUENTIAL_Z)):
+            return estimate
+        chunk = min(trials, n_sim - trials)
+
+
+def equity_estimate(
+    hole: list[str],
+    board: list[str],
+    n_active_players: int,
+    n_sim: int = 200,
+    rng: random.Random | None = None,
+    max_exact_combos: int | None = None,
+    preflop_table: bool = True,
+    cache: EquityCache | None = EQUITY_CACHE,
+    threshold: float | None = None,
+    seed: int | None = None,
+) -> EquityEstimate:
+    """Win-rate for ``hole`` against random opponent hands, with its precision.
+
+    Preflop (empty board) spots are answered from the precomputed preflop
+    equity table when it is available (``preflop_table=False`` skips it).
+    If the spot has at most ``max_exact_combos`` deals (default
+    ``EXACT_EQUITY_MAX_COMBOS``; ``0`` always samples) every deal is
+    enumerated and the result is exact and deterministic. Otherwise
+    ``n_sim`` run-outs are drawn as ``(trials, cards)`` arrays of card
+    ids and scored with rank-table lookups, so cost grows with array size
+    rather than with Python-level loop iterations. Ties contribute
+    fractional wins (1/n_winners). A seeded ``rng`` seeds the NumPy
+    generator, so seeded bots stay reproducible; ``seed`` gives that
+    generator seed directly instead (``equity_pool`` draws it from the
+    caller's ``rng`` and ships it to a worker).
+
+    With a decision ``threshold`` sampling is sequential: trials run in
+    chunks and stop as soon as the ``SEQUENTIAL_Z`` interval excludes the
+    threshold, so ``n_sim`` becomes an upper bound.
+
+    Results are memoised in ``cache`` (``None`` disables it) under the
+    spot's suit-isomorphic key. A sampled estimate is reused for queries
+    in the same precision tier when it ran to ``n_sim`` trials or already
+    excludes the caller's threshold, and a lookup still advances ``rng``
+    so a seeded caller's later draws do not depend on cache state.
+    """
+    if preflop_table and not board:
+        equity = preflop_equity(hole, n_active_players)
+        if equity is not None:
+            return EquityEstimate(equity, 0, 0.0, "preflop_table")
+
+    n_opponents = max(1, n_active_players - 1)
+    hole_ids = card_ids(hole)
+    board_ids = card_ids(board)
+    known = hand_mask(hole_ids + board_ids)
+    deck = np.array([c for c in range(52) if not known & card_bit(c)], dtype=np.int64)
+    board_needed = 5 - len(board_ids)
+
+    if max_exact_combos is None:
+        max_exact_combos = EXACT_EQUITY_MAX_COMBOS
+    exact = n_equity_deals(len(deck), board_needed, n_opponents) <= max_exact_combos
+    if exact:
+        seed = None
+    elif seed is None:
+        if rng is None:
+            rng = random.Random()
+        seed = rng.getrandbits(64)
+
+    key = None
+    if cache is not None:
+        key = equity_cache_key(hole, board, n_active_players, n_sim, exact)
+        cached = cached_equity(cache, key, n_sim, threshold)
+        if cached is not None:
+            return cached
+
+    if exact:
+        drawn = deck[_enumerate_deals(len(deck), board_needed, n_opponents)]
+        shares = _deal_shares(hole_ids, board_ids, drawn, n_opponents)
+        estimate = EquityEstimate(float(shares.mean()), len(drawn), 0.0, "exact")
+    else:
+        estimate = _sample_estimate(hole_ids, board_ids, deck, n_opponents, n_sim, seed, threshold)
+
+    if key is not None:
+        cache.put(key, estimate)
+    return estimate
+
 
 def mc_win_rate(
     hole: list[str],
@@ -346,11 +996,346 @@ def mc_win_rate(
     n_active_players: int,
     n_sim: int = 200,
     rng: random.Random | None = None,
+    max_exact_combos: int | None = None,
+    preflop_table: bool = True,
+    cache: EquityCache | None = EQUITY_CACHE,
+    threshold: float | None = None,
+) -> float:
+    """Estimate win-rate for ``hole``; see ``equity_estimate`` for the options."""
+    return equity_estimate(
+        hole, board, n_active_players,
+        n_sim=n_sim,
+        rng=rng,
+        max_exact_combos=max_exact_combos,
+        preflop_table=preflop_table,
+        cache=cache,
+        threshold=threshold,
+    ).win_rate
+
+
+# ---------------------------------------------------------------------------
+# Preflop equity table: 169 starting-hand classes x 2-9 players
+# ---------------------------------------------------------------------------
+# Preflop equity vs random hands depends only on the hand class and the
+# player count, so it is precomputed by ``scripts/build_preflop_table.py``
+# and shipped as a small uint16 array (equity * 65535), shape (169, 8) with
+# column ``n_players - 2``. Classes live on the usual 13x13 grid indexed by
+# rank (0 = deuce): pairs on the diagonal, suited hands at (high, low),
+# offsuit hands at (low, high).
+
+PREFLOP_TABLE_PATH = Path(__file__).parent / "data" / "preflop_equity_v1.npy"
+PREFLOP_MIN_PLAYERS, PREFLOP_MAX_PLAYERS = 2, 9
+_PREFLOP_SCALE = 65535
+
+_PREFLOP_TABLE: np.ndarray | None = None
+_PREFLOP_TABLE_LOADED = False
+
+
+def preflop_class_index(hole: list[str]) -> int:
+    """Grid index (0-168) of a two-card starting hand's class."""
+    a, b = card_ids(hole)
+    hi, lo = max(a >> 2, b >> 2), min(a >> 2, b >> 2)
+    if (a & 3) == (b & 3):
+        return hi * 13 + lo
+    return lo * 13 + hi
+
+
+def preflop_class_name(index: int) -> str:
+    """Class label for a grid index, e.g. ``AA``, ``AKs``, ``72o``."""
+    row, col = divmod(index, 13)
+    ranks = "23456789TJQKA"
+    if row == col:
+        return ranks[row] * 2
+    if row > col:
+        return f"{ranks[row]}{ranks[col]}s"
+    return f"{ranks[col]}{ranks[row]}o"
+
+
+def preflop_class_hand(index: int) -> list[str]:
+    """A representative hole-card pair for a grid index."""
+    row, col = divmod(index, 13)
+    ranks = "23456789TJQKA"
+    if row == col:
+        return [ranks[row] + "s", ranks[row] + "h"]
+    if row > col:
+        return [ranks[row] + "s", ranks[col] + "s"]
+    return [ranks[col] + "s", ranks[row] + "h"]
+
+
+def _preflop_table() -> np.ndarray | None:
+    """The preflop equity table, loaded on first use; ``None`` if not built."""
+    global _PREFLOP_TABLE, _PREFLOP_TABLE_LOADED
+    if not _PREFLOP_TABLE_LOADED:
+        if PREFLOP_TABLE_PATH.exists():
+            _PREFLOP_TABLE = np.load(PREFLOP_TABLE_PATH)
+        _PREFLOP_TABLE_LOADED = True
+    return _PREFLOP_TABLE
+
+
+def preflop_equity(hole: list[str], n_active_players: int) -> float | None:
+    """Tabulated preflop equity vs random hands, or ``None`` if not covered."""
+    n_players = max(PREFLOP_MIN_PLAYERS, n_active_players)
+    if n_players > PREFLOP_MAX_PLAYERS:
+        return None
+    table = _preflop_table()
+    if table is None:
+        return None
+    value = table[preflop_class_index(hole), n_players - PREFLOP_MIN_PLAYERS]
+    return int(value) / _PREFLOP_SCALE
+
+
+def build_preflop_table(n_sim: int, seed: int = 0, progress=None) -> np.ndarray:
+    """Compute the preflop equity table by simulation (build-time only).
+
+    Each cell averages ``n_sim`` trials, run in chunks to bound memory.
+    """
+    chunk = 50_000
+    rng = random.Random(seed)
+    n_cols = PREFLOP_MAX_PLAYERS - PREFLOP_MIN_PLAYERS + 1
+    table = np.zeros((169, n_cols), dtype=np.uint16)
+    for index in range(169):
+        hole = preflop_class_hand(index)
+        for col in range(n_cols):
+            total = 0.0
+            for start in range(0, n_sim, chunk):
+                size = min(chunk, n_sim - start)
+                total += size * mc_win_rate(
+                    hole, [], col + PREFLOP_MIN_PLAYERS,
+                    n_sim=size, rng=rng, preflop_table=False, cache=None,
+                )
+            table[index, col] = round(total / n_sim * _PREFLOP_SCALE)
+        if progress is not None:
+            progress(index, preflop_class_name(index), table[index])
+    return table
+
+
+# ---------------------------------------------------------------------------
+# Range equity: hand-vs-range and range-vs-range (heads-up)
+# ---------------------------------------------------------------------------
+# A range is a set of two-card combos with weights, written in the usual
+# shorthand: "QQ+, AKs, 76s, ATo+, A5s-A2s, 99-66, AhKh, KQ:0.5" (``:w``
+# weights a token; later tokens override earlier ones). Combos that share a
+# card with the board (or, pairwise, with each other) are removed, so every
+# number is card-removal aware. Small spots are enumerated exactly; larger
+# ones sample combo pairs by weight and a run-out per pair, all as arrays.
+
+_RANK_CHARS = "23456789TJQKA"
+
+
+def _range_token_combos(token: str) -> list[tuple[int, int]]:
+    """Card-id combos for one range token (without its weight)."""
+    if len(token) == 4 and all(c in CARD_IDS for c in (token[:2], token[2:])):
+        a, b = CARD_IDS[token[:2]], CARD_IDS[token[2:]]
+        if a == b:
+            raise ValueError(f"bad range token: {token!r}")
+        return [(a, b)]
+
+    plus = token.endswith("+")
+    body = token[:-1] if plus else token
+    if "-" in body:
+        if plus:
+            raise ValueError(f"bad range token: {token!r}")
+        start, end = (_range_class(part, token) for part in body.split("-", 1))
+        both_pairs = start[0] == start[1] and end[0] == end[1]
+        same_top = start[0] == end[0] and start[0] != start[1] and end[0] != end[1]
+        if start[2] != end[2] or not (both_pairs or same_top):
+            raise ValueError(f"bad range token: {token!r}")
+    else:
+        start = end = _range_class(body, token)
+
+    hi, lo, kind = start
+    if hi == lo:  # pairs: "QQ", "QQ+", "99-66"
+        bottom = min(start[0], end[0])
+        top = 12 if plus else max(start[0], end[0])
+        classes = [(r, r) for r in range(bottom, top + 1)]
+    else:  # "AK", "ATs+", "A5s-A2s": the kicker varies, the top card stays
+        bottom = min(start[1], end[1])
+        top = hi - 1 if plus else max(start[1], end[1])
+        classes = [(hi, k) for k in range(bottom, top + 1)]
+
+    combos = []
+    for r1, r2 in classes:
+        for s1 in range(4):
+            for s2 in range(4):
+                if r1 == r2 and s2 <= s1:
+                    continue
+                if (kind == "s" and s1 != s2) or (kind == "o" and s1 == s2):
+                    continue
+                combos.append((r1 * 4 + s1, r2 * 4 + s2))
+    return combos
+
+
+def _range_class(text: str, token: str) -> tuple[int, int, str]:
+    """``(high rank, low rank, suitedness)`` of ``AK``/``AKs``/``AKo``/``QQ``."""
+    if len(text) not in (2, 3) or text[0] not in _RANK_CHARS or text[1] not in _RANK_CHARS:
+        raise ValueError(f"bad range token: {token!r}")
+    kind = text[2] if len(text) == 3 else ""
+    hi, lo = _RANK_CHARS.index(text[0]), _RANK_CHARS.index(text[1])
+    if kind not in ("", "s", "o") or hi < lo or (hi == lo and kind):
+        raise ValueError(f"bad range token: {token!r}")
+    return hi, lo, kind
+
+
+def parse_range(text: str) -> tuple[np.ndarray, np.ndarray]:
+    """Parse range shorthand into ``(combos (n, 2) card ids, weights (n,))``."""
+    weights: dict[tuple[int, int], float] = {}
+    for raw in text.split(","):
+        token = raw.strip()
+        if not token:
+            continue
+        weight = 1.0
+        if ":" in token:
+            token, w = token.split(":", 1)
+            try:
+                weight = float(w)
+            except ValueError:
+                raise ValueError(f"bad range weight: {raw.strip()!r}") from None
+            if weight < 0:
+                raise ValueError(f"bad range weight: {raw.strip()!r}")
+        for a, b in _range_token_combos(token.strip()):
+            weights[(min(a, b), max(a, b))] = weight
+    live = [(c, w) for c, w in weights.items() if w > 0]
+    if not live:
+        raise ValueError(f"empty range: {text!r}")
+    combos = np.array([c for c, _ in live], dtype=np.int64)
+    return combos, np.array([w for _, w in live], dtype=np.float64)
+
+
+def _checked_card_ids(cards: list[str], what: str) -> list[int]:
+    """Card ids of ``cards``; ``ValueError`` on an unknown or repeated card."""
+    ids = []
+    for card in cards:
+        if card not in CARD_IDS:
+            raise ValueError(f"bad card in {what}: {card!r}")
+        ids.append(CARD_IDS[card])
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"repeated card in {what}: {list(cards)!r}")
+    return ids
+
+
+def _showdown_shares(a_cards: np.ndarray, b_cards: np.ndarray) -> np.ndarray:
+    """Player A's share (1, 0.5, 0) of each heads-up showdown of 7-card rows."""
+    sa, sb = _strength_batch(a_cards), _strength_batch(b_cards)
+    return np.where(sa > sb, 1.0, np.where(sa == sb, 0.5, 0.0))
+
+
+def range_equity(
+    range_a: str,
+    range_b: str,
+    board: list[str],
+    n_sim: int = 20_000,
+    rng: random.Random | None = None,
+    max_exact_combos: int | None = None,
+) -> EquityEstimate:
+    """Equity of ``range_a`` against ``range_b`` on ``board`` (heads-up).
+
+    Either side may be a single hand (``"AhKh"``). Combos are weighted by
+    their range weights and by card removal: pairs that share a card are
+    impossible and drop out. Enumerated exactly when combo pairs times
+    run-outs is at most ``max_exact_combos`` (default
+    ``EXACT_EQUITY_MAX_COMBOS``), otherwise ``n_sim`` weighted samples.
+    Raises ``ValueError`` for a malformed range, an unknown or repeated
+    board card, more than five board cards, or a side with nothing left.
+    """
+    board_ids = _checked_card_ids(board, "board")
+    if len(board_ids) > 5:
+        raise ValueError(f"a board has at most 5 cards, got {len(board_ids)}")
+    dead = hand_mask(board_ids)
+    sides = []
+    for text in (range_a, range_b):
+        combos, weights = parse_range(text)
+        masks = _ID_BIT[combos].sum(axis=1)
+        live = (masks & dead) == 0
+        if not live.any():
+            if len(combos) == 1:
+                raise ValueError(f"hand {text!r} shares a card with the board")
+            raise ValueError(f"range {text!r} has no combos left on this board")
+        sides.append((combos[live], weights[live], masks[live]))
+    (a, wa, ma), (b, wb, mb) = sides
+
+    ia, ib = np.nonzero((ma[:, None] & mb[None, :]) == 0)
+    if len(ia) == 0:
+        raise ValueError("the two ranges share cards in every combo")
+
+    deck = np.array([c for c in range(52) if not dead & card_bit(c)], dtype=np.int64)
+    board_needed = 5 - len(board_ids)
+    fixed = np.array(board_ids, dtype=np.int64)
+    if max_exact_combos is None:
+        max_exact_combos = EXACT_EQUITY_MAX_COMBOS
+
+    if len(ia) * math.comb(len(deck), board_needed) <= max_exact_combos:
+        runouts = deck[_enumerate_deals(len(deck), board_needed, 0)]
+        run_masks = _ID_BIT[runouts].sum(axis=1)
+        pair = np.repeat(np.arange(len(ia)), len(runouts))
+        run = np.tile(np.arange(len(runouts)), len(ia))
+        ok = (run_masks[run] & (ma[ia[pair]] | mb[ib[pair]])) == 0
+        pair, run = pair[ok], run[ok]
+        full_board = np.concatenate(
+            [np.broadcast_to(fixed, (len(run), len(fixed))), runouts[run]], axis=1,
+        )
+        shares = _showdown_shares(
+            np.concatenate([a[ia[pair]], full_board], axis=1),
+            np.concatenate([b[ib[pair]], full_board], axis=1),
+        )
+        # Every live pair has the same number of run-outs, so weighting each
+        # row by its pair's weight weights the pairs correctly.
+        weights = (wa[ia] * wb[ib])[pair]
+        return EquityEstimate(float((shares * weights).sum() / weights.sum()), len(shares), 0.0, "exact")
+
+    if rng is None:
+        rng = random.Random()
+    gen = np.random.default_rng(rng.getrandbits(64))
+    pair_p = wa[ia] * wb[ib]
+    pair = gen.choice(len(ia), size=n_sim, p=pair_p / pair_p.sum())
+    holes = ma[ia[pair]] | mb[ib[pair]]
+
+    # A run-out per row: shuffle the deck, skip the row's hole cards, keep the first few.
+    order = deck[gen.permuted(np.tile(np.arange(len(deck)), (n_sim, 1)), axis=1)]
+    blocked = (_ID_BIT[order] & holes[:, None]) != 0
+    first = np.argsort(blocked, axis=1, kind="stable")[:, :board_needed]
+    full_board = np.concatenate(
+        [np.broadcast_to(fixed, (n_sim, len(fixed))), np.take_along_axis(order, first, axis=1)],
+        axis=1,
+    )
+    shares = _showdown_shares(
+        np.concatenate([a[ia[pair]], full_board], axis=1),
+        np.concatenate([b[ib[pair]], full_board], axis=1),
+    )
+    std_error = float(shares.std() / math.sqrt(n_sim))
+    return EquityEstimate(float(shares.mean()), n_sim, std_error, "monte_carlo")
+
+
+def hand_vs_range_equity(
+    hole: list[str],
+    villain_range: str,
+    board: list[str],
+    n_sim: int = 20_000,
+    rng: random.Random | None = None,
+    max_exact_combos: int | None = None,
+) -> EquityEstimate:
+    """Equity of one hand against a weighted villain range; see ``range_equity``."""
+    if len(_checked_card_ids(hole, "hole cards")) != 2:
+        raise ValueError(f"hole cards must be two cards, got {list(hole)!r}")
+    overlap = set(hole) & set(board)
+    if overlap:
+        raise ValueError(f"hole cards {sorted(overlap)!r} are also on the board")
+    return range_equity(
+        "".join(hole), villain_range, board,
+        n_sim=n_sim, rng=rng, max_exact_combos=max_exact_combos,
+    )
+
+
+def _mc_win_rate_py(
+    hole: list[str],
+    board: list[str],
+    n_active_players: int,
+    n_sim: int = 200,
+    rng: random.Random | None = None,
 ) -> float:
-    """Estimate win-rate for ``hole`` via Monte Carlo simulation.
+    """Reference per-trial Monte Carlo loop over the pure-Python evaluator.
 
-    Uses the fast pure-Python evaluator so it runs ~10-20× faster than the
-    PokerKit object-based path.  Ties contribute fractional wins (1/n_winners).
+    Kept as the behavioural baseline for ``mc_win_rate``; not used on the
+    hot path.
     """
     if rng is None:
         rng = random.Random()
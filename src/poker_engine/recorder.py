@@ -14,8 +14,13 @@ delivered every round in ``receive_round_start``, are always recorded.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import uuid
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
+from types import SimpleNamespace
+from typing import NamedTuple
+
+from sqlalchemy import insert, select, update
 
 from poker_engine.config import GameConfig
 from poker_engine.db.models import (
@@ -25,8 +30,10 @@ from poker_engine.db.models import (
     GamePlayer,
     Hand,
     HandPlayer,
+    HandStat,
     Street,
 )
+from poker_engine.stats import add_to_rollups, compute_hand_stats, stat_row
 from shared_services.hand_formatter import pos_label as _pos_label
 
 # PyPokerEngine action-history "action" values (uppercase) → our lowercase tags.
@@ -83,6 +90,24 @@ class _HandRecord:
     final_stacks: dict[str, int] = field(default_factory=dict)
 
 
+@dataclass
+class _SeatTotals:
+    """Running per-seat aggregates, named after their ``GamePlayer`` columns."""
+
+    hands_played: int = 0
+    hands_won: int = 0
+    total_winnings: int = 0
+    vpip_count: int = 0
+    pfr_count: int = 0
+
+
+class _SeatRef(NamedTuple):
+    """The ``GamePlayer`` columns hand rows need, cached across saves."""
+
+    id: uuid.UUID
+    seat_index: int
+
+
 class PerspectiveRecorder:
     """Observes one seat and buffers the game for later persistence."""
 
@@ -98,6 +123,13 @@ class PerspectiveRecorder:
         # one-shot ``flush`` ignores these.
         self._game_id = None
         self._persisted_rounds: set[int] = set()
+        self._seat_refs: dict[str, _SeatRef] = {}
+        # Running aggregates over completed hands (rounds in ``_totals_rounds``)
+        # and the per-seat column values last written, so each save folds in
+        # only new hands and updates only seats whose values changed.
+        self._totals: dict[str, _SeatTotals] = {}
+        self._totals_rounds: set[int] = set()
+        self._written: dict[str, dict] = {}
 
     # -- live accessors -----------------------------------------------------
 
@@ -251,8 +283,8 @@ class PerspectiveRecorder:
         )
 
         # Per-hand rows.
-        for hand_rec in self._hands:
-            self._persist_hand(session, game, hand_rec, gp_by_uuid)
+        session.flush()  # assign game / seat ids for the bulk insert
+        self._persist_hands(session, game.id, self._hands, gp_by_uuid)
 
         self._accumulate_stats(gp_by_uuid)
         session.commit()
@@ -326,10 +358,12 @@ class PerspectiveRecorder:
 
         Idempotent and safe to call repeatedly. On the first call it creates the
         ``Game`` and ``GamePlayer`` rows; every call writes only hands whose
-        ``round_count`` has not been persisted yet and recomputes per-seat
-        aggregate stats from all buffered hands. Each call runs in its own
-        session, so ORM rows are always re-resolved by id rather than cached
-        across sessions.
+        ``round_count`` has not been persisted yet, folds them into running
+        per-seat aggregates and updates only the seats whose aggregates or
+        final stack changed, so a save costs the same at hand 5 and hand 500.
+        Each call runs in its own session: only ids are cached across calls,
+        and they advance only once the commit succeeds, so a failed save is
+        retried in full by the next call.
         """
         bot_params_by_uuid = bot_params_by_uuid or {}
         if hero_engine_uuid:
@@ -337,23 +371,27 @@ class PerspectiveRecorder:
             for hand in self._hands:
                 hand.revealed_cards.setdefault(hero_engine_uuid, list(hand.hero_hole))
 
-        if self._game_id is None:
+        game_id, seat_refs, written = self._game_id, self._seat_refs, dict(self._written)
+        if game_id is None:
             hero_user = self._upsert_hero_user(session, config)
             game, gp_by_uuid = self._create_game_and_seats(
                 session, config, hero_user, bot_params_by_uuid, started_at, ended_at
             )
             session.flush()  # assign PKs
-            self._game_id = game.id
+            game_id = game.id
+            seat_refs = {u: _SeatRef(gp.id, gp.seat_index) for u, gp in gp_by_uuid.items()}
+            # The seats were inserted with zero counters and the current final stacks.
+            written = {u: self._seat_values(u, _SeatTotals()) for u in gp_by_uuid}
         else:
-            game = session.get(Game, self._game_id)
-            # Re-resolve seats by id within this live session (the cached ORM
-            # objects from a prior call are detached now).
-            gp_by_uuid = {
-                gp.engine_uuid: gp
-                for gp in session.query(GamePlayer).filter_by(game_id=self._game_id)
-            }
+            if not seat_refs:
+                # First save after the session was restored from a snapshot.
+                rows = session.execute(
+                    select(GamePlayer.engine_uuid, GamePlayer.id, GamePlayer.seat_index)
+                    .where(GamePlayer.game_id == game_id)
+                )
+                seat_refs = {u: _SeatRef(gp_id, index) for u, gp_id, index in rows}
             if ended_at is not None:
-                game.ended_at = ended_at
+                session.execute(update(Game).where(Game.id == game_id).values(ended_at=ended_at))
 
         # Persist only *completed* hands. ``self._current`` is the hand still in
         # progress (recorded at round start, but its board/actions/winners are
@@ -363,40 +401,97 @@ class PerspectiveRecorder:
         completed = [h for h in self._hands if h is not self._current]
 
         # Append hands not yet written.
-        for hand_rec in completed:
-            if hand_rec.round_count in self._persisted_rounds:
-                continue
-            self._persist_hand(session, game, hand_rec, gp_by_uuid)
-            self._persisted_rounds.add(hand_rec.round_count)
-
-        # Recompute aggregate stats + final stacks from all completed hands.
-        for gp in gp_by_uuid.values():
-            gp.hands_played = 0
-            gp.hands_won = 0
-            gp.total_winnings = 0
-            gp.vpip_count = 0
-            gp.pfr_count = 0
-            gp.final_stack = self._final_stack(gp.engine_uuid)
-        self._accumulate_stats(gp_by_uuid, hands=completed)
+        new_hands = [h for h in completed if h.round_count not in self._persisted_rounds]
+        self._persist_hands(session, game_id, new_hands, seat_refs)
+
+        # Fold newly completed hands into a copy of the running aggregates
+        # (after a restore this catches up on every replayed hand once).
+        unfolded = [h for h in completed if h.round_count not in self._totals_rounds]
+        totals = {u: replace(t) for u, t in self._totals.items()}
+        for hand_rec in unfolded:
+            for uuid_ in hand_rec.starting_stacks:
+                _add_hand(totals.setdefault(uuid_, _SeatTotals()), uuid_, hand_rec)
+
+        for uuid_, ref in seat_refs.items():
+            values = self._seat_values(uuid_, totals.get(uuid_, _SeatTotals()))
+            if values != written.get(uuid_):
+                session.execute(update(GamePlayer).where(GamePlayer.id == ref.id).values(**values))
+                written[uuid_] = values
 
         session.commit()
-        return game
+        self._game_id, self._seat_refs, self._written, self._totals = game_id, seat_refs, written, totals
+        self._persisted_rounds.update(h.round_count for h in new_hands)
+        self._totals_rounds.update(h.round_count for h in unfolded)
+        return session.get(Game, game_id)
+
+    def _seat_values(self, uuid_: str, totals: _SeatTotals) -> dict:
+        return {**asdict(totals), "final_stack": self._final_stack(uuid_)}
+
+    def _persist_hands(self, session, game_id, hand_recs, gp_by_uuid):
+        """Bulk-insert hands, hand_players, actions and hand_stats for ``hand_recs``,
+        bump ``games.num_hands`` and add the new hand_stats to the hero's
+        ``user_stats`` rollup.
+
+        Ids are generated here so the tables can be written as one
+        multi-row INSERT each instead of one ORM object per row; the game
+        and seats must already have ids (flushed). ``gp_by_uuid`` values need
+        only ``id`` and ``seat_index``. Rows bypass the session, so the
+        game's ``hands`` collection is loaded from the DB when accessed.
+        """
+        hand_rows, player_rows, action_rows, stat_rows = [], [], [], []
+        for hand_rec in hand_recs:
+            hand_row, players, actions = self._hand_rows(game_id, hand_rec, gp_by_uuid)
+            hand_rows.append(hand_row)
+            player_rows += players
+            action_rows += actions
+            stat_rows += self._stat_rows(hand_row, players, actions, gp_by_uuid)
+        for model, rows in (
+            (Hand, hand_rows), (HandPlayer, player_rows), (Action, action_rows), (HandStat, stat_rows),
+        ):
+            if rows:
+                session.execute(insert(model), rows)
+        if hand_rows:
+            session.execute(
+                update(Game).where(Game.id == game_id).values(num_hands=Game.num_hands + len(hand_rows))
+            )
+        if stat_rows:
+            add_to_rollups(session, [row["hand_id"] for row in stat_rows])
 
-    def _persist_hand(self, session, game, hand_rec, gp_by_uuid):
-        hand = Hand(
-            game=game,
-            round_count=hand_rec.round_count,
-            button_pos=hand_rec.button_pos,
-            sb_pos=hand_rec.sb_pos,
-            bb_pos=hand_rec.bb_pos,
-            street_reached=hand_rec.street_reached,
-            board=hand_rec.board,
-            pot_total=hand_rec.pot_total,
-            had_showdown=hand_rec.had_showdown,
-            pot=hand_rec.pot,
-        )
-        session.add(hand)
+    def _stat_rows(self, hand_row, player_rows, action_rows, gp_by_uuid) -> list[dict]:
+        """The hero's ``hand_stats`` row for one hand (none without a hero seat).
 
+        Counted from the rows about to be inserted, so game and player stats
+        never have to reload and replay the hand.
+        """
+        hero = gp_by_uuid.get(self._hero_uuid) if self._hero_uuid else None
+        if hero is None:
+            return []
+        hand = SimpleNamespace(
+            **hand_row,
+            players=[SimpleNamespace(**r) for r in player_rows],
+            actions=[SimpleNamespace(**r) for r in action_rows],
+        )
+        row = stat_row(compute_hand_stats(hand, hero.id))
+        return [{"hand_id": hand_row["id"], "game_player_id": hero.id, **row}]
+
+    def _hand_rows(self, game_id, hand_rec, gp_by_uuid) -> tuple[dict, list[dict], list[dict]]:
+        """Column values for one hand's ``hands``, ``hand_players`` and ``actions`` rows."""
+        hand_id = uuid.uuid4()
+        hand_row = {
+            "id": hand_id,
+            "game_id": game_id,
+            "round_count": hand_rec.round_count,
+            "button_pos": hand_rec.button_pos,
+            "sb_pos": hand_rec.sb_pos,
+            "bb_pos": hand_rec.bb_pos,
+            "street_reached": hand_rec.street_reached,
+            "board": hand_rec.board,
+            "pot_total": hand_rec.pot_total,
+            "had_showdown": hand_rec.had_showdown,
+            "pot": hand_rec.pot,
+        }
+
+        player_rows = []
         for uuid_, gp in gp_by_uuid.items():
             start = hand_rec.starting_stacks.get(uuid_)
             final = hand_rec.final_stacks.get(uuid_)
@@ -409,57 +504,43 @@ class PerspectiveRecorder:
             pos = ""
             if hand_rec.button_pos is not None and hand_rec.active_seats:
                 pos = _pos_label(gp.seat_index, hand_rec.button_pos, hand_rec.active_seats)
-            session.add(
-                HandPlayer(
-                    hand=hand,
-                    game_player=gp,
-                    hole_cards=cards,
-                    revealed=is_revealed,
-                    is_winner=won,
-                    amount_won=amount_won,
-                    starting_stack=start,
-                    final_stack=final,
-                    position=pos or None,
-                )
-            )
-
+            player_rows.append({
+                "id": uuid.uuid4(),
+                "hand_id": hand_id,
+                "game_player_id": gp.id,
+                "hole_cards": cards,
+                "revealed": is_revealed,
+                "is_winner": won,
+                "amount_won": amount_won,
+                "starting_stack": start,
+                "final_stack": final,
+                "position": pos or None,
+            })
+
+        action_rows = []
         for act in hand_rec.actions:
             gp = gp_by_uuid.get(act.engine_uuid)
             if gp is None:
                 continue
-            session.add(
-                Action(
-                    hand=hand,
-                    game_player=gp,
-                    street=act.street,
-                    action=act.action,
-                    amount=act.amount,
-                    seq=act.seq,
-                    stack_after=act.stack_after,
-                )
-            )
+            action_rows.append({
+                "id": uuid.uuid4(),
+                "hand_id": hand_id,
+                "game_player_id": gp.id,
+                "street": act.street,
+                "action": act.action,
+                "amount": act.amount,
+                "seq": act.seq,
+                "pot_after": None,
+                "stack_after": act.stack_after,
+            })
+        return hand_row, player_rows, action_rows
 
     def _accumulate_stats(self, gp_by_uuid, hands=None):
         hands = self._hands if hands is None else hands
         for uuid_, gp in gp_by_uuid.items():
             for hand_rec in hands:
-                if uuid_ not in hand_rec.starting_stacks:
-                    continue
-                gp.hands_played += 1
-                if uuid_ in hand_rec.winners:
-                    gp.hands_won += 1
-                start = hand_rec.starting_stacks.get(uuid_)
-                final = hand_rec.final_stacks.get(uuid_)
-                if start is not None and final is not None:
-                    gp.total_winnings += final - start
-                preflop_actions = [
-                    a for a in hand_rec.actions
-                    if a.engine_uuid == uuid_ and a.street == Street.PREFLOP
-                ]
-                if any(a.action in _VPIP_ACTIONS for a in preflop_actions):
-                    gp.vpip_count += 1
-                if any(a.action == "raise" for a in preflop_actions):
-                    gp.pfr_count += 1
+                if uuid_ in hand_rec.starting_stacks:
+                    _add_hand(gp, uuid_, hand_rec)
 
     def _upsert_hero_user(self, session, config: GameConfig):
         from poker_engine.db.models import User
@@ -485,6 +566,25 @@ class PerspectiveRecorder:
         return None
 
 
+def _add_hand(totals, uuid_: str, hand_rec: _HandRecord) -> None:
+    """Add one hand's contribution to ``totals`` (a ``GamePlayer`` or ``_SeatTotals``)."""
+    totals.hands_played += 1
+    if uuid_ in hand_rec.winners:
+        totals.hands_won += 1
+    start = hand_rec.starting_stacks.get(uuid_)
+    final = hand_rec.final_stacks.get(uuid_)
+    if start is not None and final is not None:
+        totals.total_winnings += final - start
+    preflop_actions = [
+        a for a in hand_rec.actions
+        if a.engine_uuid == uuid_ and a.street == Street.PREFLOP
+    ]
+    if any(a.action in _VPIP_ACTIONS for a in preflop_actions):
+        totals.vpip_count += 1
+    if any(a.action == "raise" for a in preflop_actions):
+        totals.pfr_count += 1
+
+
 def _street(name) -> Street:
     if name is None:
         return Street.PREFLOP
@@ -0,0 +1,248 @@
+"""Compact replay logs and a replayer for engine and session games.
+
+A game is fully determined by its deal seed, its config and the stream of
+actions actually applied — bots, LLMs and the human only ever choose among
+legal actions, and the deck for every hand comes from the seeded shuffle
+alone. ``ReplayLog`` stores exactly that, with each action packed as one
+varint (``amount << 2 | code``; folds and calls are a single byte).
+
+Uses:
+  * debugging — ``replay_engine(log, hand, action)`` re-drives a
+    ``GameEngine`` to any point in milliseconds (no bot is consulted) and
+    returns the live hand state there;
+  * crash recovery — ``GameSession.from_replay`` rebuilds a web session and
+    its views from the log;
+  * strategy changes — ``rerun(log)`` plays the game again with live bots
+    against the identical card sequence.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+
+from poker_engine.config import GameConfig, SeatKind, SeatSpec
+
+_MAGIC = b"PKRP"
+_VERSION = 1
+
+FOLD, CALL, RAISE = 0, 1, 2
+_CODES = {"FOLD": FOLD, "CALL": CALL, "RAISE": RAISE}
+_DECLARED = {FOLD: "fold", CALL: "call", RAISE: "raise"}
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _config_to_dict(config: GameConfig) -> dict:
+    return {
+        "small_blind": config.small_blind,
+        "buy_in": config.buy_in,
+        "max_round": config.max_round,
+        "ante": config.ante,
+        "seats": [
+            {"name": s.name, "kind": s.kind.value, "params": s.params, "email": s.email, "hidden": s.hidden}
+            for s in config.seats
+        ],
+    }
+
+
+def _config_from_dict(data: dict) -> GameConfig:
+    seats = [
+        SeatSpec(name=s["name"], kind=SeatKind(s["kind"]), params=s["params"], email=s["email"], hidden=s["hidden"])
+        for s in data["seats"]
+    ]
+    return GameConfig(
+        small_blind=data["small_blind"],
+        buy_in=data["buy_in"],
+        seats=seats,
+        max_round=data["max_round"],
+        ante=data["ante"],
+    )
+
+
+@dataclass
+class ReplayLog:
+    """Deal seed, config and the applied actions of one game, hand by hand.
+
+    Actions are ``(code, amount)`` with ``code`` one of ``FOLD``/``CALL``/
+    ``RAISE``; only raises carry an amount (the raise-to amount applied).
+    """
+
+    seed: int
+    config: GameConfig
+    hero_index: int | None = None
+    state_machine: str = "pokerkit"
+    hands: list[list[tuple[int, int]]] = field(default_factory=list)
+
+    def start_hand(self) -> None:
+        self.hands.append([])
+
+    def record(self, action: str, amount: int) -> None:
+        """Append one applied action (``"FOLD"``, ``"CALL"`` or ``"RAISE"``)."""
+        code = _CODES[action]
+        self.hands[-1].append((code, amount if code == RAISE else 0))
+
+    @property
+    def n_actions(self) -> int:
+        return sum(len(actions) for actions in self.hands)
+
+    def encode(self) -> bytes:
+        header = json.dumps({
+            "seed": self.seed,
+            "hero_index": self.hero_index,
+            "state_machine": self.state_machine,
+            "config": _config_to_dict(self.config),
+        }, separators=(",", ":")).encode()
+        out = bytearray(_MAGIC)
+        out.append(_VERSION)
+        _write_varint(out, len(header))
+        out += header
+        _write_varint(out, len(self.hands))
+        for actions in self.hands:
+            _write_varint(out, len(actions))
+            for code, amount in actions:
+                _write_varint(out, amount << 2 | code)
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data: bytes) -> ReplayLog:
+        if data[:4] != _MAGIC:
+            raise ValueError("not a replay log")
+        if data[4] != _VERSION:
+            raise ValueError(f"unsupported replay log version {data[4]}")
+        try:
+            size, pos = _read_varint(data, 5)
+            header = json.loads(data[pos:pos + size])
+            pos += size
+            n_hands, pos = _read_varint(data, pos)
+            hands = []
+            for _ in range(n_hands):
+                n_actions, pos = _read_varint(data, pos)
+                actions = []
+                for _ in range(n_actions):
+                    packed, pos = _read_varint(data, pos)
+                    actions.append((packed & 3, packed >> 2))
+                hands.append(actions)
+        except IndexError:
+            raise ValueError("truncated replay log") from None
+        return cls(
+            seed=header["seed"],
+            config=_config_from_dict(header["config"]),
+            hero_index=header["hero_index"],
+            state_machine=header["state_machine"],
+            hands=hands,
+        )
+
+
+class ReplayStop(Exception):
+    """Raised by a scripted player when the replay reaches its target."""
+
+
+class ReplayScript:
+    """Cursor over a log's actions that stops before ``(hand, action)``.
+
+    ``hand`` is 1-based and ``action`` 0-based within the hand; with no
+    ``hand`` the whole log is replayed and the script stops at the first
+    decision the log does not cover.
+    """
+
+    def __init__(self, log: ReplayLog, hand: int | None = None, action: int = 0):
+        self._actions = [a for actions in log.hands for a in actions]
+        if hand is None:
+            self._stop = len(self._actions)
+        else:
+            if not 1 <= hand <= len(log.hands) or not 0 <= action <= len(log.hands[hand - 1]):
+                raise ValueError(f"no action {action} in hand {hand} of this log")
+            self._stop = sum(len(a) for a in log.hands[:hand - 1]) + action
+        self._pos = 0
+
+    @property
+    def done(self) -> bool:
+        return self._pos >= self._stop
+
+    def next(self) -> tuple[str, int]:
+        """The next action as a ``declare_action`` result."""
+        if self.done:
+            raise ReplayStop
+        code, amount = self._actions[self._pos]
+        self._pos += 1
+        return _DECLARED[code], amount
+
+
+class ScriptedPlayer:
+    """Stands in for any seat's player and plays the logged actions."""
+
+    def __init__(self, script: ReplayScript):
+        self._script = script
+
+    def set_n_players(self, n: int) -> None:
+        pass
+
+    def declare_action(self, valid_actions, hole_card, round_state) -> tuple[str, int]:
+        return self._script.next()
+
+
+@dataclass
+class ReplayPosition:
+    """Where a replay stopped: the hand, the live state and seat mapping."""
+
+    hand: int
+    stacks: list[int]  # seat stacks at the start of ``hand``
+    state: object  # PokerKit State or HoldemState of ``hand``
+    pk_to_seat: list[int]
+    finished: bool  # True when the log's last hand ran to completion
+
+
+def replay_engine(log: ReplayLog, hand: int | None = None, action: int = 0) -> ReplayPosition:
+    """Re-drive a ``GameEngine`` through ``log`` up to ``(hand, action)``.
+
+    Stops just before the ``action``-th action of ``hand`` (or at the end of
+    the log); no bot is consulted, so this costs only the state machine.
+    """
+    from poker_engine.engine import GameEngine
+
+    engine = GameEngine(log.config, seed=log.seed, hero_index=log.hero_index, state_machine=log.state_machine)
+    script = ReplayScript(log, hand, action)
+    engine._players = [(spec, ScriptedPlayer(script)) for spec, _ in engine._players]
+
+    stacks = [log.config.buy_in] * len(log.config.seats)
+    last = len(log.hands) if hand is None else hand
+    for hand_num in range(1, last + 1):
+        try:
+            record = engine._play_hand(hand_num, stacks)
+        except ReplayStop:
+            return ReplayPosition(hand_num, stacks, engine.state, engine.pk_to_seat, finished=False)
+        if hand_num == last:
+            return ReplayPosition(hand_num, stacks, engine.state, engine.pk_to_seat, finished=True)
+        stacks = list(record.stacks)
+    raise ValueError("replay log has no hands")
+
+
+def rerun(log: ReplayLog, config: GameConfig | None = None):
+    """Play the logged game again with live players on the same cards.
+
+    Pass a ``config`` with changed seat params to test a strategy change
+    against the identical card sequence; returns the ``GameResult``.
+    """
+    from poker_engine.engine import GameEngine
+
+    engine = GameEngine(
+        config or log.config, seed=log.seed, hero_index=log.hero_index, state_machine=log.state_machine,
+    )
+    return engine.run(record=False)
@@ -0,0 +1,125 @@
+"""Headless bot-vs-bot simulation: many seeded games across a process pool.
+
+Each game is an independent ``GameEngine`` run via ``GameEngine.simulate``,
+so nothing touches the recorder or the database. Workers stream back compact
+``HandRecord``s per game; ``aggregate`` turns them into a bb/100 win rate
+with a 95% confidence interval for every bot style at the table.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from poker_engine import pk_adapter
+from poker_engine.config import GameConfig
+from poker_engine.engine import GameEngine, HandRecord
+
+# Games are seeded base + index * stride so per-seat bot seeds never overlap.
+_SEED_STRIDE = 100
+_Z_95 = 1.96
+
+
+def game_seed(base_seed: int, game_index: int) -> int:
+    return base_seed + game_index * _SEED_STRIDE
+
+
+def simulate_game(
+    config: GameConfig, seed: int, n_hands: int, state_machine: str = "native",
+) -> list[HandRecord]:
+    """Worker entry point: play one seeded game and return its hand records.
+
+    The equity cache is cleared first: a hit skips the bot's rng draws, so a
+    cache warmed by earlier games would make the result depend on which
+    worker happened to play this game.
+    """
+    pk_adapter.EQUITY_CACHE.clear()
+    return list(GameEngine(config, seed=seed, state_machine=state_machine).simulate(n_hands))
+
+
+def run_simulation(
+    config: GameConfig,
+    n_games: int,
+    hands_per_game: int,
+    seed: int = 0,
+    workers: int | None = None,
+    state_machine: str = "native",
+) -> Iterator[tuple[int, HandRecord]]:
+    """Yield ``(game_index, HandRecord)`` as games finish (not in game order).
+
+    ``workers=0`` plays the games in-process, in order — handy for tests and
+    profiling. Otherwise games are spread over a spawn-context process pool.
+    Hands run on the native ``HoldemState`` unless ``state_machine`` says
+    ``"pokerkit"``; both deal and settle identically for a given seed.
+    """
+    config.validate()
+    if any(not spec.is_bot for spec in config.seats):
+        raise ValueError("Simulation needs an all-bot table.")
+    if workers == 0:
+        for g in range(n_games):
+            for record in simulate_game(config, game_seed(seed, g), hands_per_game, state_machine):
+                yield g, record
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        futures = {
+            executor.submit(simulate_game, config, game_seed(seed, g), hands_per_game, state_machine): g
+            for g in range(n_games)
+        }
+        for future in as_completed(futures):
+            g = futures[future]
+            for record in future.result():
+                yield g, record
+
+
+@dataclass(frozen=True)
+class StyleResult:
+    """Win rate of one bot style over every seat-hand it played."""
+
+    style: str
+    hands: int
+    bb_per_100: float
+    ci95: float  # half-width of the 95% interval, in bb/100
+    showdown_rate: float  # share of hands the style took to showdown
+    win_rate: float  # share of hands with a positive payoff
+
+
+def aggregate(config: GameConfig, records: Iterable[HandRecord]) -> dict[str, StyleResult]:
+    """Pool per-hand deltas by seat style into bb/100 with a 95% CI.
+
+    Seats of the same style are pooled; the CI treats every seat-hand as an
+    independent sample, which slightly understates it when a style occupies
+    several seats of the same hand.
+    """
+    styles = [spec.kind.value for spec in config.seats]
+    bb = config.big_blind
+    sums: dict[str, list[float]] = {s: [0, 0.0, 0.0, 0, 0] for s in styles}
+    for record in records:
+        for seat, delta in enumerate(record.deltas):
+            acc = sums[styles[seat]]
+            acc[0] += 1
+            acc[1] += delta
+            acc[2] += delta * delta
+            acc[3] += seat in record.showdown
+            acc[4] += seat in record.winners
+
+    results: dict[str, StyleResult] = {}
+    for style, (n, total, total_sq, showdowns, wins) in sums.items():
+        if n == 0:
+            continue
+        mean = total / n
+        var = (total_sq - n * mean * mean) / (n - 1) if n > 1 else 0.0
+        se = math.sqrt(max(var, 0.0) / n)
+        results[style] = StyleResult(
+            style=style,
+            hands=n,
+            bb_per_100=mean / bb * 100,
+            ci95=_Z_95 * se / bb * 100,
+            showdown_rate=showdowns / n,
+            win_rate=wins / n,
+        )
+    return results
@@ -6,11 +6,16 @@ Everything here is a count of actions actually taken, safe to run against a
 finished game or an in-progress one (a live game persists completed hands
 incrementally; see ``ws.py``'s ``_save_soft`` / ``GameSession.persist_incremental``).
 
-Two entry points fetch rows from the DB and fold them through the pure counting
-function below:
+Each hand's counts are computed once, when the recorder persists it, and stored
+as a ``hand_stats`` row (``stat_row``) that is also added to the hero's
+per-position ``user_stats`` rollup (``add_to_rollups``). The query entry points
+sum those rows in SQL; hands recorded before ``hand_stats`` existed have no row
+and are replayed through the pure counting function below instead:
 
     compute_game_stats(db, game_id, game_player_id) -> RawStatCounts
-    compute_player_stats(db, user_id)               -> RawStatCounts
+    compute_player_stats(db, user_id)               -> RawStatCounts  (exact recount)
+    player_rollup(db, user_id)                      -> RawStatCounts  (reads user_stats)
+    rebuild_player_rollup(db, user_id)              -> RawStatCounts  (backfill)
     to_display(counts)                               -> dict
 
 ``RawStatCounts`` is summed (never averaged) across games — this is what makes
@@ -20,68 +25,160 @@ must yield 4/30, not the mean of the two percentages.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, fields
+from collections.abc import Iterator
 
-from sqlalchemy import select
+from sqlalchemy import and_, delete, func, insert, literal, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 
-from poker_engine.db.models import Action, Game, GamePlayer, Hand, HandPlayer, Street
+from poker_engine.db.models import (
+    Action,
+    Game,
+    GamePlayer,
+    Hand,
+    HandPlayer,
+    HandStat,
+    Street,
+    UserStat,
+)
 
 _VPIP_ACTIONS = {"call", "raise"}
 _STREETS = ("preflop", "flop", "turn", "river")
 _POSTFLOP_STREETS = ("flop", "turn", "river")
 
-@dataclass
+# The scalar counters in storage order: ``RawStatCounts`` keeps them in one
+# int list indexed by this tuple, and ``hand_stats`` has a column for each.
+COUNTER_FIELDS = (
+    "hands_dealt",
+    "vpip_hands",
+    "pfr_hands",
+    "three_bet_opportunities",
+    "three_bet_hands",
+    "faced_3bet_after_raise",
+    "folded_to_3bet",
+
+    "cbet_flop",
+    "cbet_turn",
+    "cbet_river",
+    "cbet_opportunities_flop",
+    "cbet_opportunities_turn",
+    "cbet_opportunities_river",
+    "faced_cbet_flop",
+    "faced_cbet_turn",
+    "faced_cbet_river",
+    "faced_cbet_opportunities_flop",
+    "faced_cbet_opportunities_turn",
+    "faced_cbet_opportunities_river",
+    "folded_to_cbet_flop",
+    "folded_to_cbet_turn",
+    "folded_to_cbet_river",
+
+    "saw_flop_hands",
+    "wtsd_hands",
+    "showdown_hands",
+    "won_at_showdown_hands",
+
+    "postflop_bets_raises",
+    "postflop_calls",
+)
+_N_COUNTERS = len(COUNTER_FIELDS)
+
+
 class RawStatCounts:
-    hands_dealt: int = 0
-    vpip_hands: int = 0
-    pfr_hands: int = 0
-    three_bet_opportunities: int = 0
-    three_bet_hands: int = 0
-    faced_3bet_after_raise: int = 0
-    folded_to_3bet: int = 0
-
-    cbet_flop: int = 0
-    cbet_turn: int = 0
-    cbet_river: int = 0
-    cbet_opportunities_flop: int = 0
-    cbet_opportunities_turn: int = 0
-    cbet_opportunities_river: int = 0
-    faced_cbet_flop: int = 0
-    faced_cbet_turn: int = 0
-    faced_cbet_river: int = 0
-    faced_cbet_opportunities_flop: int = 0
-    faced_cbet_opportunities_turn: int = 0
-    faced_cbet_opportunities_river: int = 0
-    folded_to_cbet_flop: int = 0
-    folded_to_cbet_turn: int = 0
-    folded_to_cbet_river: int = 0
-
-    saw_flop_hands: int = 0
-    wtsd_hands: int = 0
-    showdown_hands: int = 0
-    won_at_showdown_hands: int = 0
-
-    postflop_bets_raises: int = 0
-    postflop_calls: int = 0
-
-    by_position: dict[str, "RawStatCounts"] = field(default_factory=dict)
-
-    def __add__(self, other: "RawStatCounts") -> "RawStatCounts":
+    """Summable stat counters, overall and per position.
+
+    Each counter in ``COUNTER_FIELDS`` reads and writes as an attribute, but
+    lives at a fixed index of one int list; ``by_position`` is backed by a
+    position x counter matrix (one such list per position). ``+=`` adds in
+    place, which is how hands are summed; ``+`` returns a new object.
+    """
+
+    __slots__ = ("_values", "_positions")
+
+    def __init__(self, by_position: dict[str, RawStatCounts] | None = None, **counters: int):
+        self._values = [0] * _N_COUNTERS
+        for name, value in counters.items():
+            setattr(self, name, value)
+        self._positions: dict[str, list[int]] = {
+            pos: list(counts._values) for pos, counts in (by_position or {}).items()
+        }
+
+    @classmethod
+    def _from_values(cls, values: list[int], positions: dict[str, list[int]] | None = None) -> RawStatCounts:
+        out = cls.__new__(cls)
+        out._values = values
+        out._positions = positions if positions is not None else {}
+        return out
+
+    @property
+    def by_position(self) -> dict[str, RawStatCounts]:
+        """Per-position counts, as views onto the matrix rows.
+
+        Writes go through to the row (``counts.by_position["BTN"] += x``) but
+        not to the totals. The dict itself is new on every access.
+        """
+        return {pos: RawStatCounts._from_values(row) for pos, row in self._positions.items()}
+
+    def set_position(self, position: str) -> None:
+        """Record this (single-hand) count's totals as ``position``'s row."""
+        self._positions[position] = list(self._values)
+
+    def __iadd__(self, other: RawStatCounts) -> RawStatCounts:
         if not isinstance(other, RawStatCounts):
             return NotImplemented
-        out = RawStatCounts()
-        for f in fields(self):
-            if f.name == "by_position":
-                continue
-            setattr(out, f.name, getattr(self, f.name) + getattr(other, f.name))
-        positions = set(self.by_position) | set(other.by_position)
-        for pos in positions:
-            a = self.by_position.get(pos, RawStatCounts())
-            b = other.by_position.get(pos, RawStatCounts())
-            out.by_position[pos] = a + b
+        # In place: ``by_position`` views share these lists.
+        values = self._values
+        for i, v in enumerate(other._values):
+            values[i] += v
+        positions = self._positions
+        for pos, row in other._positions.items():
+            mine = positions.get(pos)
+            if mine is None:
+                positions[pos] = list(row)
+            else:
+                for i, v in enumerate(row):
+                    mine[i] += v
+        return self
+
+    def __add__(self, other: RawStatCounts) -> RawStatCounts:
+        if not isinstance(other, RawStatCounts):
+            return NotImplemented
+        out = RawStatCounts._from_values(
+            list(self._values), {pos: list(row) for pos, row in self._positions.items()},
+        )
+        out += other
         return out
 
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RawStatCounts):
+            return NotImplemented
+        return self._values == other._values and self._positions == other._positions
+
+    def __repr__(self) -> str:
+        nonzero = ", ".join(f"{n}={v}" for n, v in zip(COUNTER_FIELDS, self._values) if v)
+        return f"RawStatCounts({nonzero}, positions={sorted(self._positions)})"
+
+
+def _counter(index: int) -> property:
+    def get(self: RawStatCounts) -> int:
+        return self._values[index]
+
+    def set(self: RawStatCounts, value: int) -> None:
+        self._values[index] = value
+
+    return property(get, set)
+
+
+for _index, _name in enumerate(COUNTER_FIELDS):
+    setattr(RawStatCounts, _name, _counter(_index))
+
+
+def stat_row(counts: RawStatCounts) -> dict:
+    """``hand_stats`` column values for one hand's counts (key columns excluded)."""
+    row = {name: getattr(counts, name) for name in COUNTER_FIELDS}
+    row["position"] = next(iter(counts._positions), None)
+    return row
+
 
 def _aggressor_of_street(actions_by_street: dict[str, list[Action]], street: str) -> str | None:
     """The ``game_player_id`` whose bet/raise stood as the street's last aggressor.
@@ -244,10 +341,7 @@ def compute_hand_stats(hand: Hand, game_player_id) -> RawStatCounts:
                 counts.postflop_calls += 1
 
     if hero_hp.position:
-        pos_counts = RawStatCounts(**{
-            f.name: getattr(counts, f.name) for f in fields(counts) if f.name != "by_position"
-        })
-        counts.by_position[hero_hp.position] = pos_counts
+        counts.set_position(hero_hp.position)
 
     return counts
 
@@ -271,36 +365,186 @@ def _sum_hands(hands: list[Hand], game_player_id) -> RawStatCounts:
     for hand in hands:
         if not any(hp.game_player_id == game_player_id for hp in hand.players):
             continue
-        total = total + compute_hand_stats(hand, game_player_id)
+        total += compute_hand_stats(hand, game_player_id)
+    return total
+
+
+def _from_position_rows(rows) -> RawStatCounts:
+    """Fold ``(position, *counters)`` rows into totals plus ``by_position``."""
+    total = RawStatCounts()
+    for position, *sums in rows:
+        group = RawStatCounts._from_values([int(v or 0) for v in sums])
+        if position:
+            group.set_position(position)
+        total += group
     return total
 
 
+def _hero_seats(user_id=None) -> tuple:
+    """``where`` clauses selecting hero seats (joined Game/GamePlayer): the
+    seat of each game's ``hero_user_id``, only ``user_id``'s if given."""
+    seats = (GamePlayer.user_id == Game.hero_user_id, GamePlayer.is_bot.is_(False))
+    if user_id is None:
+        return seats
+    return (Game.hero_user_id == user_id, GamePlayer.user_id == user_id, *seats[1:])
+
+
+def _sum_stat_rows(db, *where) -> RawStatCounts:
+    """Sum ``hand_stats`` rows matching ``where``, one GROUP BY position."""
+    rows = db.execute(
+        select(HandStat.position, *(func.sum(getattr(HandStat, name)) for name in COUNTER_FIELDS))
+        .join(GamePlayer, GamePlayer.id == HandStat.game_player_id)
+        .join(Game, Game.id == GamePlayer.game_id)
+        .where(*where)
+        .group_by(HandStat.position)
+    ).all()
+    return _from_position_rows(rows)
+
+
+# Hands replayed per query when summing or backfilling unmaterialized hands.
+_REPLAY_BATCH = 500
+
+
+def _unmaterialized(db, *where) -> Iterator[list[tuple]]:
+    """Batches of ``(hand_id, game_player_id, counts)`` for matching seats'
+    hands that have no ``hand_stats`` row yet, replayed from their actions.
+
+    Keyset-paged on ``(hand_id, game_player_id)``, ``_REPLAY_BATCH`` at a time,
+    so a long unmaterialized history is never loaded at once.
+    """
+    key = tuple_(HandPlayer.hand_id, HandPlayer.game_player_id)
+    key_types = [HandPlayer.hand_id.type, HandPlayer.game_player_id.type]
+    after = None
+    while True:
+        query = (
+            select(HandPlayer.hand_id, HandPlayer.game_player_id)
+            .join(GamePlayer, GamePlayer.id == HandPlayer.game_player_id)
+            .join(Game, Game.id == GamePlayer.game_id)
+            .outerjoin(HandStat, and_(
+                HandStat.hand_id == HandPlayer.hand_id,
+                HandStat.game_player_id == HandPlayer.game_player_id,
+            ))
+            .where(HandStat.hand_id.is_(None), *where)
+            .order_by(HandPlayer.hand_id, HandPlayer.game_player_id)
+            .limit(_REPLAY_BATCH)
+        )
+        if after is not None:
+            query = query.where(key > tuple_(*after, types=key_types))
+        missing = db.execute(query).all()
+        if not missing:
+            return
+        hands = db.execute(
+            select(Hand)
+            .where(Hand.id.in_({hand_id for hand_id, _ in missing}))
+            .options(selectinload(Hand.actions), selectinload(Hand.players))
+        ).scalars().all()
+        by_id = {hand.id: hand for hand in hands}
+        yield [
+            (hand_id, game_player_id, compute_hand_stats(by_id[hand_id], game_player_id))
+            for hand_id, game_player_id in missing
+        ]
+        if len(missing) < _REPLAY_BATCH:
+            return
+        after = tuple(missing[-1])
+
+
+def _add_unmaterialized(total: RawStatCounts, db, *where) -> RawStatCounts:
+    for batch in _unmaterialized(db, *where):
+        for _, _, counts in batch:
+            total += counts
+    return total
+
+
+def _sum_seats(db, *where) -> RawStatCounts:
+    return _add_unmaterialized(_sum_stat_rows(db, *where), db, *where)
+
+
 def compute_game_stats(db, game_id, game_player_id) -> RawStatCounts:
     """Hero's raw stat counts for one game. Works whether the game is finished or not."""
-    hands = db.execute(
-        select(Hand)
-        .where(Hand.game_id == game_id)
-        .options(selectinload(Hand.actions), selectinload(Hand.players))
-        .order_by(Hand.round_count)
-    ).scalars().all()
-    return _sum_hands(hands, game_player_id)
+    return _sum_seats(db, Game.id == game_id, GamePlayer.id == game_player_id)
 
 
 def compute_player_stats(db, user_id) -> RawStatCounts:
-    """Hero's raw stat counts summed across every game they've played."""
-    games = db.execute(
-        select(Game)
-        .where(Game.hero_user_id == user_id)
-        .options(selectinload(Game.players))
-    ).scalars().all()
+    """Hero's raw stat counts summed across every game they've played.
 
-    total = RawStatCounts()
-    for game in games:
-        hero = next((gp for gp in game.players if not gp.is_bot and gp.user_id == user_id), None)
-        if hero is None:
-            continue
-        total = total + compute_game_stats(db, game.id, hero.id)
-    return total
+    An exact recount over every hand; ``player_rollup`` reads the same
+    numbers from the maintained ``user_stats`` rollup instead.
+    """
+    return _sum_seats(db, *_hero_seats(user_id))
+
+
+def player_rollup(db, user_id) -> RawStatCounts:
+    """Hero's lifetime raw stat counts from ``user_stats`` (one row per position).
+
+    The rollup covers materialized hands only. Hands recorded before
+    ``hand_stats`` existed and not yet rebuilt are replayed on top, so the
+    result always equals ``compute_player_stats``. A user with no rollup
+    rows at all falls back to it outright.
+    """
+    rows = db.execute(
+        select(UserStat.position, *(getattr(UserStat, name) for name in COUNTER_FIELDS))
+        .where(UserStat.user_id == user_id)
+    ).all()
+    if not rows:
+        return compute_player_stats(db, user_id)
+    return _add_unmaterialized(_from_position_rows(rows), db, *_hero_seats(user_id))
+
+
+# user_stats keys hands without a position as "" (a literal, not a bound
+# parameter, so the SELECT and GROUP BY expressions are identical).
+_ROLLUP_POSITION = func.coalesce(HandStat.position, literal_column("''"))
+
+
+def add_to_rollups(db, hand_ids) -> None:
+    """Add these hands' ``hand_stats`` rows to their users' ``user_stats``.
+
+    Called in the transaction that inserts the rows, once per hand, so the
+    rollup stays the sum of every materialized hand.
+    """
+    position = _ROLLUP_POSITION
+    source = (
+        select(GamePlayer.user_id, position, *(func.sum(getattr(HandStat, name)) for name in COUNTER_FIELDS))
+        .join(GamePlayer, GamePlayer.id == HandStat.game_player_id)
+        .join(Game, Game.id == GamePlayer.game_id)
+        .where(HandStat.hand_id.in_(hand_ids), *_hero_seats())
+        .group_by(GamePlayer.user_id, position)
+    )
+    stmt = pg_insert(UserStat).from_select(["user_id", "position", *COUNTER_FIELDS], source)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "position"],
+        set_={
+            **{name: getattr(UserStat, name) + getattr(stmt.excluded, name) for name in COUNTER_FIELDS},
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+
+
+def rebuild_player_rollup(db, user_id) -> RawStatCounts:
+    """Recompute a user's ``user_stats`` from scratch and return the totals.
+
+    Hands that predate ``hand_stats`` are replayed and their rows written
+    first, so afterwards the rollup equals ``compute_player_stats``. Does not
+    commit.
+    """
+    where = _hero_seats(user_id)
+    for batch in _unmaterialized(db, *where):
+        db.execute(insert(HandStat), [
+            {"hand_id": hand_id, "game_player_id": game_player_id, **stat_row(counts)}
+            for hand_id, game_player_id, counts in batch
+        ])
+    db.execute(delete(UserStat).where(UserStat.user_id == user_id))
+    position = _ROLLUP_POSITION
+    db.execute(insert(UserStat).from_select(
+        ["user_id", "position", *COUNTER_FIELDS],
+        select(literal(user_id, UserStat.user_id.type), position,
+               *(func.sum(getattr(HandStat, name)) for name in COUNTER_FIELDS))
+        .join(GamePlayer, GamePlayer.id == HandStat.game_player_id)
+        .join(Game, Game.id == GamePlayer.game_id)
+        .where(*where)
+        .group_by(position),
+    ))
+    return player_rollup(db, user_id)
 
 
 def _pct(numerator: int, denominator: int) -> dict:
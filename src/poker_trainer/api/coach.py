@@ -151,7 +151,7 @@ async def coach_chat(
 
     live_context: str | None = None
     if body.game_id is not None:
-        session = manager.get(str(body.game_id))
+        session = await manager.get(str(body.game_id))
         if session is not None:
             round_state = session.current_round_state()
             if round_state is not None:
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
+import base64
 import random
+import uuid
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select, tuple_
 from sqlalchemy.orm import Session, selectinload
 
 from poker_engine import pk_adapter, stats
 from poker_engine.bots.styles import STYLE_REGISTRY
 from poker_engine.bots.llm_styles import LLM_STYLE_REGISTRY
 from poker_engine.config import GameConfig, SeatKind, SeatSpec
-from poker_engine.db.models import Game, GamePlayer, Hand, User
+from poker_engine.db.models import Game, GamePlayer, Hand, HandPlayer, User
 from poker_trainer.auth.deps import get_db, require_user
 from poker_trainer.game.manager import manager
 from poker_trainer.game.session import GameSession
@@ -99,6 +102,12 @@ class GameSummary(BaseModel):
     hero_net: int  # the hero seat's net chips across the game
 
 
+class GamePage(BaseModel):
+    games: list[GameSummary]
+    # Pass back as ``cursor`` for the next (older) page; None on the last page.
+    next_cursor: str | None = None
+
+
 def _build_seats(req: CreateGameRequest, hero: User) -> list[SeatSpec]:
     # The hero seat is the logged-in user; the recorder links the game to this
     # account by email.
@@ -125,7 +134,7 @@ def _build_seats(req: CreateGameRequest, hero: User) -> list[SeatSpec]:
 
 
 @router.post("/games", response_model=CreateGameResponse)
-def create_game(req: CreateGameRequest, hero: User = Depends(require_user)) -> CreateGameResponse:
+async def create_game(req: CreateGameRequest, hero: User = Depends(require_user)) -> CreateGameResponse:
     if req.big_blind != req.small_blind * 2:
         # The engine derives BB as 2*SB; keep the contract explicit.
         raise HTTPException(400, "big_blind must equal 2 × small_blind.")
@@ -151,7 +160,7 @@ def create_game(req: CreateGameRequest, hero: User = Depends(require_user)) -> C
     session = GameSession(config, hero_index=0, seed=req.seed)
     session.preflop_quick = preflop
     session.postflop_quick = postflop
-    manager.add(session)
+    await manager.add(session)
     return CreateGameResponse(
         game_id=session.game_id,
         ws_url=f"/ws/games/{session.game_id}",
@@ -173,15 +182,15 @@ def _hero_seat(game: Game) -> GamePlayer | None:
 
 
 def _load_owned_game(db: Session, game_id: str, user: User) -> Game:
-    """Fetch a game with hands/players eager-loaded, 404 unless owned by user."""
+    """Fetch a game with its seats eager-loaded, 404 unless owned by user.
+
+    Hands are not loaded; routes query the ones they need.
+    """
     try:
         game = db.execute(
             select(Game)
             .where(Game.id == game_id)
-            .options(
-                selectinload(Game.players),
-                selectinload(Game.hands),
-            )
+            .options(selectinload(Game.players))
         ).scalar_one_or_none()
     except Exception:  # malformed UUID etc.
         game = None
@@ -190,75 +199,130 @@ def _load_owned_game(db: Session, game_id: str, user: User) -> Game:
     return game
 
 
-@router.get("/games", response_model=list[GameSummary])
+def _encode_game_cursor(started_at: datetime | None, game_id) -> str:
+    key = f"{started_at.isoformat() if started_at else ''}|{game_id}"
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def _decode_game_cursor(cursor: str) -> tuple[datetime | None, uuid.UUID]:
+    try:
+        started, _, game_id = base64.urlsafe_b64decode(cursor.encode()).decode().partition("|")
+        return (datetime.fromisoformat(started) if started else None), uuid.UUID(game_id)
+    except ValueError:
+        raise HTTPException(400, "Invalid cursor.")
+
+
+@router.get("/games", response_model=GamePage)
 def list_games(
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = None,
     user: User = Depends(require_user),
     db: Session = Depends(get_db),
-) -> list[GameSummary]:
-    games = (
-        db.execute(
-            select(Game)
-            .where(Game.hero_user_id == user.id)
-            .options(selectinload(Game.players), selectinload(Game.hands))
-            .order_by(Game.started_at.desc().nullslast(), Game.created_at.desc())
+) -> GamePage:
+    """The user's games, newest first, ``limit`` per page.
+
+    Keyset-paginated on ``(started_at, id)`` (unstarted games last); the hand
+    count is ``games.num_hands`` and the hero's net comes from a join on its
+    seat, so a page costs the same however long the history is.
+    """
+    query = (
+        select(
+            Game.id, Game.started_at, Game.small_blind, Game.big_blind, Game.num_hands,
+            GamePlayer.total_winnings,
         )
-        .scalars()
-        .all()
+        .outerjoin(GamePlayer, and_(  # the hero seat
+            GamePlayer.game_id == Game.id,
+            GamePlayer.user_id == Game.hero_user_id,
+        ))
+        .where(Game.hero_user_id == user.id)
+        .order_by(Game.started_at.desc().nullslast(), Game.id.desc())
+        .limit(limit + 1)
     )
-    out: list[GameSummary] = []
-    for game in games:
-        hero = _hero_seat(game)
-        out.append(
-            GameSummary(
-                game_id=str(game.id),
-                started_at=game.started_at.isoformat() if game.started_at else None,
-                small_blind=game.small_blind,
-                big_blind=game.big_blind,
-                num_hands=len(game.hands),
-                hero_net=hero.total_winnings if hero else 0,
-            )
+    if cursor is not None:
+        started_at, game_id = _decode_game_cursor(cursor)
+        if started_at is None:
+            query = query.where(Game.started_at.is_(None), Game.id < game_id)
+        else:
+            query = query.where(or_(
+                tuple_(Game.started_at, Game.id)
+                < tuple_(started_at, game_id, types=[Game.started_at.type, Game.id.type]),
+                Game.started_at.is_(None),
+            ))
+    rows = db.execute(query).all()
+
+    games = [
+        GameSummary(
+            game_id=str(row.id),
+            started_at=row.started_at.isoformat() if row.started_at else None,
+            small_blind=row.small_blind,
+            big_blind=row.big_blind,
+            num_hands=row.num_hands,
+            hero_net=row.total_winnings or 0,
         )
-    return out
+        for row in rows[:limit]
+    ]
+    last = rows[limit - 1] if len(rows) > limit else None
+    return GamePage(
+        games=games,
+        next_cursor=_encode_game_cursor(last.started_at, last.id) if last else None,
+    )
 
 
 @router.get("/games/{game_id}/hands")
 def list_hands(
     game_id: str,
+    limit: int = Query(default=100, ge=1, le=500),
+    cursor: int | None = Query(default=None, ge=0),
     user: User = Depends(require_user),
     db: Session = Depends(get_db),
 ) -> dict:
+    """One page of a game's hands in round order, with the hero's result for each.
+
+    ``cursor`` is the last ``round_count`` already seen (the previous page's
+    ``next_cursor``); the hero's result is an outer join on its hand_players row.
+    """
     game = _load_owned_game(db, game_id, user)
     hero = _hero_seat(game)
-    hero_gp_id = hero.id if hero else None
-
-    hands = sorted(game.hands, key=lambda h: h.round_count)
-    rows = []
-    for hand in hands:
-        # Hero's result for this hand, if the hero was dealt in.
-        hero_won = False
-        hero_amount = 0
-        for hp in hand.players:
-            if hp.game_player_id == hero_gp_id:
-                hero_won = hp.is_winner
-                hero_amount = hp.amount_won
-                break
-        rows.append({
-            "hand_id": str(hand.id),
-            "round_count": hand.round_count,
-            "street_reached": hand.street_reached.value,
-            "board": list(hand.board or []),
-            "pot_total": hand.pot_total,
-            "had_showdown": hand.had_showdown,
-            "hero_won": hero_won,
-            "hero_amount": hero_amount,
-        })
 
+    query = (
+        select(
+            Hand.id, Hand.round_count, Hand.street_reached, Hand.board, Hand.pot_total,
+            Hand.had_showdown, HandPlayer.is_winner, HandPlayer.amount_won,
+        )
+        .outerjoin(HandPlayer, and_(
+            HandPlayer.hand_id == Hand.id,
+            HandPlayer.game_player_id == (hero.id if hero else None),
+        ))
+        .where(Hand.game_id == game.id)
+        .order_by(Hand.round_count)
+        .limit(limit + 1)
+    )
+    if cursor is not None:
+        query = query.where(Hand.round_count > cursor)
+    rows = db.execute(query).all()
+
+    hands = [
+        {
+            "hand_id": str(row.id),
+            "round_count": row.round_count,
+            "street_reached": row.street_reached.value,
+            "board": list(row.board or []),
+            "pot_total": row.pot_total,
+            "had_showdown": row.had_showdown,
+            # Hero's result for this hand, if the hero was dealt in.
+            "hero_won": bool(row.is_winner),
+            "hero_amount": row.amount_won or 0,
+        }
+        for row in rows[:limit]
+    ]
     return {
         "game_id": str(game.id),
         "small_blind": game.small_blind,
         "big_blind": game.big_blind,
         "started_at": game.started_at.isoformat() if game.started_at else None,
-        "hands": rows,
+        "num_hands": game.num_hands,
+        "hands": hands,
+        "next_cursor": hands[-1]["round_count"] if len(rows) > limit else None,
     }
 
 
@@ -538,8 +602,8 @@ def hand_context_text(
 
 
 @router.get("/games/{game_id}/state")
-def game_state(game_id: str) -> dict:
-    session = manager.get(game_id)
+async def game_state(game_id: str) -> dict:
+    session = await manager.get(game_id)
     if session is None:
         raise HTTPException(404, "Game not found or already finished.")
     return {
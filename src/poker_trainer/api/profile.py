@@ -88,7 +88,7 @@ def profile_stats(
     db: Session = Depends(get_db),
 ) -> dict:
     """Hero's stats rolled up across every game they've played."""
-    counts = stats.compute_player_stats(db, user.id)
+    counts = stats.player_rollup(db, user.id)
     return stats.to_display(counts)
 
 
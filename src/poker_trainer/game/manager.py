@@ -1,37 +1,424 @@
-"""In-memory registry of active GameSessions.
+"""Registry of active GameSessions, behind a pluggable session store.
 
-Live game state (the Emulator's Table object) is kept in this process and only
-persisted to Postgres when a game finishes. This is sufficient for single-process
-development; a multi-worker deployment would move this to Redis or serialize the
-game state to the DB after each action.
+``SessionManager`` keeps live sessions in this process: enough for a single
+worker, but a restart loses every table and a second worker cannot see them.
+``RedisSessionStore`` keeps each session in Redis as its compact snapshot
+(``GameSession.encode``: identity plus the replay log) and guards each game
+with a distributed lock, so any worker can serve any table and a restart
+loses nothing. ``POKER_SESSION_STORE=redis`` selects it.
+
+Every store has the same surface: the coroutines ``add`` / ``get`` /
+``save`` / ``remove`` and ``lock(game_id)``, an async context manager held
+while a session is advanced. Callers ``save`` after mutating a session under
+its lock. Nothing blocks the event loop: Redis is reached through
+``redis.asyncio`` and snapshots are decoded (a replay of the whole game) in
+a worker thread.
+
+Abandoned tables are not kept in memory forever: ``evict_idle`` (run
+periodically by ``run_evictor`` from the app lifespan) drops sessions idle
+longer than ``POKER_SESSION_IDLE_S``. The in-process store first spills them
+to ``POKER_SESSION_SPILL_DIR`` as snapshots; Redis already holds them. Either
+way ``get`` rehydrates them transparently on reconnect. ``stats()`` reports
+live/spilled counts and bytes for sizing web nodes; byte gauges are
+estimated from a sample of sessions and cached for
+``POKER_SESSION_STATS_TTL_S``.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import gc
+import logging
+import os
+import random
+import sys
+import time
+import types
+import uuid as uuidlib
+import weakref
+from pathlib import Path
+from typing import Protocol
 
 from poker_trainer.game.session import GameSession
 
+SESSION_STORE = os.environ.get("POKER_SESSION_STORE", "memory")
+REDIS_URL = os.environ.get("REDIS_URL", "redis://redis:6379")
+# Abandoned tables expire from Redis after this long without a save.
+SESSION_TTL_S = int(os.environ.get("POKER_SESSION_TTL_S", str(24 * 3600)))
+# Sessions untouched for this long are evicted from worker memory.
+SESSION_IDLE_S = float(os.environ.get("POKER_SESSION_IDLE_S", "1800"))
+SESSION_SPILL_DIR = Path(os.environ.get("POKER_SESSION_SPILL_DIR", "data/sessions"))
+EVICT_EVERY_S = float(os.environ.get("POKER_SESSION_EVICT_EVERY_S", "60"))
+# stats() recomputes its gauges at most this often.
+STATS_TTL_S = float(os.environ.get("POKER_SESSION_STATS_TTL_S", "30"))
+# Sessions / snapshots measured per stats() refresh; bytes are extrapolated.
+_SIZE_SAMPLE = 16
+
+log = logging.getLogger(__name__)
+
+_SIZE_SKIP = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, types.CodeType)
+
+
+def approx_size(obj) -> int:
+    """Approximate bytes reachable from ``obj`` (classes and code excluded)."""
+    seen: set[int] = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        o = stack.pop()
+        if id(o) in seen or isinstance(o, _SIZE_SKIP):
+            continue
+        seen.add(id(o))
+        total += sys.getsizeof(o)
+        stack.extend(gc.get_referents(o))
+    return total
+
+
+class SessionStore(Protocol):
+    async def add(self, session: GameSession) -> None: ...
+    async def get(self, game_id: str) -> GameSession | None: ...
+    async def save(self, session: GameSession) -> None: ...
+    def lock(self, game_id: str): ...
+    async def remove(self, game_id: str) -> None: ...
+    async def evict_idle(self, now: float | None = None) -> list[str]: ...
+    async def stats(self) -> dict: ...
+
+
+def _sample(items: list) -> list:
+    return items if len(items) <= _SIZE_SAMPLE else random.sample(items, _SIZE_SAMPLE)
+
+
+def _estimate(total: int, sizes: list[int]) -> int:
+    """``total`` items' bytes, extrapolated from the measured ``sizes``."""
+    return round(sum(sizes) * total / len(sizes)) if sizes else 0
+
+
+def _live_bytes(sessions: list) -> int:
+    return _estimate(len(sessions), [approx_size(s) for s in _sample(sessions)])
+
+
+def _write_snapshot(path: Path, session: GameSession) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(session.encode())
+    os.replace(tmp, path)
+
+
+def _read_snapshot(path: Path) -> GameSession | None:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    return GameSession.decode(data)
+
 
 class SessionManager:
-    def __init__(self):
+    """In-process store: sessions live in a dict, locks are ``asyncio.Lock``s.
+
+    Idle sessions are spilled to ``spill_dir`` as ``<game_id>.pkgs``
+    snapshots and read back (and the file deleted) on the next ``get``;
+    concurrent ``get``s of one spilled game share a single decode. Locks are
+    held weakly: a game's entry lives as long as someone (a connected
+    socket, a queued save) holds or awaits it, so evicted and finished games
+    leave nothing behind.
+    """
+
+    def __init__(
+        self,
+        idle_s: float = SESSION_IDLE_S,
+        spill_dir: Path = SESSION_SPILL_DIR,
+        stats_ttl_s: float = STATS_TTL_S,
+    ):
+        self.idle_s = idle_s
+        self.spill_dir = Path(spill_dir)
+        self.stats_ttl_s = stats_ttl_s
         self._sessions: dict[str, GameSession] = {}
-        self._locks: dict[str, asyncio.Lock] = {}
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+        self._last_active: dict[str, float] = {}
+        self._loading: dict[str, asyncio.Future] = {}
+        self._stats: tuple[float, dict] | None = None
+
+    def _spill_path(self, game_id: str) -> Path:
+        return self.spill_dir / f"{game_id}.pkgs"
 
-    def add(self, session: GameSession) -> None:
+    async def add(self, session: GameSession) -> None:
         self._sessions[session.game_id] = session
-        self._locks[session.game_id] = asyncio.Lock()
+        self._last_active[session.game_id] = time.monotonic()
 
-    def get(self, game_id: str) -> GameSession | None:
-        return self._sessions.get(game_id)
+    async def get(self, game_id: str) -> GameSession | None:
+        session = self._sessions.get(game_id)
+        if session is None:
+            loading = self._loading.get(game_id)
+            if loading is None:
+                loading = self._loading[game_id] = asyncio.ensure_future(self._rehydrate(game_id))
+                loading.add_done_callback(lambda _: self._loading.pop(game_id, None))
+            session = await asyncio.shield(loading)
+        if session is not None:
+            self._last_active[game_id] = time.monotonic()
+        return session
+
+    async def save(self, session: GameSession) -> None:
+        """Nothing to persist (the registry holds the live object); marks activity."""
+        self._last_active[session.game_id] = time.monotonic()
 
     def lock(self, game_id: str) -> asyncio.Lock:
-        return self._locks.setdefault(game_id, asyncio.Lock())
+        lock = self._locks.get(game_id)
+        if lock is None:
+            lock = self._locks[game_id] = asyncio.Lock()
+        return lock
 
-    def remove(self, game_id: str) -> None:
+    async def remove(self, game_id: str) -> None:
         self._sessions.pop(game_id, None)
-        self._locks.pop(game_id, None)
+        self._last_active.pop(game_id, None)
+        self._spill_path(game_id).unlink(missing_ok=True)
+
+    async def evict_idle(self, now: float | None = None) -> list[str]:
+        """Spill sessions idle for ``idle_s`` to disk; returns their ids.
+
+        Sessions whose lock is held (a stream in flight) are skipped. The
+        others are encoded and written in a thread while this holds their
+        lock, so no handler advances a session as it is being spilled.
+        """
+        now = time.monotonic() if now is None else now
+        evicted = []
+        for game_id, session in list(self._sessions.items()):
+            if now - self._last_active.get(game_id, now) < self.idle_s:
+                continue
+            lock = self.lock(game_id)
+            if lock.locked():
+                continue
+            async with lock:  # free, so taken without yielding
+                await asyncio.to_thread(_write_snapshot, self._spill_path(game_id), session)
+                if self._sessions.get(game_id) is not session:
+                    self._spill_path(game_id).unlink(missing_ok=True)
+                    continue  # removed (game over) meanwhile
+                del self._sessions[game_id]
+                self._last_active.pop(game_id, None)
+            evicted.append(game_id)
+        return evicted
+
+    async def _rehydrate(self, game_id: str) -> GameSession | None:
+        path = self._spill_path(game_id)
+        session = await asyncio.to_thread(_read_snapshot, path)
+        if session is None or not path.exists():  # removed while decoding
+            return None
+        self._sessions[game_id] = session
+        path.unlink(missing_ok=True)
+        return session
+
+    async def stats(self) -> dict:
+        if self._stats is not None and time.monotonic() - self._stats[0] < self.stats_ttl_s:
+            return self._stats[1]
+        sessions = list(self._sessions.values())
+        stats = await asyncio.to_thread(self._measure, sessions)
+        self._stats = (time.monotonic(), stats)
+        return stats
+
+    def _measure(self, sessions: list) -> dict:
+        live_bytes = _live_bytes(sessions)
+        spilled = list(self.spill_dir.glob("*.pkgs")) if self.spill_dir.is_dir() else []
+        spilled_bytes = _estimate(len(spilled), [p.stat().st_size for p in _sample(spilled)])
+        return {
+            "live": len(sessions),
+            "spilled": len(spilled),
+            "live_bytes": live_bytes,
+            "spilled_bytes": spilled_bytes,
+            "total_bytes": live_bytes + spilled_bytes,
+        }
+
+
+# Compare-and-delete / compare-and-extend, so a holder whose lock expired
+# never releases or extends someone else's.
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+_EXTEND_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class RedisLock:
+    """Distributed per-game lock: ``SET key token NX PX ttl`` with polling.
+
+    While held, a background task keeps extending the TTL, so a long
+    animated stream never loses the lock, yet a crashed worker's lock still
+    expires after ``ttl_s``. One holder per object at a time, like
+    ``asyncio.Lock``. ``client`` is a ``redis.asyncio`` client: acquiring,
+    extending and releasing all await instead of blocking the loop.
+    """
+
+    def __init__(self, client, key: str, ttl_s: float = 30.0, poll_s: float = 0.05):
+        self._client = client
+        self._key = key
+        self._ttl_ms = int(ttl_s * 1000)
+        self._poll_s = poll_s
+        self._token: str | None = None
+        self._keepalive: asyncio.Task | None = None
+
+    async def __aenter__(self) -> RedisLock:
+        token = uuidlib.uuid4().hex
+        while not await self._client.set(self._key, token, nx=True, px=self._ttl_ms):
+            await asyncio.sleep(self._poll_s)
+        self._token = token
+        self._keepalive = asyncio.create_task(self._extend_forever(token))
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        # Stop the keepalive before releasing: an extend still in flight must
+        # not race the release script.
+        self._keepalive.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._keepalive
+        await self._client.eval(_RELEASE_SCRIPT, 1, self._key, self._token)
+        self._token = self._keepalive = None
+
+    async def _extend_forever(self, token: str) -> None:
+        while True:
+            await asyncio.sleep(self._ttl_ms / 3000)
+            await self._client.eval(_EXTEND_SCRIPT, 1, self._key, token, self._ttl_ms)
+
+
+class RedisSessionStore:
+    """Sessions as snapshots in Redis, with per-game distributed locks.
+
+    Each save bumps a per-game revision. Workers keep the sessions they have
+    decoded and reuse one while its revision is current, so a worker only
+    pays the replay (in a thread) again after another worker has advanced
+    that table. ``client`` is a ``redis.asyncio`` client.
+    """
+
+    def __init__(
+        self,
+        client,
+        prefix: str = "poker:session:",
+        ttl_s: int = SESSION_TTL_S,
+        lock_ttl_s: float = 30.0,
+        idle_s: float = SESSION_IDLE_S,
+        stats_ttl_s: float = STATS_TTL_S,
+    ):
+        self._client = client
+        self._prefix = prefix
+        self._ttl_s = ttl_s
+        self._lock_ttl_s = lock_ttl_s
+        self.idle_s = idle_s
+        self.stats_ttl_s = stats_ttl_s
+        self._local: dict[str, tuple[int, GameSession]] = {}
+        self._last_active: dict[str, float] = {}
+        self._stats: tuple[float, dict] | None = None
+
+    def _key(self, game_id: str, suffix: str) -> str:
+        return f"{self._prefix}{game_id}:{suffix}"
+
+    async def add(self, session: GameSession) -> None:
+        await self.save(session)
+
+    async def get(self, game_id: str) -> GameSession | None:
+        rev = await self._client.get(self._key(game_id, "rev"))
+        if rev is None:
+            self._local.pop(game_id, None)
+            return None
+        rev = int(rev)
+        self._last_active[game_id] = time.monotonic()
+        cached = self._local.get(game_id)
+        if cached is not None and cached[0] == rev:
+            return cached[1]
+        data = await self._client.get(self._key(game_id, "snapshot"))
+        if data is None:
+            return None
+        session = await asyncio.to_thread(GameSession.decode, data)
+        self._local[game_id] = (rev, session)
+        return session
+
+    async def save(self, session: GameSession) -> None:
+        game_id = session.game_id
+        rev_key = self._key(game_id, "rev")
+        # One MULTI/EXEC: the snapshot, its revision and their TTLs change together.
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(self._key(game_id, "snapshot"), session.encode(), ex=self._ttl_s)
+            pipe.incr(rev_key)
+            pipe.expire(rev_key, self._ttl_s)
+            _, rev, _ = await pipe.execute()
+        self._local[game_id] = (rev, session)
+        self._last_active[game_id] = time.monotonic()
+
+    def lock(self, game_id: str) -> RedisLock:
+        return RedisLock(self._client, self._key(game_id, "lock"), ttl_s=self._lock_ttl_s)
+
+    async def remove(self, game_id: str) -> None:
+        await self._client.delete(self._key(game_id, "snapshot"), self._key(game_id, "rev"))
+        self._local.pop(game_id, None)
+        self._last_active.pop(game_id, None)
+
+    async def evict_idle(self, now: float | None = None) -> list[str]:
+        """Drop idle sessions from this worker's cache (Redis keeps the snapshot)."""
+        now = time.monotonic() if now is None else now
+        evicted = [
+            game_id for game_id in self._local
+            if now - self._last_active.get(game_id, now) >= self.idle_s
+        ]
+        for game_id in evicted:
+            del self._local[game_id]
+            self._last_active.pop(game_id, None)
+        return evicted
+
+    async def stats(self) -> dict:
+        """Gauges for this worker's cache and the snapshots held in Redis.
+
+        Keys are counted with one ``SCAN``; sizes come from a sample.
+        """
+        if self._stats is not None and time.monotonic() - self._stats[0] < self.stats_ttl_s:
+            return self._stats[1]
+        cached = [session for _, session in self._local.values()]
+        live_bytes = await asyncio.to_thread(_live_bytes, cached)
+        snapshot_keys = [key async for key in self._client.scan_iter(match=f"{self._prefix}*:snapshot")]
+        sizes = [await self._client.strlen(key) for key in _sample(snapshot_keys)]
+        stored_bytes = _estimate(len(snapshot_keys), sizes)
+        stats = {
+            "live": len(cached),
+            "spilled": max(0, len(snapshot_keys) - len(cached)),
+            "live_bytes": live_bytes,
+            "spilled_bytes": stored_bytes,
+            "total_bytes": live_bytes + stored_bytes,
+        }
+        self._stats = (time.monotonic(), stats)
+        return stats
+
+
+async def run_evictor(store: SessionStore, every_s: float = EVICT_EVERY_S) -> None:
+    """Evict idle sessions from ``store`` every ``every_s`` seconds, forever.
+
+    Runs on the event loop, and stores hold a session's lock while spilling
+    it, so no WS handler can advance a session between the idle check and
+    its removal.
+    """
+    while True:
+        await asyncio.sleep(every_s)
+        try:
+            evicted = await store.evict_idle()
+        except Exception:
+            log.exception("idle session eviction failed")
+            continue
+        if evicted:
+            log.info("evicted %d idle sessions", len(evicted))
+
+
+def create_store(kind: str = SESSION_STORE) -> SessionStore:
+    """The store named by ``kind`` (``"memory"`` or ``"redis"``)."""
+    if kind == "memory":
+        return SessionManager()
+    if kind == "redis":
+        import redis.asyncio
+
+        return RedisSessionStore(redis.asyncio.Redis.from_url(REDIS_URL))
+    raise ValueError(f"unknown session store {kind!r}")
 
 
-# Process-wide manager instance.
-manager = SessionManager()
+# Process-wide store instance.
+manager = create_store()
@@ -4,6 +4,11 @@ The browser must only ever see:
   - public table info (names, stacks, states, bets, board, pot, positions),
   - the hero's own hole cards,
   - opponents' hole cards ONLY at a real showdown.
+
+Views go out either as full snapshots or, for clients that negotiate it, as
+diffs against the previous view (``ViewEncoder``): only changed seat fields
+and changed top-level keys (board, pot, street, ...), with a full keyframe at
+every new hand and every ``KEYFRAME_INTERVAL`` views.
 """
 
 from __future__ import annotations
@@ -38,8 +43,13 @@ def build_view(
     board: list[str],
     hero_hole_override: list[str] | None = None,
     community_override: list[str] | None = None,
+    version: int = 0,
 ) -> dict:
-    """Build the full frontend view dict from live (or final) game state."""
+    """Build the full frontend view dict from live (or final) game state.
+
+    ``version`` is stamped on the view so a diff can name the view it
+    applies to.
+    """
     n = len(config.seats)
     hero_hole = hero_hole_override if hero_hole_override is not None else hero_hole
     community = community_override if community_override is not None else board
@@ -102,6 +112,7 @@ def build_view(
         actor_seat = pk_to_seat[state.actor_index]
 
     return {
+        "version": version,
         "street": _STREET_NAMES.get(current_street_index, "preflop"),
         "community_card": list(community),
         "pot": pot_with_uuids,
@@ -113,6 +124,78 @@ def build_view(
     }
 
 
+# A keyframe is forced after this many consecutive diffs, bounding how long a
+# client that misapplied one diff can drift.
+KEYFRAME_INTERVAL = 20
+
+
+def diff_view(prev: dict, view: dict) -> dict | None:
+    """Encode ``view`` as changes against ``prev``, or None if not diffable.
+
+    The diff is ``{"base": prev version, "version": ..., "changes": {key:
+    value}, "seats": [{"pos": i, field: value, ...}]}``: changed top-level
+    keys are sent whole (the board and pot are small), seats only carry the
+    fields that changed.
+    """
+    prev_seats, seats = prev.get("seats", []), view.get("seats", [])
+    if not prev_seats or len(prev_seats) != len(seats):
+        return None
+    changes = {
+        key: value for key, value in view.items()
+        if key not in ("version", "seats") and prev.get(key) != value
+    }
+    seat_changes = []
+    for old, new in zip(prev_seats, seats):
+        fields = {key: value for key, value in new.items() if old.get(key) != value}
+        if fields:
+            seat_changes.append({"pos": new["pos"], **fields})
+    return {"base": prev.get("version"), "version": view.get("version"), "changes": changes, "seats": seat_changes}
+
+
+def apply_view_diff(prev: dict, diff: dict) -> dict:
+    """Rebuild the full view from ``prev`` and a ``diff_view`` result."""
+    if prev.get("version") != diff["base"]:
+        raise ValueError(f"view diff is against version {diff['base']}, not {prev.get('version')}")
+    seats = [dict(seat) for seat in prev["seats"]]
+    for change in diff["seats"]:
+        seats[change["pos"]].update(change)
+    return {**prev, **diff["changes"], "version": diff["version"], "seats": seats}
+
+
+class ViewEncoder:
+    """Per-connection encoder: turns each outgoing view into a diff or keyframe.
+
+    ``encode`` returns ``("view", view)`` for a keyframe and
+    ``("view_diff", diff)`` otherwise. Keyframes go out for the first view,
+    on every new hand (so per-hand client state such as revealed hole cards
+    is reset), when the seat list changes shape, and every
+    ``KEYFRAME_INTERVAL`` views.
+    """
+
+    def __init__(self, keyframe_interval: int = KEYFRAME_INTERVAL):
+        self.keyframe_interval = keyframe_interval
+        self._last: dict | None = None
+        self._since_keyframe = 0
+
+    def reset(self) -> None:
+        """Forget the client's view; the next ``encode`` is a keyframe."""
+        self._last = None
+
+    def encode(self, view: dict) -> tuple[str, dict]:
+        last, self._last = self._last, view
+        if (
+            last is not None
+            and self._since_keyframe < self.keyframe_interval
+            and last.get("round_count") == view.get("round_count")
+        ):
+            diff = diff_view(last, view)
+            if diff is not None:
+                self._since_keyframe += 1
+                return "view_diff", diff
+        self._since_keyframe = 0
+        return "view", view
+
+
 def build_round_state(
     *,
     config: GameConfig,
@@ -9,7 +9,9 @@ Completed games are persisted with the existing PerspectiveRecorder.
 
 from __future__ import annotations
 
+import json
 import random
+import struct
 import uuid as uuidlib
 from datetime import datetime
 
@@ -20,6 +22,7 @@ from poker_engine.bots.styles import STYLE_REGISTRY
 from poker_engine.bots.llm_styles import LLM_STYLE_REGISTRY
 from poker_engine.config import GameConfig, SeatKind
 from poker_engine.recorder import PerspectiveRecorder
+from poker_engine.replay import ReplayLog, ReplayScript, ReplayStop, ScriptedPlayer
 from poker_trainer.game.serialize import build_round_state, build_view
 
 # Automations that fire without any explicit call:
@@ -49,17 +52,37 @@ _STREET_NAMES = {0: "preflop", 1: "flop", 2: "turn", 3: "river"}
 _BOARD_CARDS_PER_STREET = {1: 3, 2: 1, 3: 1}
 
 
+# GameSession.encode(): magic, version, 4-byte header length, JSON header, replay log.
+_SNAPSHOT_MAGIC = b"PKGS"
+_SNAPSHOT_VERSION = 1
+
+
 class GameSession:
-    def __init__(self, config: GameConfig, hero_index: int = 0, seed: int | None = None):
+    def __init__(
+        self,
+        config: GameConfig,
+        hero_index: int = 0,
+        seed: int | None = None,
+        *,
+        game_id: str | None = None,
+        seat_uuids: list[str] | None = None,
+        deal_seed: int | None = None,
+    ):
         config.validate()
         self.config = config
-        self.game_id = str(uuidlib.uuid4())
+        self.game_id = game_id or str(uuidlib.uuid4())
         self.hero_index = hero_index
         self.seed = seed
-        self._rng = random.Random(seed)
+        # The deal is always seeded so the game can be rebuilt from its replay log.
+        # ``deal_seed`` is only passed when restoring one; bots keep ``seed``.
+        if deal_seed is None:
+            deal_seed = seed if seed is not None else random.getrandbits(64)
+        self.deal_seed = deal_seed
+        self._rng = random.Random(self.deal_seed)
+        self.replay_log = ReplayLog(self.deal_seed, config, hero_index=hero_index)
 
         n = len(config.seats)
-        self.seat_uuids: list[str] = [
+        self.seat_uuids: list[str] = list(seat_uuids) if seat_uuids else [
             f"seat-{i}-{uuidlib.uuid4().hex[:8]}" for i in range(n)
         ]
         self.hero_uuid = self.seat_uuids[hero_index]
@@ -115,6 +138,7 @@ class GameSession:
         self.finished = False
         self._pending_ask: dict | None = None
         self._last_view: dict | None = None
+        self._view_version = 0
         self.preflop_quick: list[float] = [2.0, 2.5, 3.0, 4.0]
         self.postflop_quick: list[float] = [33.0, 50.0, 75.0, 100.0]
 
@@ -135,6 +159,82 @@ class GameSession:
         """Begin the first hand and advance to the first hero decision."""
         return self._start_hand()
 
+    @classmethod
+    def from_replay(cls, log: ReplayLog, hand: int | None = None, action: int = 0, **kwargs) -> GameSession:
+        """Rebuild a session by re-applying ``log`` up to ``(hand, action)``.
+
+        Neither bots nor the client are consulted, so views can be
+        regenerated in milliseconds, e.g. after a crash. The session is left
+        at the first decision past the target: either awaiting the hero
+        (``pending_ask``) or at a bot's turn, which the next ``_advance()``
+        plays. Bots are seeded from ``seed`` if given, else from the deal
+        seed. ``kwargs`` (``seed``, ``game_id``, ``seat_uuids``) are passed
+        to the constructor.
+        """
+        kwargs.setdefault("seed", log.seed)
+        session = cls(log.config, hero_index=log.hero_index, deal_seed=log.seed, **kwargs)
+        script = ReplayScript(log, hand, action)
+        live_bots = session._bot_players
+        session._bot_players = {i: ScriptedPlayer(script) for i in live_bots}
+        try:
+            session.start()
+            while not script.done and session.pending_ask() is not None:
+                session.apply_hero_action(*script.next())
+        except ReplayStop:
+            pass
+        finally:
+            session._bot_players = live_bots
+        return session
+
+    def encode(self) -> bytes:
+        """Serialize the session compactly for a session store.
+
+        Only what cannot be replayed is stored beside the replay log (config,
+        deal seed and every applied action): the table's identity, the
+        recorder's persistence bookmarks and the client preferences.
+        ``decode`` re-applies the log to rebuild the PokerKit state.
+        """
+        header = json.dumps({
+            "game_id": self.game_id,
+            "seed": self.seed,
+            "seat_uuids": self.seat_uuids,
+            "started": self._last_view is not None,
+            "started_at": self.started_at.isoformat(),
+            "db_game_id": None if self.recorder._game_id is None else str(self.recorder._game_id),
+            "persisted_rounds": sorted(self.recorder._persisted_rounds),
+            "view_version": self._view_version,
+            "preflop_quick": self.preflop_quick,
+            "postflop_quick": self.postflop_quick,
+        }, separators=(",", ":")).encode()
+        return (
+            _SNAPSHOT_MAGIC + bytes([_SNAPSHOT_VERSION]) + struct.pack(">I", len(header))
+            + header + self.replay_log.encode()
+        )
+
+    @classmethod
+    def decode(cls, data: bytes) -> GameSession:
+        """Rebuild a session from ``encode`` output, at the same decision point."""
+        if data[:4] != _SNAPSHOT_MAGIC or len(data) < 9:
+            raise ValueError("not a game session snapshot")
+        if data[4] != _SNAPSHOT_VERSION:
+            raise ValueError(f"unsupported game session snapshot version {data[4]}")
+        (size,) = struct.unpack(">I", data[5:9])
+        header = json.loads(data[9:9 + size])
+        log = ReplayLog.decode(data[9 + size:])
+        identity = {"seed": header["seed"], "game_id": header["game_id"], "seat_uuids": header["seat_uuids"]}
+        if header["started"]:
+            session = cls.from_replay(log, **identity)
+        else:
+            session = cls(log.config, hero_index=log.hero_index, deal_seed=log.seed, **identity)
+        session.started_at = datetime.fromisoformat(header["started_at"])
+        if header["db_game_id"] is not None:
+            session.recorder._game_id = uuidlib.UUID(header["db_game_id"])
+        session.recorder._persisted_rounds = set(header["persisted_rounds"])
+        session._view_version = max(session._view_version, header["view_version"])
+        session.preflop_quick = header["preflop_quick"]
+        session.postflop_quick = header["postflop_quick"]
+        return session
+
     def start_gen(self):
         """Generator version of start(): deal cards, yield initial view, then advance step by step."""
         return self._start_hand_gen()
@@ -197,8 +297,11 @@ class GameSession:
         )
 
         # Shuffle and deal hole cards
-        deck = list(self._state.deck_cards)
+        # PokerKit pre-shuffles deck_cards with the global random module; sort
+        # them first so the deal depends only on our seed.
+        deck = sorted(self._state.deck_cards, key=pk_adapter.card_id)
         self._rng.shuffle(deck)
+        self.replay_log.start_hand()
         card_idx = 0
         for _ in range(2):
             for i in range(n_active):
@@ -276,8 +379,11 @@ class GameSession:
             player_count=n_active,
         )
 
-        deck = list(self._state.deck_cards)
+        # PokerKit pre-shuffles deck_cards with the global random module; sort
+        # them first so the deal depends only on our seed.
+        deck = sorted(self._state.deck_cards, key=pk_adapter.card_id)
         self._rng.shuffle(deck)
+        self.replay_log.start_hand()
         card_idx = 0
         for _ in range(2):
             for _ in range(n_active):
@@ -435,6 +541,7 @@ class GameSession:
         self._action_histories.setdefault(street, []).append(
             {"uuid": uuid_, "action": action, "amount": amount, "stack_after": stack_after}
         )
+        self.replay_log.record(action, amount)
 
     def _finish_hand(self) -> list[dict]:
         """Emit round_finish event, update stacks, record, maybe start next hand."""
@@ -546,6 +653,7 @@ class GameSession:
     # -- view / serialization ------------------------------------------------
 
     def _build_view(self, hero_hole_override: list[str] | None = None, community_override: list[str] | None = None) -> dict:
+        self._view_version += 1
         return build_view(
             config=self.config,
             state=self._state,
@@ -565,6 +673,7 @@ class GameSession:
             board=self._board,
             hero_hole_override=hero_hole_override,
             community_override=community_override,
+            version=self._view_version,
         )
 
     def _build_valid_actions(self, pk_index: int) -> list[dict]:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -9,8 +11,11 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 
+from poker_engine import equity_pool
 from poker_trainer.api import auth, coach, game_evaluation, games, profile
 from poker_trainer.auth import config as auth_config
+from poker_trainer.game.manager import manager, run_evictor
+from poker_trainer.save_queue import save_queue
 from poker_trainer.ws import router as ws_router
 from shared_services.logging_config import configure_logging
 
@@ -18,7 +23,26 @@ configure_logging()
 
 STATIC_DIR = Path(__file__).parent / "static"
 
-app = FastAPI(title="Poker Trainer")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Bot equity runs in worker processes for the app's lifetime, so
+    # concurrent tables spread across cores instead of sharing the GIL.
+    equity_pool.start_pool()
+    # Abandoned tables are spilled out of memory after an idle timeout.
+    evictor = asyncio.create_task(run_evictor(manager))
+    try:
+        yield
+    finally:
+        evictor.cancel()
+        with suppress(asyncio.CancelledError):
+            await evictor
+        await save_queue.drain()
+        await save_queue.stop()
+        equity_pool.shutdown_pool()
+
+
+app = FastAPI(title="Poker Trainer", lifespan=lifespan)
 
 # Signed, httpOnly cookie session that holds the logged-in user id.
 app.add_middleware(
@@ -42,6 +66,18 @@ def healthz() -> dict:
     return {"status": "ok"}
 
 
+@app.get("/metrics/sessions")
+async def session_metrics() -> dict:
+    """Live/spilled session counts and bytes, for sizing web nodes."""
+    return await manager.stats()
+
+
+@app.get("/metrics/saves")
+def save_metrics() -> dict:
+    """Write-behind save queue depth, lag and outcome counters."""
+    return save_queue.stats()
+
+
 # Serve the single-page app. Static assets live under /static; the SPA shell is
 # returned for the root so the client-side hash router can take over.
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
@@ -0,0 +1,150 @@
+"""Write-behind queue for mid-game saves.
+
+Saving a finished hand (persist + per-game stats) is blocking DB work. The WS
+handler submits it here instead of running it inline: worker tasks take the
+game's lock (so the session cannot advance mid-write), re-read the session
+from the store, run the save in a thread, store the session again (it now
+knows its DB game id) and hand the result to the submitter's callback (ws.py
+pushes ``stats_update`` from it).
+
+Saves for a game still waiting in the queue are coalesced: the latest job
+replaces the earlier one and every callback fires once it completes.
+``stats()`` exposes queue depth and lag.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from poker_trainer.game.manager import SessionStore, manager
+
+log = logging.getLogger(__name__)
+
+SAVE_WORKERS = int(os.environ.get("POKER_SAVE_WORKERS", "2"))
+
+
+@dataclass
+class _Pending:
+    job: Callable[[object], object]
+    callbacks: list[Callable[[object], Awaitable[None]]] = field(default_factory=list)
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class SaveQueue:
+    """Per-process write-behind queue over a session store, one entry per game.
+
+    Workers start lazily on the running event loop at the first ``submit``.
+    """
+
+    def __init__(self, store: SessionStore, workers: int = SAVE_WORKERS):
+        self._store = store
+        self._n_workers = max(1, workers)
+        self._pending: dict[str, _Pending] = {}
+        self._queue: asyncio.Queue | None = None
+        self._workers: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.saved = 0
+        self.coalesced = 0
+        self.failed = 0
+        self.last_lag_s = 0.0
+        self.max_lag_s = 0.0
+
+    def _ensure_workers(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        for game_id in self._pending:
+            self._queue.put_nowait(game_id)
+        self._workers = [loop.create_task(self._work()) for _ in range(self._n_workers)]
+
+    def submit(
+        self,
+        game_id: str,
+        job: Callable[[object], object],
+        on_done: Callable[[object], Awaitable[None]] | None = None,
+    ) -> None:
+        """Queue ``job(session)`` (blocking, run in a thread) for ``game_id``.
+
+        ``on_done(result)`` is awaited on the event loop, still under the
+        game's lock, once the write completes. Nothing runs if the game has
+        left the store by then.
+        """
+        self._ensure_workers()
+        pending = self._pending.get(game_id)
+        if pending is None:
+            self._pending[game_id] = _Pending(job, [on_done] if on_done else [])
+            self._queue.put_nowait(game_id)
+            return
+        pending.job = job
+        if on_done:
+            pending.callbacks.append(on_done)
+        self.coalesced += 1
+
+    def discard(self, game_id: str) -> None:
+        """Drop a queued (not yet started) save; its callbacks never fire."""
+        self._pending.pop(game_id, None)
+
+    async def drain(self) -> None:
+        """Wait until every queued save has been written."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._loop = None
+
+    async def _work(self) -> None:
+        while True:
+            game_id = await self._queue.get()
+            try:
+                if game_id not in self._pending:
+                    continue  # discarded
+                async with self._store.lock(game_id):
+                    # Popped only now: saves submitted while the lock was
+                    # held elsewhere coalesced into this one.
+                    pending = self._pending.pop(game_id, None)
+                    session = await self._store.get(game_id)
+                    if pending is None or session is None:
+                        continue  # discarded, or finished and removed meanwhile
+                    result = await asyncio.to_thread(pending.job, session)
+                    await self._store.save(session)
+                    lag = time.monotonic() - pending.enqueued_at
+                    self.saved += 1
+                    self.last_lag_s = lag
+                    self.max_lag_s = max(self.max_lag_s, lag)
+                    for callback in pending.callbacks:
+                        try:
+                            await callback(result)
+                        except Exception:
+                            log.exception("save callback failed for game %s", game_id)
+            except Exception:
+                self.failed += 1
+                log.exception("queued save failed for game %s", game_id)
+            finally:
+                self._queue.task_done()
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        oldest = min((p.enqueued_at for p in list(self._pending.values())), default=None)
+        return {
+            "depth": len(self._pending),
+            "oldest_wait_s": 0.0 if oldest is None else now - oldest,
+            "last_lag_s": self.last_lag_s,
+            "max_lag_s": self.max_lag_s,
+            "saved": self.saved,
+            "coalesced": self.coalesced,
+            "failed": self.failed,
+        }
+
+
+save_queue = SaveQueue(manager)
@@ -72,12 +72,12 @@
     wireCoachBtns(null);
     const list = document.getElementById("games-list");
     try {
-      const games = await api("/api/games");
+      const { games } = await api("/api/games?limit=5");
       if (!games.length) {
         list.innerHTML = `<p class="muted">No games yet — finish a game and it will appear here.</p>`;
       } else {
         list.innerHTML = "";
-        games.slice(0, 5).forEach((g) => list.appendChild(gameRow(g)));
+        games.forEach((g) => list.appendChild(gameRow(g)));
       }
     } catch (e) {
       list.innerHTML = `<p class="error">Could not load games: ${e.message}</p>`;
@@ -168,18 +168,39 @@
     loadUnviewedBanner();
     const list = document.getElementById("history-list");
     try {
-      const games = await api("/api/games");
-      if (!games.length) {
+      const page = await api("/api/games");
+      if (!page.games.length) {
         list.innerHTML = `<p class="muted">No games yet — finish a game and it will appear here.</p>`;
       } else {
         list.innerHTML = "";
-        games.forEach((g) => list.appendChild(gameRow(g)));
+        appendGamePage(list, page);
       }
     } catch (e) {
       list.innerHTML = `<p class="error">Could not load games: ${e.message}</p>`;
     }
   }
 
+  // Append one page of games, plus a "Load more" button while older pages remain.
+  function appendGamePage(list, page) {
+    page.games.forEach((g) => list.appendChild(gameRow(g)));
+    if (!page.next_cursor) return;
+    const more = document.createElement("button");
+    more.className = "btn ghost tiny";
+    more.textContent = "Load more";
+    more.onclick = async () => {
+      more.disabled = true;
+      try {
+        const next = await api("/api/games?cursor=" + encodeURIComponent(page.next_cursor));
+        more.remove();
+        appendGamePage(list, next);
+      } catch (e) {
+        more.disabled = false;
+        alert("Could not load games: " + e.message);
+      }
+    };
+    list.appendChild(more);
+  }
+
   function titleCase(s) { return s ? s[0].toUpperCase() + s.slice(1) : s; }
 
   // Hero's stats for this game, plus a comparison line against the hero's
@@ -417,53 +438,80 @@
     const list = document.getElementById("hands-list");
     loadGameStats(gameId);
     let data;
-    try { data = await api("/api/games/" + gameId + "/hands"); }
-    catch (e) {
+    try {
+      // The list is paged by round; a deep link to a later hand asks for a
+      // first page long enough to include it.
+      const limit = Math.min(500, Math.max(100, autoRound || 0));
+      data = await api(`/api/games/${gameId}/hands?limit=${limit}`);
+    } catch (e) {
       list.innerHTML = `<p class="error">Could not load game: ${e.message}</p>`;
       return;
     }
-    wireEvaluateButton(gameId, data.hands.length);
+    wireEvaluateButton(gameId, data.num_hands);
     if (!data.hands.length) {
       list.innerHTML = `<p class="muted">This game has no recorded hands.</p>`;
       return;
     }
 
-    let activeRow = null;
     list.innerHTML = "";
-    data.hands.forEach((h) => {
-      const row = document.createElement("button");
-      row.className = "list-row";
-      const result = h.hero_amount ? netHTML(h.hero_amount) : `<span class="muted">—</span>`;
-      row.innerHTML =
-        `<span class="lr-main">Hand #${h.round_count}</span>` +
-        `<span class="lr-meta muted tiny">${titleCase(h.street_reached)} · pot ${h.pot_total.toLocaleString()}</span>` +
-        `<span class="lr-net">${result}</span>`;
-      row.dataset.round = h.round_count;
-      row.onclick = () => {
-        if (activeRow) activeRow.classList.remove("active");
-        row.classList.add("active");
-        activeRow = row;
-        loadHandDetail(gameId, h.round_count);
-        // Fetch hand context for coach and load it into the global coach panel.
-        api(`/api/games/${gameId}/hands/${h.round_count}/context`)
-          .then((ctx) => {
-            if (_globalCoach && ctx && ctx.context) {
-              _globalCoach.setHandContext(gameId, h.round_count, ctx.context, ctx.hand_id);
-            }
-          })
-          .catch(() => {});
-      };
-      list.appendChild(row);
-    });
+    appendHandPage(list, gameId, data);
 
     // Auto-select first hand (or a specific round passed in).
     const targetRound = autoRound || data.hands[0].round_count;
-    const target = list.querySelector(`[data-round="${targetRound}"]`);
+    const target = list.querySelector(`[data-round="${targetRound}"]`)
+      || list.querySelector(".list-row");
     if (target) target.click();
 
     wireCoachBtns(gameId);
   }
 
+  // Append one page of hands, plus a "Load more" button while later rounds remain.
+  function appendHandPage(list, gameId, page) {
+    page.hands.forEach((h) => list.appendChild(handRow(list, gameId, h)));
+    if (page.next_cursor === null) return;
+    const more = document.createElement("button");
+    more.className = "btn ghost tiny";
+    more.textContent = "Load more";
+    more.onclick = async () => {
+      more.disabled = true;
+      try {
+        const next = await api(`/api/games/${gameId}/hands?cursor=${page.next_cursor}`);
+        more.remove();
+        appendHandPage(list, gameId, next);
+      } catch (e) {
+        more.disabled = false;
+        alert("Could not load hands: " + e.message);
+      }
+    };
+    list.appendChild(more);
+  }
+
+  // A clickable hand row; selecting it shows the hand and loads it into the coach.
+  function handRow(list, gameId, h) {
+    const row = document.createElement("button");
+    row.className = "list-row";
+    const result = h.hero_amount ? netHTML(h.hero_amount) : `<span class="muted">—</span>`;
+    row.innerHTML =
+      `<span class="lr-main">Hand #${h.round_count}</span>` +
+      `<span class="lr-meta muted tiny">${titleCase(h.street_reached)} · pot ${h.pot_total.toLocaleString()}</span>` +
+      `<span class="lr-net">${result}</span>`;
+    row.dataset.round = h.round_count;
+    row.onclick = () => {
+      list.querySelectorAll(".list-row.active").forEach((r) => r.classList.remove("active"));
+      row.classList.add("active");
+      loadHandDetail(gameId, h.round_count);
+      // Fetch hand context for coach and load it into the global coach panel.
+      api(`/api/games/${gameId}/hands/${h.round_count}/context`)
+        .then((ctx) => {
+          if (_globalCoach && ctx && ctx.context) {
+            _globalCoach.setHandContext(gameId, h.round_count, ctx.context, ctx.hand_id);
+          }
+        })
+        .catch(() => {});
+    };
+    return row;
+  }
+
   // Render a player name with optional position badge.
   function pnameHTML(name, isHero, pos) {
     const label = isHero ? "you" : name;
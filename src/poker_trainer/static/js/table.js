@@ -81,6 +81,7 @@
       this.seatPos = null;
       this.heroUuid = null;
       this.lastView = null;
+      this.baseView = null;     // last full server view, the base for view diffs
       this.validActions = null;
       this.bigBlind = 0;
       this.preflopQuick = [];   // [N, ...] big-blind multiples
@@ -136,7 +137,9 @@
 
     connect() {
       const proto = location.protocol === "https:" ? "wss" : "ws";
-      this.ws = new WebSocket(`${proto}://${location.host}${this.wsUrl}`);
+      // Ask for view diffs; the server falls back to full views without this.
+      const sep = this.wsUrl.includes("?") ? "&" : "?";
+      this.ws = new WebSocket(`${proto}://${location.host}${this.wsUrl}${sep}views=delta`);
       this.ws.onmessage = (e) => this.onMessage(JSON.parse(e.data));
       this.ws.onclose = () => this.setMessage("Disconnected.");
     }
@@ -148,11 +151,12 @@
           this.preflopQuick = msg.config.preflop_quick || [];
           this.postflopQuick = msg.config.postflop_quick || [];
         }
+        this.baseView = msg.view ? structuredClone(msg.view) : null;
         if (msg.view) this.render(msg.view);
         if (msg.pending_ask) this.onAsk(msg.pending_ask);
         return;
       }
-      if (msg.type === "event") return this.onEvent(msg.event);
+      if (msg.type === "event") return this.onEvent(this.resolveView(msg.event));
       if (msg.type === "stats_update") {
         this.serverStats = msg.stats;
         this.renderStats();
@@ -166,6 +170,29 @@
       if (msg.type === "error") this.setMessage(msg.message);
     }
 
+    // Turn a view_diff back into a full view against baseView. render() and
+    // revealShowdown() mutate the views they get, so baseView stays a copy.
+    resolveView(ev) {
+      if (ev.view) {
+        this.baseView = structuredClone(ev.view);
+      } else if (ev.view_diff) {
+        const diff = ev.view_diff;
+        if (!this.baseView || this.baseView.version !== diff.base) {
+          // Lost the chain: drop diffs until the server sends a keyframe.
+          if (this.baseView && this.ws && this.ws.readyState === 1) {
+            this.ws.send(JSON.stringify({ type: "resync" }));
+          }
+          this.baseView = null;
+          return ev;
+        }
+        const seats = this.baseView.seats.map((s) => ({ ...s }));
+        diff.seats.forEach((c) => Object.assign(seats[c.pos], c));
+        this.baseView = { ...this.baseView, ...diff.changes, version: diff.version, seats };
+        ev.view = structuredClone(this.baseView);
+      }
+      return ev;
+    }
+
     onEvent(ev) {
       switch (ev.type) {
         case "to_act":
@@ -541,6 +568,7 @@
     // ---- stats & hand history ----
     recordHand(ev) {
       const v = ev.view;
+      if (!v) return;
       const board = (v.community_card || []).slice();
       const hero = v.seats.find((s) => s.is_hero);
       const winnerNames = (ev.winners || []).map((w) => {
@@ -5,12 +5,15 @@ from __future__ import annotations
 import asyncio
 import functools
 import logging
+import os
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from poker_engine import stats as stats_engine
 from poker_engine.db.base import SessionLocal
 from poker_trainer.game.manager import manager
+from poker_trainer.game.serialize import ViewEncoder
+from poker_trainer.save_queue import save_queue
 
 router = APIRouter()
 log = logging.getLogger(__name__)
@@ -18,6 +21,10 @@ log = logging.getLogger(__name__)
 # Delay between streamed events so bot actions animate sequentially in the UI.
 EVENT_DELAY_S = 0.45
 
+# Compute bot decisions ahead while the client animates (see _stream_pipelined);
+# POKER_WS_PIPELINE=0 restores strictly sequential compute-then-sleep.
+PIPELINE_EVENTS = os.environ.get("POKER_WS_PIPELINE", "1") != "0"
+
 
 def _ended_a_hand(events: list[dict]) -> bool:
     """True if a streamed batch contained a finished hand (a round_finish)."""
@@ -51,141 +58,276 @@ def _save_soft(session) -> dict | None:
         return None
 
 
+def _init_message(session, encoder: ViewEncoder | None) -> dict:
+    """The (re)connect snapshot; always a full view, which keyframes ``encoder``."""
+    view = session.current_view()
+    if encoder is not None:
+        encoder.reset()
+        encoder.encode(view)
+    return {
+        "type": "init",
+        "views": "full" if encoder is None else "delta",
+        "config": session.table_config(),
+        "view": view,
+        "pending_ask": session.pending_ask(),
+    }
+
+
+def _event_message(event: dict, encoder: ViewEncoder | None) -> dict:
+    """Wrap an engine event, replacing its view with a diff where possible."""
+    view = event.get("view")
+    if encoder is None or view is None:
+        return {"type": "event", "event": event}
+    kind, payload = encoder.encode(view)
+    if kind == "view":
+        return {"type": "event", "event": event}
+    event = {key: value for key, value in event.items() if key != "view"}
+    event["view_diff"] = payload
+    return {"type": "event", "event": event}
+
+
 @router.websocket("/ws/games/{game_id}")
 async def play(websocket: WebSocket, game_id: str) -> None:
+    """Play loop. Clients that connect with ``?views=delta`` get view diffs
+    (``view_diff`` in place of ``view``) after the full ``init`` view; all
+    others keep receiving a full view with every event.
+    """
     await websocket.accept()
-    session = manager.get(game_id)
+    session = await manager.get(game_id)
     if session is None:
         await websocket.send_json({"type": "error", "message": "Game not found."})
         await websocket.close()
         return
 
     lock = manager.lock(game_id)
+    encoder = ViewEncoder() if websocket.query_params.get("views") == "delta" else None
 
     try:
         # On (re)connect: send current state, then either the pending hero ask or,
         # if the game hasn't been advanced yet, start it.
+        stream = None
         async with lock:
+            # Re-read under the lock: with a shared store another worker may
+            # have advanced this table since the lookup above.
+            session = await manager.get(game_id) or session
             first_connect = session._last_view is None and not session.finished
             if first_connect:
-                gen = session.start_gen()
-                # Consume the first batch in a thread: this is where the deck is
-                # shuffled, cards dealt, and _last_view populated.
-                first_batch = await asyncio.to_thread(lambda: next(gen, None))
-                await websocket.send_json({
-                    "type": "init",
-                    "config": session.table_config(),
-                    "view": session.current_view(),
-                    "pending_ask": session.pending_ask(),
-                })
-                if first_batch:
-                    for event in first_batch:
-                        await websocket.send_json({"type": "event", "event": event})
-                    await asyncio.sleep(0.8)  # let the dealt-cards view settle
-                hand_ended = await _stream_gen(websocket, gen)
+                try:
+                    gen = session.start_gen()
+                    # Consume the first batch in a thread: this is where the deck is
+                    # shuffled, cards dealt, and _last_view populated.
+                    first_batch = await asyncio.to_thread(lambda: next(gen, None))
+                    await websocket.send_json(_init_message(session, encoder))
+                    if first_batch:
+                        for event in first_batch:
+                            await websocket.send_json(_event_message(event, encoder))
+                        await asyncio.sleep(0.8)  # let the dealt-cards view settle
+                    stream = _Stream(websocket, gen, encoder)
+                    await stream.wait_computed()
+                finally:
+                    await _save_progress(websocket, session, stream)
             else:
-                await websocket.send_json({
-                    "type": "init",
-                    "config": session.table_config(),
-                    "view": session.current_view(),
-                    "pending_ask": session.pending_ask(),
-                })
-                hand_ended = False
-            if hand_ended:
-                hero_stats = _save_soft(session)
-                if hero_stats is not None:
-                    await websocket.send_json({"type": "stats_update", "stats": hero_stats})
-            if session.finished:
+                await websocket.send_json(_init_message(session, encoder))
+        if stream is not None:
+            await stream.sent
+        if session.finished:
+            async with lock:
                 await _finish(websocket, session, game_id)
-                return
+            return
 
         while True:
             msg = await websocket.receive_json()
+            if msg.get("type") == "resync":
+                # The client lost track of the diff chain: send a fresh keyframe.
+                async with lock:
+                    session = await manager.get(game_id) or session
+                    await websocket.send_json(_init_message(session, encoder))
+                continue
             if msg.get("type") != "action":
                 continue
             action = msg.get("action", "call")
             amount = int(msg.get("amount", 0) or 0)
 
+            stream = None
             async with lock:
-                if session.finished:
+                session = await manager.get(game_id)
+                if session is None or session.finished:
                     break
-                gen = await asyncio.to_thread(
-                    functools.partial(session.apply_hero_action_gen, action, amount)
-                )
-                hand_ended = await _stream_gen(websocket, gen)
-                if hand_ended:
-                    hero_stats = _save_soft(session)
-                    if hero_stats is not None:
-                        await websocket.send_json({"type": "stats_update", "stats": hero_stats})
-                if session.finished:
+                try:
+                    gen = await asyncio.to_thread(
+                        functools.partial(session.apply_hero_action_gen, action, amount)
+                    )
+                    stream = _Stream(websocket, gen, encoder)
+                    await stream.wait_computed()
+                finally:
+                    await _save_progress(websocket, session, stream)
+            # The lock is free while the client animates (pipelined streams).
+            await stream.sent
+            if session.finished:
+                async with lock:
                     await _finish(websocket, session, game_id)
-                    break
+                break
     except WebSocketDisconnect:
-        # Leave the session in memory so the client can reconnect and resume.
-        # Completed hands are already saved by the per-hand hook above.
+        # Leave the session in the store so the client can reconnect and resume.
+        # Hands completed before or during the drop were queued by _save_progress.
         return
 
 
-async def _stream(websocket: WebSocket, events: list[dict]) -> None:
-    """Send events to the browser, pacing non-terminal ones for animation."""
-    for event in events:
-        await websocket.send_json({"type": "event", "event": event})
-        if event["type"] == "round_finish":
-            # Hold so the per-pot award animation can play out in series before
-            # the next hand starts: ~1.35s per pot (travel + gap) + 2s winner
-            # blink. Multiple pots (side pots) extend the hold.
-            n_pots = max(1, len([p for p in event.get("pot_winners", [])
-                                 if p.get("winners") and p.get("amount", 0) > 0]))
-            await asyncio.sleep(n_pots * 1.35 + 2.0)
-        elif event["type"] == "new_street":
-            # Give the client time to slide the street's bets into the pot
-            # before the next card/action arrives.
-            await asyncio.sleep(0.8)
-        elif event["type"] == "to_act":
-            await asyncio.sleep(EVENT_DELAY_S)
+async def _save_progress(websocket: WebSocket, session, stream: _Stream | None) -> None:
+    """Store the advanced session and queue a save if a hand finished.
+
+    Runs under the game's lock once the stream's compute is done, also when
+    the socket dropped mid-stream: the producer still advanced the session.
+    """
+    await manager.save(session)
+    if stream is not None and stream.hand_ended:
+        _queue_save(websocket, session)
+
+
+def _queue_save(websocket: WebSocket, session) -> None:
+    """Queue the finished hand's save; push the hero's refreshed stats, if
+    any, once it is written (see save_queue).
+    """
+    async def push(hero_stats: dict | None) -> None:
+        if hero_stats is None:
+            return
+        try:
+            await websocket.send_json({"type": "stats_update", "stats": hero_stats})
+        except (WebSocketDisconnect, RuntimeError):
+            pass  # the client left; it gets fresh stats when it reconnects
+
+    save_queue.submit(session.game_id, _save_soft, push)
 
 
 _SENTINEL = object()
 
 
-async def _stream_gen(websocket: WebSocket, gen) -> bool:
+def _pause_after(batch: list[dict]) -> float:
+    """Seconds the client needs to animate ``batch`` before the next one."""
+    types = {e["type"] for e in batch}
+    if "round_finish" in types:
+        # Hold so the per-pot award animation can play out in series before
+        # the next hand starts: ~1.35s per pot (travel + gap) + 2s winner
+        # blink. Multiple pots (side pots) extend the hold.
+        finish_ev = next(e for e in batch if e["type"] == "round_finish")
+        n_pots = max(1, len([p for p in finish_ev.get("pot_winners", [])
+                             if p.get("winners") and p.get("amount", 0) > 0]))
+        return n_pots * 1.35 + 2.0
+    if "new_street" in types:
+        # Give the client time to slide the street's bets into the pot.
+        return 0.8
+    if "to_act" in types:
+        return EVENT_DELAY_S
+    return 0.0
+
+
+class _Stream:
     """Drive an _advance_gen() generator, streaming each batch with per-step pacing.
 
-    Each generator step runs in a thread (bot compute is CPU-bound). After a
-    [to_act] batch the WS layer sleeps before advancing, so the frontend has
-    time to highlight the seat before the bot's action arrives.
-    Returns True if a round_finish was sent (caller should save).
+    Each generator step runs in a thread (bot compute is CPU-bound); views are
+    diffed through ``encoder`` when the client negotiated deltas. Two tasks
+    start at once: ``computed`` finishes when the generator is exhausted (the
+    hero's next decision or the end of the game) and ``sent`` when every
+    batch has been sent and given its animation time. ``hand_ended`` is set as
+    soon as a computed batch holds a round_finish, sent or not.
+
+    Pipelined (the default), a producer steps the generator back to back,
+    queueing each batch with the time it was ready, while a consumer sends a
+    batch at the later of that time and the end of the previous batch's
+    animation. A stretch of play then takes max(animation, compute) rather
+    than their sum, the caller can release the game lock at ``computed``
+    instead of holding it through the animation, and a dropped socket does
+    not stop the producer, so a reconnect resumes at a pending ask. With
+    POKER_WS_PIPELINE=0 compute and pauses alternate in one task (both
+    futures are the same) and a dropped socket stops the advance.
     """
-    hand_ended = False
-    while True:
-        batch = await asyncio.to_thread(lambda: next(gen, _SENTINEL))
-        if batch is _SENTINEL:
-            break
+
+    def __init__(self, websocket: WebSocket, gen, encoder: ViewEncoder | None = None):
+        self._websocket = websocket
+        self._gen = gen
+        self._encoder = encoder
+        self.hand_ended = False
+        if PIPELINE_EVENTS:
+            queue: asyncio.Queue = asyncio.Queue()
+            self.computed = asyncio.ensure_future(self._produce(queue))
+            self.sent = asyncio.ensure_future(self._consume(queue))
+        else:
+            self.computed = self.sent = asyncio.ensure_future(self._sequential())
+        # A caller that left early (its socket dropped) never awaits ``sent``.
+        self.sent.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    async def wait_computed(self) -> None:
+        """Wait for ``computed``. If the caller is cancelled meanwhile (the
+        server tearing down a dropped socket), the compute is not: it runs to
+        the hero's next decision before the cancellation goes on, so the
+        caller's save covers every hand it finished.
+        """
+        try:
+            await asyncio.shield(self.computed)
+        except asyncio.CancelledError:
+            await asyncio.wait([self.computed])
+            raise
+
+    async def _next(self):
+        batch = await asyncio.to_thread(next, self._gen, _SENTINEL)
+        if batch is not _SENTINEL and _ended_a_hand(batch):
+            self.hand_ended = True
+        return batch
+
+    async def _send(self, batch: list[dict]) -> None:
         for event in batch:
-            await websocket.send_json({"type": "event", "event": event})
-        types = {e["type"] for e in batch}
-        if "round_finish" in types:
-            hand_ended = True
-            finish_ev = next(e for e in batch if e["type"] == "round_finish")
-            n_pots = max(1, len([p for p in finish_ev.get("pot_winners", [])
-                                 if p.get("winners") and p.get("amount", 0) > 0]))
-            await asyncio.sleep(n_pots * 1.35 + 2.0)
-        elif "new_street" in types:
-            await asyncio.sleep(0.8)
-        elif "to_act" in types:
+            await self._websocket.send_json(_event_message(event, self._encoder))
+
+    async def _sequential(self) -> None:
+        while (batch := await self._next()) is not _SENTINEL:
+            await self._send(batch)
             # Highlight the seat — sleep before the next step computes the bot action.
-            await asyncio.sleep(EVENT_DELAY_S)
-    return hand_ended
+            await asyncio.sleep(_pause_after(batch))
+
+    async def _produce(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while (batch := await self._next()) is not _SENTINEL:
+                queue.put_nowait((loop.time(), batch))
+        except Exception as exc:
+            queue.put_nowait((loop.time(), exc))
+        finally:
+            queue.put_nowait((loop.time(), _SENTINEL))
+
+    async def _consume(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        send_at = loop.time()
+        while True:
+            ready_at, batch = await queue.get()
+            if batch is _SENTINEL:
+                break
+            if isinstance(batch, Exception):
+                raise batch
+            delay = max(ready_at, send_at) - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._send(batch)
+            send_at = loop.time() + _pause_after(batch)
+        # Let the last batch finish animating before the caller moves on.
+        delay = send_at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _persist_final(session):
+    with SessionLocal() as db:
+        return session.persist(db)
 
 
 async def _finish(websocket: WebSocket, session, game_id: str) -> None:
     """Persist the finished game and tell the client, then clean up."""
+    # The full persist below covers any hand save still queued for this game.
+    save_queue.discard(game_id)
     game_id_db = None
     try:
-        with SessionLocal() as db:
-            game = session.persist(db)
-            game_id_db = str(game.id) if game is not None else None
+        game = await asyncio.to_thread(_persist_final, session)
+        game_id_db = str(game.id) if game is not None else None
     except Exception as exc:  # persistence must not crash the socket
         await websocket.send_json({"type": "persist_error", "message": str(exc)})
     await websocket.send_json({"type": "saved", "db_game_id": game_id_db})
-    manager.remove(game_id)
+    await manager.remove(game_id)
@@ -12,6 +12,7 @@ from ai_functions.tools.executors import (
     make_hand_lookup_tool,
     make_hand_search_tool,
     make_pot_odds_tool,
+    make_range_equity_tool,
     make_stats_query_tool,
 )
 from poker_engine import pk_adapter, stats
@@ -146,6 +147,32 @@ def test_equity_calculator_tool_matches_mc_win_rate_and_labels_random_opponent()
     assert 0.0 <= expected <= 1.0
 
 
+def test_equity_calculator_tool_is_exact_and_deterministic_heads_up_on_the_river():
+    tool = make_equity_calculator_tool()
+    board = ["Qs", "Js", "2d", "7c", "3h"]
+
+    first = tool(hole=["As", "Ks"], board=board, n_active_players=2)
+    second = tool(hole=["As", "Ks"], board=board, n_active_players=2)
+
+    assert first["exact"] is True
+    assert first == second
+    assert first["win_rate"] == pk_adapter.mc_win_rate(["As", "Ks"], board, 2)
+
+
+def test_range_equity_tool_returns_equity_or_a_readable_error():
+    tool = make_range_equity_tool()
+
+    result = tool(hero="AsKs", villain_range="QQ+, AKo", board=["Qs", "Js", "2d", "7c", "3h"])
+    assert result["exact"] is True
+    assert 0.0 <= result["equity"] <= 1.0
+    assert "range" in result["note"].lower()
+
+    assert "error" in tool(hero="AsKs", villain_range="QQ+, AKx", board=[])
+    assert "error" in tool(hero="AsKs", villain_range="QQ+", board=["Xx", "2c", "3d"])
+    assert "error" in tool(hero="AsKs", villain_range="QQ+", board=["2d", "2d", "3c"])
+    assert "error" in tool(hero="AsKs", villain_range="QQ+", board=["As", "2c", "3d"])
+
+
 def test_pot_odds_tool_computes_required_equity():
     tool = make_pot_odds_tool()
 
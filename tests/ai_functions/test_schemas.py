@@ -10,6 +10,7 @@ from ai_functions.tools.schemas import (
     HAND_LOOKUP_SCHEMA,
     HAND_SEARCH_SCHEMA,
     POT_ODDS_SCHEMA,
+    RANGE_EQUITY_SCHEMA,
     STATS_QUERY_SCHEMA,
 )
 
@@ -38,6 +39,12 @@ def test_stats_query_schema_excludes_scoping_params():
     assert _FORBIDDEN.isdisjoint(props)
 
 
+def test_range_equity_schema_excludes_scoping_params():
+    props = RANGE_EQUITY_SCHEMA["function"]["parameters"]["properties"]
+    assert set(props) == {"hero", "villain_range", "board"}
+    assert RANGE_EQUITY_SCHEMA in ALL_TOOL_SCHEMAS
+
+
 def test_equity_calculator_description_states_random_opponent_equity():
     desc = EQUITY_CALCULATOR_SCHEMA["function"]["description"].lower()
     assert "random opponent" in desc
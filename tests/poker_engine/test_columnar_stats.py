@@ -0,0 +1,111 @@
+"""Differential tests: the vectorized counters against ``compute_hand_stats``.
+
+Random hands (random seats, positions, streets and action sequences) are
+built once as in-memory ORM objects and once as columns; every seat's row of
+``hand_stat_matrix`` must equal its per-hand counts. No DB.
+"""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from poker_engine.columnar_stats import hand_stat_matrix, sum_by
+from poker_engine.db.models import Action, Hand, HandPlayer, Street
+from poker_engine.stats import COUNTER_FIELDS, RawStatCounts, compute_hand_stats
+
+_STREETS = [Street.PREFLOP, Street.FLOP, Street.TURN, Street.RIVER, Street.SHOWDOWN]
+_ACTIONS = ["raise", "raise", "call", "call", "fold", "smallblind", "bigblind"]
+
+
+def _random_hands(rng: random.Random, n: int) -> list[Hand]:
+    hands = []
+    for h in range(n):
+        seats = [f"gp-{rng.randrange(12)}" for _ in range(rng.randint(2, 6))]
+        seats = list(dict.fromkeys(seats)) or ["gp-0", "gp-1"]
+        reached = rng.randrange(len(_STREETS))
+        hand = Hand(id=f"hand-{h:04d}", street_reached=_STREETS[reached], had_showdown=rng.random() < 0.4)
+        hand.players = [
+            HandPlayer(
+                hand_id=hand.id, game_player_id=gp,
+                position=rng.choice(["BTN", "SB", "BB", "CO", None]),
+                is_winner=rng.random() < 0.3, amount_won=rng.choice([0, 50, -20]),
+            )
+            for gp in seats
+        ]
+        actions = []
+        for seq in rng.sample(range(40), rng.randint(0, 14)):  # seqs out of order on purpose
+            actions.append(Action(
+                hand_id=hand.id,
+                game_player_id=rng.choice(seats + ["gp-ghost"]),  # a seat with no hand_players row
+                street=rng.choice(_STREETS[:reached + 1]),
+                action=rng.choice(_ACTIONS),
+                amount=rng.choice([0, 0, 20, 60]),
+                seq=seq,
+            ))
+        hand.actions = actions
+        hands.append(hand)
+    return hands
+
+
+def _columns(hands: list[Hand]):
+    hand_cols = {
+        "id": np.array([h.id for h in hands]),
+        "street_reached": np.array([h.street_reached.value for h in hands]),
+        "had_showdown": np.array([h.had_showdown for h in hands]),
+    }
+    hps = [hp for h in hands for hp in h.players]
+    hp_cols = {
+        "hand_id": np.array([hp.hand_id for hp in hps]),
+        "game_player_id": np.array([hp.game_player_id for hp in hps]),
+        "position": np.array([hp.position for hp in hps], dtype=object),
+        "is_winner": np.array([hp.is_winner for hp in hps]),
+        "amount_won": np.array([hp.amount_won for hp in hps]),
+    }
+    acts = [a for h in hands for a in h.actions]
+    act_cols = {
+        "hand_id": np.array([a.hand_id for a in acts]),
+        "game_player_id": np.array([a.game_player_id for a in acts]),
+        "street": np.array([a.street.value for a in acts]),
+        "action": np.array([a.action for a in acts]),
+        "amount": np.array([a.amount for a in acts]),
+        "seq": np.array([a.seq for a in acts]),
+    }
+    return hand_cols, hp_cols, act_cols, hps
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matrix_matches_compute_hand_stats(seed):
+    hands = _random_hands(random.Random(seed), 300)
+    hand_cols, hp_cols, act_cols, hps = _columns(hands)
+    matrix = hand_stat_matrix(hand_cols, hp_cols, act_cols)
+
+    by_id = {h.id: h for h in hands}
+    for row, hp in zip(matrix.tolist(), hps):
+        expected = compute_hand_stats(by_id[hp.hand_id], hp.game_player_id)
+        assert dict(zip(COUNTER_FIELDS, row)) == {n: getattr(expected, n) for n in COUNTER_FIELDS}
+
+
+def test_sum_by_matches_summed_hand_stats():
+    hands = _random_hands(random.Random(7), 200)
+    hand_cols, hp_cols, act_cols, hps = _columns(hands)
+    matrix = hand_stat_matrix(hand_cols, hp_cols, act_cols)
+    totals = sum_by(hp_cols["game_player_id"], matrix, hp_cols["position"])
+
+    by_id = {h.id: h for h in hands}
+    expected: dict[str, RawStatCounts] = {}
+    for hp in hps:
+        expected.setdefault(hp.game_player_id, RawStatCounts())
+        expected[hp.game_player_id] += compute_hand_stats(by_id[hp.hand_id], hp.game_player_id)
+    assert totals == expected
+
+
+def test_rows_may_be_filtered_to_some_seats():
+    hands = _random_hands(random.Random(3), 50)
+    hand_cols, hp_cols, act_cols, _ = _columns(hands)
+    full = hand_stat_matrix(hand_cols, hp_cols, act_cols)
+    keep = hp_cols["game_player_id"] == "gp-3"
+    filtered = hand_stat_matrix(hand_cols, {k: v[keep] for k, v in hp_cols.items()}, act_cols)
+    assert (filtered == full[keep]).all()
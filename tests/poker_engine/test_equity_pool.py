@@ -0,0 +1,100 @@
+"""Tests for the process-pool equity service in src/poker_engine/equity_pool.py.
+
+Pure computation — no DB. Spawns a real two-worker pool once per module.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from poker_engine import equity_pool, pk_adapter
+from poker_engine.bots.styles import TAGBot
+from poker_engine.equity_pool import EquityRequest
+
+
+@pytest.fixture(scope="module")
+def pool():
+    equity_pool.shutdown_pool()
+    pool = equity_pool.start_pool(max_workers=2)
+    yield pool
+    equity_pool.shutdown_pool()
+
+
+def _in_process(request: EquityRequest) -> pk_adapter.EquityEstimate:
+    return pk_adapter.equity_estimate(
+        list(request.hole), list(request.board), request.n_active_players,
+        n_sim=request.n_sim, cache=None, threshold=request.threshold, seed=request.seed,
+    )
+
+
+def test_worker_results_match_in_process_estimates(pool):
+    requests = [
+        EquityRequest(("As", "Kd"), ("Qh", "7c", "2s"), 3, n_sim=2000, seed=1),
+        EquityRequest(("9h", "9c"), ("Ts", "4d", "3c", "Kh"), 4, n_sim=2000, seed=2, threshold=0.3),
+        EquityRequest(("Ac", "Ks"), ("Qs", "Js", "2d", "7c", "3h"), 2),
+    ]
+    results = [future.result() for future in [pool.submit(r) for r in requests]]
+    assert results == [_in_process(r) for r in requests]
+    assert results[2].method == "exact"
+
+
+def test_start_pool_is_idempotent(pool):
+    assert equity_pool.start_pool() is pool
+    assert equity_pool.get_pool() is pool
+
+
+def test_estimate_routes_through_the_running_pool(pool):
+    pk_adapter.EQUITY_CACHE.clear()
+    rng = random.Random(3)
+    result = equity_pool.estimate(["Jd", "Jc"], ["8s", "5h", "2d"], 3, n_sim=1000, rng=rng)
+    local_rng = random.Random(3)
+    expected = pk_adapter.equity_estimate(["Jd", "Jc"], ["8s", "5h", "2d"], 3, n_sim=1000, rng=local_rng, cache=None)
+    assert result == expected
+    assert rng.getstate() == local_rng.getstate()
+
+    # An exact spot draws nothing from the caller's rng, in-process or pooled.
+    rng = random.Random(4)
+    exact = equity_pool.estimate(["Ac", "Ks"], ["Qs", "Js", "2d", "7c", "3h"], 2, rng=rng)
+    assert exact.method == "exact"
+    assert rng.getstate() == random.Random(4).getstate()
+
+    preflop = equity_pool.estimate(["As", "Ah"], [], 2)
+    assert preflop.method == "preflop_table"
+
+
+def test_pool_path_reads_and_fills_the_equity_cache(pool):
+    cache = pk_adapter.EQUITY_CACHE
+    cache.clear()
+    spot = (["Td", "9d"], ["8d", "7s", "2c"], 3)
+    pooled = equity_pool.estimate(*spot, n_sim=500, rng=random.Random(1))
+    assert cache.stats()["size"] == 1
+
+    # A later query for the spot, pooled or not, is a hit that still advances rng.
+    rng = random.Random(2)
+    assert equity_pool.estimate(*spot, n_sim=500, rng=rng) == pooled
+    assert pk_adapter.equity_estimate(*spot, n_sim=500) == pooled
+    assert cache.stats()["hits"] == 2
+    assert rng.getstate() != random.Random(2).getstate()
+
+
+def test_bot_decisions_work_with_and_without_the_pool(pool):
+    valid_actions = [
+        {"action": "fold", "amount": 0},
+        {"action": "call", "amount": 10},
+        {"action": "raise", "amount": {"min": 20, "max": 500}},
+    ]
+    round_state = {"community_card": ["As", "Ad", "7c"], "pot": {"main": {"amount": 30}, "side": []}}
+    bot = TAGBot(seed=5)
+    bot.set_n_players(3)
+    pooled = bot.declare_action(valid_actions, ["Ah", "Kd"], round_state)
+
+    equity_pool.shutdown_pool()
+    try:
+        local = TAGBot(seed=5)
+        local.set_n_players(3)
+        assert equity_pool.get_pool() is None
+        assert local.declare_action(valid_actions, ["Ah", "Kd"], round_state)[0] == pooled[0] == "raise"
+    finally:
+        equity_pool.start_pool(max_workers=2)
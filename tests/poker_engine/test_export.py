@@ -0,0 +1,87 @@
+"""Round trip for the columnar export: recorded hands written as Parquet or
+Arrow part files and read back by ``population_stats`` must give every hero
+the same totals as summing ``compute_hand_stats`` over the hands. No DB —
+rows come from the recorder's row builders. Needs the ``analytics`` extra.
+"""
+
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from poker_engine.config import GameConfig, SeatKind, SeatSpec
+from poker_engine.db.models import Action, Hand, HandPlayer
+from poker_engine.stats import RawStatCounts, compute_hand_stats
+from poker_trainer.game.session import GameSession
+
+pytest.importorskip("pyarrow")
+
+from poker_engine import export  # noqa: E402
+
+_CONFIG = GameConfig(
+    small_blind=5,
+    buy_in=1000,
+    seats=[
+        SeatSpec(name="hero", kind=SeatKind.HUMAN, email="export-hero@test.local"),
+        SeatSpec(name="tag", kind=SeatKind.TAG),
+        SeatSpec(name="lag", kind=SeatKind.LAG),
+        SeatSpec(name="station", kind=SeatKind.STATION),
+    ],
+)
+
+
+def _recorded_game(seed: int, user_id: uuid.UUID, decisions: int = 40):
+    """Play a game and return its export rows (per table, as dicts) and ORM hands."""
+    session = GameSession(_CONFIG, hero_index=0, seed=seed)
+    session.start()
+    for _ in range(decisions):
+        if session.pending_ask() is None:
+            break
+        session.apply_hero_action("call" if seed % 2 else "raise", 0)
+    recorder = session.recorder
+
+    game_id = uuid.uuid4()
+    seats = {u: SimpleNamespace(id=uuid.uuid4(), seat_index=i) for i, u in enumerate(session.seat_uuids)}
+    rows = {
+        "games": [{"id": game_id, "hero_user_id": user_id, "small_blind": 5, "big_blind": 10}],
+        "game_players": [
+            {"id": seat.id, "game_id": game_id, "seat_index": seat.seat_index,
+             "user_id": user_id if u == session.hero_uuid else None, "is_bot": u != session.hero_uuid}
+            for u, seat in seats.items()
+        ],
+        "hands": [], "hand_players": [], "actions": [],
+    }
+    hands = []
+    for hand_rec in recorder._hands:
+        if hand_rec is recorder._current:
+            continue
+        hand_row, player_rows, action_rows = recorder._hand_rows(game_id, hand_rec, seats)
+        rows["hands"].append(hand_row)
+        rows["hand_players"] += player_rows
+        rows["actions"] += action_rows
+        hand = Hand(**hand_row)
+        hand.players = [HandPlayer(**row) for row in player_rows]
+        hand.actions = [Action(**row) for row in action_rows]
+        hands.append(hand)
+    return rows, hands, seats[session.hero_uuid].id
+
+
+@pytest.mark.parametrize("fmt", export.FORMATS)
+def test_population_stats_match_summed_hand_stats(tmp_path, fmt):
+    users = [uuid.uuid4(), uuid.uuid4()]
+    expected: dict[str, RawStatCounts] = {}
+    # Three parts; the first user's games span two of them.
+    for part, (seed, user_id) in enumerate([(1, users[0]), (2, users[1]), (3, users[0])]):
+        rows, hands, hero_seat = _recorded_game(seed, user_id)
+        assert hands
+        for name, (_, columns) in export._TABLES.items():
+            table_rows = [tuple(row.get(c) for c, _ in columns) for row in rows[name]]
+            export._write(export._to_table(name, table_rows), tmp_path / name / f"part-{part:05d}.{fmt}", fmt)
+        totals = expected.setdefault(str(user_id), RawStatCounts())
+        for hand in hands:
+            totals += compute_hand_stats(hand, hero_seat)
+
+    assert export.population_stats(tmp_path) == expected
+    assert sum(c.hands_dealt for c in expected.values()) > 0
@@ -0,0 +1,145 @@
+"""Differential tests: the native HoldemState against PokerKit.
+
+Both state machines are driven through the same randomised hands — uneven
+stacks, antes, short all-ins, side pots — and must agree on every observable
+after every step. Pure computation — no DB.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from pokerkit import NoLimitTexasHoldem
+
+from poker_engine import pk_adapter
+from poker_engine.config import GameConfig, SeatKind, SeatSpec
+from poker_engine.engine import _AUTOMATIONS, GameEngine
+from poker_engine.holdem import HoldemState
+
+_PK_CARDS = pk_adapter.parse_cards(pk_adapter.CARD_STRS)
+
+
+def _pair(ante, small_blind, stacks):
+    pk = NoLimitTexasHoldem.create_state(
+        automations=_AUTOMATIONS,
+        ante_trimming_status=True,
+        raw_antes=ante,
+        raw_blinds_or_straddles=(small_blind, 2 * small_blind),
+        min_bet=2 * small_blind,
+        raw_starting_stacks=stacks,
+        player_count=len(stacks),
+    )
+    native = HoldemState(ante, (small_blind, 2 * small_blind), 2 * small_blind, stacks)
+    return pk, native
+
+
+def _snapshot(state) -> tuple:
+    return (
+        state.status,
+        state.actor_index,
+        list(state.stacks),
+        list(state.bets),
+        list(state.payoffs),
+        list(state.statuses),
+        state.total_pot_amount,
+        [(pot.amount, tuple(pot.player_indices)) for pot in state.pots],
+        state.checking_or_calling_amount,
+        state.min_completion_betting_or_raising_to_amount,
+        state.max_completion_betting_or_raising_to_amount,
+        state.can_burn_card(),
+        state.can_deal_board(),
+        [pk_adapter.cards_to_strs(hole) for hole in state.hole_cards],
+        pk_adapter.cards_to_strs(c for cards in state.board_cards for c in cards),
+    )
+
+
+def _both(pk, native, op: str, *args) -> None:
+    getattr(pk, op)(*[_PK_CARDS[a] if op in ("deal_hole", "burn_card", "deal_board") else a for a in args])
+    getattr(native, op)(*args)
+    assert _snapshot(native) == _snapshot(pk), op
+
+
+def _play_random_hand(rng: random.Random) -> None:
+    n = rng.randint(2, 6)
+    small_blind = rng.choice([1, 2, 5])
+    ante = rng.choice([0, 0, 1, 3])
+    stacks = [rng.choice([rng.randint(1, 15), rng.randint(20, 400)]) for _ in range(n)]
+    pk, native = _pair(ante, small_blind, stacks)
+    assert _snapshot(native) == _snapshot(pk)
+
+    deck = list(range(52))
+    rng.shuffle(deck)
+    for card in deck[:2 * n]:
+        _both(pk, native, "deal_hole", card)
+    remaining = iter(deck[2 * n:])
+
+    while pk.status:
+        if pk.actor_index is None:
+            _both(pk, native, "burn_card" if pk.can_burn_card() else "deal_board", next(remaining))
+            continue
+        actions = ["check_or_call"]
+        if pk.bets[pk.actor_index] < max(pk.bets):
+            actions.append("fold")
+        if pk.can_complete_bet_or_raise_to():
+            actions += ["raise", "raise"]
+        action = rng.choice(actions)
+        if action == "raise":
+            lo = pk.min_completion_betting_or_raising_to_amount
+            hi = pk.max_completion_betting_or_raising_to_amount
+            _both(pk, native, "complete_bet_or_raise_to", rng.choice([lo, hi, rng.randint(lo, hi)]))
+        else:
+            _both(pk, native, action)
+    assert native.status is False
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_hands_match_pokerkit(seed):
+    rng = random.Random(seed)
+    for _ in range(30):
+        _play_random_hand(rng)
+
+
+def test_illegal_actions_raise_like_pokerkit():
+    pk, native = _pair(0, 5, [100, 100, 100])
+    for card in range(6):
+        _both(pk, native, "deal_hole", card)
+    for state in (pk, native):
+        with pytest.raises(ValueError):
+            state.complete_bet_or_raise_to(15)  # below the 20 minimum
+        with pytest.raises(ValueError):
+            state.complete_bet_or_raise_to(101)
+    _both(pk, native, "check_or_call")
+    _both(pk, native, "check_or_call")
+    for state in (pk, native):
+        with pytest.raises(ValueError):
+            state.fold()  # the big blind has nothing to call
+        with pytest.raises(ValueError):
+            state.deal_board(10)
+
+
+def test_non_positive_stacks_rejected():
+    with pytest.raises(ValueError):
+        HoldemState(0, (5, 10), 10, [100, 0, 100])
+
+
+def test_engine_hands_match_across_state_machines():
+    config = GameConfig(
+        small_blind=5,
+        buy_in=300,
+        seats=[SeatSpec(name=f"s{i}", kind=k) for i, k in enumerate(
+            [SeatKind.TAG, SeatKind.LAG, SeatKind.STATION, SeatKind.ROCK]
+        )],
+        ante=1,
+    )
+    pk_hands = list(GameEngine(config, seed=5).simulate(40))
+    native_hands = list(GameEngine(config, seed=5, state_machine="native").simulate(40))
+    assert native_hands == pk_hands
+
+
+def test_unknown_state_machine_rejected():
+    config = GameConfig(small_blind=5, buy_in=100, seats=[
+        SeatSpec(name="a", kind=SeatKind.TAG), SeatSpec(name="b", kind=SeatKind.ROCK),
+    ])
+    with pytest.raises(ValueError):
+        GameEngine(config, state_machine="fast")
@@ -0,0 +1,369 @@
+"""Tests for the hand evaluators and equity estimation in src/poker_engine/pk_adapter.py.
+
+Pure computation — no DB. The pure-Python tuple evaluator (``_rank5_int`` via
+``_best5_tuple``) is the reference every faster path is checked against.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from poker_engine import pk_adapter
+
+
+def _random_hands(n: int, size: int, seed: int = 0) -> list[list[str]]:
+    rng = random.Random(seed)
+    return [rng.sample(pk_adapter.ALL_52, size) for _ in range(n)]
+
+
+def _encoded(hands: list[list[str]]) -> np.ndarray:
+    return np.array([pk_adapter.card_ids(h) for h in hands], dtype=np.int64)
+
+
+def _batch_scores(hands: list[list[str]]) -> np.ndarray:
+    return pk_adapter._score_batch(_encoded(hands))
+
+
+def _reference(hand: list[str]) -> int:
+    return pk_adapter._pack_score(pk_adapter._best5_tuple(*pk_adapter._decode_cards(hand)))
+
+
+def test_batch_scores_match_reference_evaluator():
+    for size in (5, 6, 7):
+        hands = _random_hands(3000, size, seed=size)
+        scores = _batch_scores(hands)
+        for hand, score in zip(hands, scores):
+            assert score == _reference(hand), hand
+
+
+def test_rank_table_lookups_match_reference_evaluator():
+    for size in (5, 6, 7):
+        hands = _random_hands(3000, size, seed=10 + size)
+        batch = pk_adapter._strength_batch(_encoded(hands))
+        for hand, strength in zip(hands, batch):
+            assert pk_adapter.hand_strength_key(hand[:2], hand[2:]) == _reference(hand), hand
+            assert strength == _reference(hand), hand
+
+
+def test_card_ids_round_trip_and_mask_planes():
+    ids = pk_adapter.card_ids(["2c", "As", "Td", "Th"])
+    assert ids == [0, 51, 33, 34]
+    assert pk_adapter.cards_to_strs(ids) == ["2c", "As", "Td", "Th"]
+    assert pk_adapter.card_ids(pk_adapter.cards_to_strs(pk_adapter.parse_cards(["Kh", "3d"]))) == [46, 5]
+
+    mask = pk_adapter.hand_mask(ids)
+    assert mask.bit_count() == 4
+    assert pk_adapter.suit_plane(mask, 0) == 1 << 0
+    assert pk_adapter.suit_plane(mask, 1) == 1 << 8
+    assert pk_adapter.suit_plane(mask, 2) == 1 << 8
+    assert pk_adapter.suit_plane(mask, 3) == 1 << 12
+    assert int(pk_adapter._masks_batch(np.array([ids]))[0]) == mask
+
+
+def test_shipped_rank_table_is_current_and_memory_mapped(monkeypatch):
+    monkeypatch.setattr(pk_adapter, "_RANK_TABLE", None)
+
+    table = pk_adapter._rank_table()
+
+    assert isinstance(table, np.memmap)
+    assert pk_adapter._rank_table() is table
+    # Stale data would silently misrank hands: rebuild with scripts/build_rank_table.py.
+    assert np.array_equal(table, pk_adapter._build_rank_table())
+
+
+def test_missing_rank_table_is_built_in_memory(tmp_path, monkeypatch):
+    path = tmp_path / "rank_table.npy"
+    monkeypatch.setattr(pk_adapter, "RANK_TABLE_PATH", path)
+    monkeypatch.setattr(pk_adapter, "_RANK_TABLE", None)
+
+    table = pk_adapter._rank_table()
+
+    assert not path.exists()
+    assert pk_adapter._rank_table() is table
+    assert len(table) == pk_adapter._RANK_TABLE_SIZE
+
+
+def test_hand_strength_key_orders_hands_and_detects_ties():
+    board = ["Ah", "Kd", "7c", "7s", "2h"]
+    trips = pk_adapter.hand_strength_key(["7d", "3c"], board)
+    two_pair = pk_adapter.hand_strength_key(["Ac", "4d"], board)
+    assert trips > two_pair
+    assert pk_adapter.hand_strength_key(["Ks"], board[:3]) == 0
+    assert pk_adapter.winners_from_cards(
+        {"a": ["Qc", "3d"], "b": ["Qd", "3s"], "c": ["Jc", "4d"]}, board
+    ) == ["a", "b"]
+
+
+def test_batch_scores_handle_wheel_and_steel_wheel():
+    wheel, steel_wheel, six_high = _batch_scores([
+        ["As", "2d", "3c", "4h", "5s", "Kd", "Kc"],
+        ["Ah", "2h", "3h", "4h", "5h", "Kd", "Kc"],
+        ["6s", "2d", "3c", "4h", "5s", "Kd", "Kc"],
+    ])
+    assert wheel == pk_adapter._pack_score((pk_adapter._ST, 5))
+    assert steel_wheel == pk_adapter._pack_score((pk_adapter._SF, 5))
+    assert six_high > wheel
+
+
+def test_mc_win_rate_is_reproducible_with_seeded_rng():
+    a = pk_adapter.mc_win_rate(["Ks", "Qs"], ["Js", "2d", "7c"], 3, n_sim=2000, rng=random.Random(7))
+    b = pk_adapter.mc_win_rate(["Ks", "Qs"], ["Js", "2d", "7c"], 3, n_sim=2000, rng=random.Random(7))
+    assert a == b
+
+
+def test_exact_equity_enumerates_every_deal():
+    deals = pk_adapter._enumerate_deals(46, 1, 1)
+    assert len(deals) == pk_adapter.n_equity_deals(46, 1, 1) == 46 * 990
+    assert len({(d[0], frozenset(d[1:])) for d in deals.tolist()}) == len(deals)
+    assert all(len(set(d)) == 3 for d in deals.tolist())
+
+
+def test_exact_equity_matches_brute_force_on_the_river():
+    hole, board = ["Ah", "Td"], ["Ac", "Kd", "7d", "7s", "2h"]
+    rest = [c for c in pk_adapter.ALL_52 if c not in hole + board]
+    expected = 0.0
+    combos = list(itertools.combinations(rest, 2))
+    for opp in combos:
+        winners = pk_adapter.winners_from_cards({"hero": hole, "opp": list(opp)}, board)
+        expected += 1.0 / len(winners) if "hero" in winners else 0.0
+
+    assert pk_adapter.uses_exact_equity(board, 2)
+    assert pk_adapter.mc_win_rate(hole, board, 2) == pytest.approx(expected / len(combos))
+
+
+def test_exact_equity_agrees_with_monte_carlo_on_the_turn():
+    hole, board = ["9h", "8h"], ["Th", "Jc", "2h", "4s"]
+    exact = pk_adapter.mc_win_rate(hole, board, 2)
+    sampled = pk_adapter.mc_win_rate(hole, board, 2, n_sim=40000, rng=random.Random(3), max_exact_combos=0)
+    assert abs(exact - sampled) < 0.01
+    assert not pk_adapter.uses_exact_equity(board, 2, max_exact_combos=0)
+    assert not pk_adapter.uses_exact_equity(board[:3], 2)
+
+
+def test_mc_win_rate_agrees_with_reference_loop():
+    spots = [
+        (["As", "Ah"], [], 2),
+        (["7c", "2d"], [], 6),
+        (["Ts", "9s"], ["8s", "7c", "2d", "Ah"], 3),
+    ]
+    for hole, board, n_players in spots:
+        fast = pk_adapter.mc_win_rate(hole, board, n_players, n_sim=20000, rng=random.Random(1))
+        slow = pk_adapter._mc_win_rate_py(hole, board, n_players, n_sim=4000, rng=random.Random(1))
+        sampled = pk_adapter.mc_win_rate(
+            hole, board, n_players, n_sim=20000, rng=random.Random(1), preflop_table=False,
+        )
+        assert abs(sampled - slow) < 0.03, (hole, board, sampled, slow)
+        assert abs(fast - slow) < 0.03, (hole, board, fast, slow)
+
+
+def test_preflop_class_index_covers_169_classes():
+    names = {pk_adapter.preflop_class_name(i) for i in range(169)}
+    assert len(names) == 169
+    for i in range(169):
+        assert pk_adapter.preflop_class_index(pk_adapter.preflop_class_hand(i)) == i
+    assert pk_adapter.preflop_class_name(pk_adapter.preflop_class_index(["Kd", "Ad"])) == "AKs"
+    assert pk_adapter.preflop_class_name(pk_adapter.preflop_class_index(["7c", "2h"])) == "72o"
+    assert pk_adapter.preflop_class_index(["Qh", "Qc"]) == pk_adapter.preflop_class_index(["Qs", "Qd"])
+
+
+def test_shipped_preflop_table_answers_preflop_queries():
+    table = pk_adapter._preflop_table()
+    assert table is not None
+    assert table.shape == (169, 8) and table.dtype == np.uint16
+
+    aces = pk_adapter.preflop_equity(["As", "Ad"], 2)
+    assert aces == pytest.approx(0.852, abs=0.005)
+    assert pk_adapter.mc_win_rate(["Ac", "Ah"], [], 2) == aces
+    assert pk_adapter.preflop_equity(["As", "Ad"], 9) < aces
+    assert pk_adapter.preflop_equity(["As", "Ad"], 10) is None
+
+    sampled = pk_adapter.mc_win_rate(["Jc", "Ts"], [], 4, n_sim=40000, rng=random.Random(5), preflop_table=False)
+    assert pk_adapter.preflop_equity(["Jh", "Td"], 4) == pytest.approx(sampled, abs=0.01)
+
+
+def test_preflop_lookup_falls_back_to_simulation_without_table(tmp_path, monkeypatch):
+    monkeypatch.setattr(pk_adapter, "PREFLOP_TABLE_PATH", tmp_path / "missing.npy")
+    monkeypatch.setattr(pk_adapter, "_PREFLOP_TABLE", None)
+    monkeypatch.setattr(pk_adapter, "_PREFLOP_TABLE_LOADED", False)
+
+    assert pk_adapter.preflop_equity(["As", "Ad"], 2) is None
+    a = pk_adapter.mc_win_rate(["As", "Ad"], [], 2, n_sim=500, rng=random.Random(2))
+    b = pk_adapter.mc_win_rate(["As", "Ad"], [], 2, n_sim=500, rng=random.Random(2))
+    assert a == b
+
+
+def test_canonical_spot_is_suit_isomorphism_invariant():
+    spot = pk_adapter.canonical_spot(["As", "Ks"], ["Qs", "7h", "2d"])
+    assert spot == pk_adapter.canonical_spot(["Kh", "Ah"], ["2c", "Qh", "7d"])
+    assert spot == pk_adapter.canonical_spot(["Ad", "Kd"], ["7s", "Qd", "2h"])
+    assert spot != pk_adapter.canonical_spot(["As", "Kh"], ["Qs", "7h", "2d"])
+    assert spot != pk_adapter.canonical_spot(["As", "Ks"], ["Qh", "7h", "2d"])
+
+
+def test_mc_win_rate_reuses_cached_isomorphic_spots():
+    cache = pk_adapter.EquityCache()
+    board = ["Js", "8d", "3c"]
+    first = pk_adapter.mc_win_rate(["As", "Qs"], board, 3, n_sim=3000, rng=random.Random(1), cache=cache)
+    again = pk_adapter.mc_win_rate(["Qh", "Ah"], ["3d", "Jh", "8c"], 3, n_sim=3000, rng=random.Random(2), cache=cache)
+    assert again == first
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    # A different precision tier or opponent count is a separate entry.
+    pk_adapter.mc_win_rate(["As", "Qs"], board, 3, n_sim=20000, rng=random.Random(1), cache=cache)
+    pk_adapter.mc_win_rate(["As", "Qs"], board, 4, n_sim=3000, rng=random.Random(1), cache=cache)
+    assert cache.stats() == {"size": 3, "hits": 1, "misses": 3}
+
+
+def test_mc_win_rate_cache_hit_still_advances_rng():
+    cache = pk_adapter.EquityCache()
+    cold, warm = random.Random(9), random.Random(9)
+    pk_adapter.mc_win_rate(["Ts", "Tc"], ["9h", "5d", "2s"], 2, n_sim=1000, rng=cold, cache=None)
+    pk_adapter.mc_win_rate(["Ts", "Tc"], ["9h", "5d", "2s"], 2, n_sim=1000, cache=cache)
+    pk_adapter.mc_win_rate(["Ts", "Tc"], ["9h", "5d", "2s"], 2, n_sim=1000, rng=warm, cache=cache)
+    assert cache.hits == 1
+    assert cold.random() == warm.random()
+
+
+def test_equity_cache_evicts_least_recent_and_expired_entries():
+    def est(win_rate: float, trials: int = 100) -> pk_adapter.EquityEstimate:
+        return pk_adapter.EquityEstimate(win_rate, trials, 0.01, "monte_carlo")
+
+    cache = pk_adapter.EquityCache(maxsize=2)
+    cache.put(("a",), est(0.1))
+    cache.put(("b",), est(0.2))
+    assert cache.get(("a",)) == est(0.1)
+    cache.put(("c",), est(0.3))
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == est(0.1) and cache.get(("c",)) == est(0.3)
+
+    # A less precise estimate never replaces a more precise live one.
+    cache.put(("a",), est(0.5, trials=10))
+    assert cache.get(("a",)) == est(0.1)
+
+    expired = pk_adapter.EquityCache(ttl_s=-1)
+    expired.put(("a",), est(0.1))
+    assert expired.get(("a",)) is None
+    assert expired.stats() == {"size": 0, "hits": 0, "misses": 1}
+
+
+def test_sequential_mode_stops_once_the_interval_excludes_the_threshold():
+    far = pk_adapter.equity_estimate(
+        ["As", "Ah"], ["Ad", "7c", "2h"], 3, n_sim=10000, rng=random.Random(4), cache=None, threshold=0.5,
+    )
+    assert far.method == "monte_carlo"
+    assert far.trials < 10000
+    assert far.excludes(0.5, pk_adapter.SEQUENTIAL_Z)
+
+    full = pk_adapter.equity_estimate(
+        ["As", "Ah"], ["Ad", "7c", "2h"], 3, n_sim=10000, rng=random.Random(4), cache=None,
+    )
+    assert full.trials == 10000
+    assert 0 < full.std_error < far.std_error
+    assert abs(far.win_rate - full.win_rate) < 4 * far.std_error
+
+
+def test_sequential_mode_runs_to_the_cap_near_the_threshold():
+    spot = (["Kh", "Qh"], ["Jh", "4c", "2s"], 3)
+    full = pk_adapter.equity_estimate(*spot, n_sim=4000, rng=random.Random(6), cache=None)
+    near = pk_adapter.equity_estimate(*spot, n_sim=4000, rng=random.Random(6), cache=None, threshold=full.win_rate)
+    assert near.trials == 4000
+
+
+def test_cached_early_stop_is_reused_only_when_it_decides_the_new_threshold():
+    cache = pk_adapter.EquityCache()
+    spot = (["As", "Ah"], ["Ad", "7c", "2h"], 3)
+    early = pk_adapter.equity_estimate(*spot, n_sim=10000, rng=random.Random(4), cache=cache, threshold=0.5)
+    assert pk_adapter.equity_estimate(*spot, n_sim=10000, cache=cache, threshold=0.4) == early
+    assert cache.hits == 1
+
+    precise = pk_adapter.equity_estimate(*spot, n_sim=10000, cache=cache)
+    assert precise.trials == 10000
+    assert cache.misses == 2
+    assert pk_adapter.equity_estimate(*spot, n_sim=10000, cache=cache, threshold=0.5) == precise
+
+
+def test_exact_and_table_estimates_report_their_method():
+    river = pk_adapter.equity_estimate(["As", "Ks"], ["Qs", "Js", "2d", "7c", "3h"], 2, cache=None)
+    assert (river.method, river.trials, river.std_error) == ("exact", 990, 0.0)
+    assert pk_adapter.equity_estimate(["As", "Ks"], [], 2).method == "preflop_table"
+
+
+def test_mc_win_rate_nut_hand_on_river_always_wins():
+    win_rate = pk_adapter.mc_win_rate(["As", "Ks"], ["Qs", "Js", "Ts", "2d", "3c"], 4, n_sim=500)
+    assert win_rate == 1.0
+
+
+def test_parse_range_expands_shorthand():
+    def classes(text: str) -> int:
+        return len(pk_adapter.parse_range(text)[0])
+
+    assert classes("QQ+") == 18
+    assert classes("AKs, 76s") == 8
+    assert classes("AK") == 16 and classes("KQo") == 12
+    assert classes("ATs+") == 16 and classes("A5s-A2s") == 16
+    assert classes("99-66") == 24 and classes("22+") == 78
+    assert classes("AhKh") == 1
+    # Later tokens override earlier weights; zero weight removes combos.
+    combos, weights = pk_adapter.parse_range("AK, AKs:0.5, AKo:0")
+    assert len(combos) == 4 and set(weights) == {0.5}
+
+
+def test_parse_range_rejects_malformed_tokens():
+    for bad in ("AKx", "QQs", "KA", "A5s-K2s", "QQ+-99", "AhAh", "AK:-1", "AK:x", ""):
+        with pytest.raises(ValueError):
+            pk_adapter.parse_range(bad)
+
+
+def test_range_equity_matches_known_matchups():
+    aces_vs_kings = pk_adapter.hand_vs_range_equity(
+        ["As", "Ad"], "KK", [], n_sim=40000, rng=random.Random(1),
+    )
+    assert aces_vs_kings.method == "monte_carlo"
+    assert aces_vs_kings.win_rate == pytest.approx(0.82, abs=0.01)
+
+    # Against every two cards, hand-vs-range is plain random-opponent equity.
+    any_two = "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32"
+    board = ["7h", "6d", "2c", "Kc", "3s"]
+    exact = pk_adapter.hand_vs_range_equity(["Ah", "Kd"], any_two, board)
+    assert exact.method == "exact" and exact.trials == 990
+    assert exact.win_rate == pytest.approx(pk_adapter.mc_win_rate(["Ah", "Kd"], board, 2, cache=None))
+
+
+def test_range_equity_applies_card_removal():
+    # Only three KK combos survive the Kh on board (each a set of kings over
+    # hero's queens); every QQ combo shares a card with hero or the board.
+    result = pk_adapter.range_equity("QhQd", "KK, QQ", ["Kh", "Qs", "2c", "7d", "8s"])
+    assert result.method == "exact"
+    assert result.trials == 3
+    assert result.win_rate == 0.0
+
+    with pytest.raises(ValueError):
+        pk_adapter.range_equity("AsAh", "AsAh", [])
+    with pytest.raises(ValueError):
+        pk_adapter.range_equity("KhKd", "QQ", ["Kh", "2c", "3d"])
+
+
+@pytest.mark.parametrize("board", [["Xx", "2c", "3d"], ["2d", "2d", "3c"], ["2c", "3c", "4c", "5c", "6c", "7c"]])
+def test_range_equity_rejects_bad_boards(board):
+    with pytest.raises(ValueError):
+        pk_adapter.range_equity("AhKh", "QQ+", board)
+
+
+@pytest.mark.parametrize("hole", [["Ah", "Xx"], ["Ah", "Ah"], ["Ah"], ["Ah", "2c"]])
+def test_hand_vs_range_equity_rejects_bad_hole_cards(hole):
+    # ["Ah", "2c"] overlaps the board.
+    with pytest.raises(ValueError):
+        pk_adapter.hand_vs_range_equity(hole, "QQ+", ["2c", "3d", "4h"])
+
+
+def test_range_vs_range_exact_and_sampled_agree():
+    ranges = ("QQ+, AKs", "76s, 99")
+    board = ["7h", "6d", "2c", "Kc"]
+    exact = pk_adapter.range_equity(*ranges, board)
+    sampled = pk_adapter.range_equity(*ranges, board, n_sim=40000, rng=random.Random(2), max_exact_combos=0)
+    assert exact.method == "exact" and sampled.method == "monte_carlo"
+    assert abs(exact.win_rate - sampled.win_rate) < 4 * sampled.std_error + 0.005
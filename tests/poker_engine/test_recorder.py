@@ -0,0 +1,236 @@
+"""Tests for PerspectiveRecorder's bulk hand persistence.
+
+The row-building tests are pure; the round-trip tests need Postgres (see
+tests/conftest.py) and are skipped automatically if it is unreachable.
+"""
+
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, select
+
+from poker_engine.config import GameConfig, SeatKind, SeatSpec
+from poker_engine.db.models import Action, Game, GamePlayer, Hand, HandPlayer, HandStat
+from poker_engine.recorder import _SeatRef, _SeatTotals
+from poker_engine.stats import _sum_hands, compute_game_stats, compute_player_stats, player_rollup
+from poker_trainer.game.session import GameSession
+
+_CONFIG = GameConfig(
+    small_blind=5,
+    buy_in=1000,
+    seats=[
+        SeatSpec(name="hero", kind=SeatKind.HUMAN, email="bulk-hero@test.local"),
+        SeatSpec(name="tag", kind=SeatKind.TAG),
+        SeatSpec(name="station", kind=SeatKind.STATION),
+    ],
+)
+
+
+def _played(decisions: int = 12) -> GameSession:
+    session = GameSession(_CONFIG, hero_index=0, seed=5)
+    session.start()
+    for _ in range(decisions):
+        if session.pending_ask() is None:
+            break
+        session.apply_hero_action("call", 0)
+    return session
+
+
+def test_hand_rows_link_up():
+    session = _played()
+    recorder = session.recorder
+    gp_by_uuid = {u: SimpleNamespace(id=uuid.uuid4(), seat_index=i) for i, u in enumerate(session.seat_uuids)}
+    game_id = uuid.uuid4()
+    hand_rec = next(h for h in recorder._hands if h.actions and h is not recorder._current)
+
+    hand_row, player_rows, action_rows = recorder._hand_rows(game_id, hand_rec, gp_by_uuid)
+    assert hand_row["game_id"] == game_id
+    assert hand_row["round_count"] == hand_rec.round_count
+    assert [r["game_player_id"] for r in player_rows] == [gp.id for gp in gp_by_uuid.values()]
+    assert {r["hand_id"] for r in player_rows + action_rows} == {hand_row["id"]}
+    assert [r["seq"] for r in action_rows] == [a.seq for a in hand_rec.actions]
+    assert sum(r["amount_won"] for r in player_rows) == 0
+    ids = [hand_row["id"]] + [r["id"] for r in player_rows + action_rows]
+    assert len(set(ids)) == len(ids)
+
+    hero = gp_by_uuid[session.hero_uuid]
+    [stat] = recorder._stat_rows(hand_row, player_rows, action_rows, gp_by_uuid)
+    assert (stat["hand_id"], stat["game_player_id"], stat["hands_dealt"]) == (hand_row["id"], hero.id, 1)
+    hero_row = next(r for r in player_rows if r["game_player_id"] == hero.id)
+    assert stat["position"] == hero_row["position"]
+
+
+class _CountingSession:
+    """Records the tables each statement touches; stands in for a DB session."""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        self.statements.append((statement.__visit_name__, statement.table.name))
+
+    def commit(self):
+        pass
+
+    def get(self, model, ident):
+        return None
+
+
+def test_incremental_saves_only_touch_new_hands_and_changed_seats():
+    session = GameSession(_CONFIG, hero_index=0, seed=5)
+    recorder = session.recorder
+    recorder._game_id = uuid.uuid4()
+    recorder._seat_refs = {u: _SeatRef(uuid.uuid4(), i) for i, u in enumerate(session.seat_uuids)}
+    session.start()
+
+    db = _CountingSession()
+    for _ in range(30):
+        if session.pending_ask() is None:
+            break
+        session.apply_hero_action("call", 0)
+        db.statements.clear()
+        recorder.flush_incremental(db, _CONFIG, hero_engine_uuid=session.hero_uuid)
+        inserts = [t for kind, t in db.statements if kind == "insert"]
+        updates = [t for kind, t in db.statements if kind == "update"]
+        assert len(inserts) <= 5  # hands, players, actions, hand_stats, user_stats
+        assert updates.count("games") == (1 if inserts else 0)  # num_hands
+        assert updates.count("game_players") <= len(_CONFIG.seats)
+
+    # Nothing new: nothing written.
+    db.statements.clear()
+    recorder.flush_incremental(db, _CONFIG, hero_engine_uuid=session.hero_uuid)
+    assert db.statements == []
+
+    # The running totals match a from-scratch recount of the completed hands.
+    completed = [h for h in recorder._hands if h is not recorder._current]
+    recount = {u: _SeatTotals() for u in session.seat_uuids}
+    recorder._accumulate_stats(recount, hands=completed)
+    assert {u: recorder._totals.get(u, _SeatTotals()) for u in session.seat_uuids} == recount
+
+
+class _FailingCommitSession(_CountingSession):
+    def commit(self):
+        raise RuntimeError("db down")
+
+
+def test_a_failed_commit_leaves_the_incremental_state_alone():
+    session = _played()
+    recorder = session.recorder
+    recorder._game_id = uuid.uuid4()
+    recorder._seat_refs = {u: _SeatRef(uuid.uuid4(), i) for i, u in enumerate(session.seat_uuids)}
+
+    with pytest.raises(RuntimeError):
+        recorder.flush_incremental(_FailingCommitSession(), _CONFIG, hero_engine_uuid=session.hero_uuid)
+    assert recorder._persisted_rounds == set() and recorder._totals_rounds == set()
+    assert recorder._totals == {} and recorder._written == {}
+
+    # The next save retries every hand and seat.
+    db = _CountingSession()
+    recorder.flush_incremental(db, _CONFIG, hero_engine_uuid=session.hero_uuid)
+    completed = {h.round_count for h in recorder._hands if h is not recorder._current}
+    assert completed and recorder._persisted_rounds == recorder._totals_rounds == completed
+    assert ("insert", "hands") in db.statements
+    assert [t for kind, t in db.statements if kind == "update"].count("game_players") == len(_CONFIG.seats)
+
+
+def _counts(db, game_id):
+    hands = db.scalar(select(func.count()).select_from(Hand).where(Hand.game_id == game_id))
+    players = db.scalar(
+        select(func.count()).select_from(HandPlayer).join(Hand).where(Hand.game_id == game_id)
+    )
+    actions = db.scalar(
+        select(func.count()).select_from(Action).join(Hand).where(Hand.game_id == game_id)
+    )
+    return hands, players, actions
+
+
+def test_flush_incremental_bulk_writes_each_hand_once(db_session):
+    session = _played(4)
+    game = session.persist_incremental(db_session)
+    first = _counts(db_session, game.id)
+
+    for _ in range(8):
+        if session.pending_ask() is None:
+            break
+        session.apply_hero_action("call", 0)
+    session.persist_incremental(db_session)
+
+    completed = [h for h in session.recorder._hands if h is not session.recorder._current]
+    hands, players, actions = _counts(db_session, game.id)
+    assert hands == len(completed) >= first[0]
+    db_session.refresh(game)
+    assert game.num_hands == hands
+    assert players == 3 * hands
+    assert actions == sum(len(h.actions) for h in completed)
+
+
+def test_incremental_aggregates_match_a_full_recount(db_session):
+    session = _played(2)
+    session.persist_incremental(db_session)
+    for _ in range(10):
+        if session.pending_ask() is None:
+            break
+        session.apply_hero_action("call", 0)
+        game = session.persist_incremental(db_session)
+
+    completed = [h for h in session.recorder._hands if h is not session.recorder._current]
+    for gp in db_session.scalars(select(GamePlayer).filter_by(game_id=game.id)):
+        db_session.refresh(gp)
+        recount = _SeatTotals()
+        session.recorder._accumulate_stats({gp.engine_uuid: recount}, hands=completed)
+        assert (gp.hands_played, gp.hands_won, gp.total_winnings, gp.vpip_count, gp.pfr_count) == (
+            recount.hands_played, recount.hands_won, recount.total_winnings, recount.vpip_count, recount.pfr_count,
+        )
+        assert gp.final_stack == session.recorder._final_stack(gp.engine_uuid)
+
+
+def test_flush_rows_match_the_recording(db_session):
+    session = _played()
+    recorder = session.recorder
+    game = recorder.flush(
+        db_session, _CONFIG, hero_engine_uuid=session.hero_uuid, started_at=session.started_at,
+    )
+    gp_uuid = {gp.id: gp.engine_uuid for gp in db_session.scalars(select(GamePlayer).filter_by(game_id=game.id))}
+    for hand_rec in recorder._hands:
+        hand = db_session.scalars(select(Hand).filter_by(game_id=game.id, round_count=hand_rec.round_count)).one()
+        assert hand.board == hand_rec.board
+        assert hand.street_reached == hand_rec.street_reached
+        stored = sorted(hand.actions, key=lambda a: a.seq)
+        assert [(gp_uuid[a.game_player_id], a.street, a.action, a.amount, a.stack_after) for a in stored] == [
+            (a.engine_uuid, a.street, a.action, a.amount, a.stack_after) for a in hand_rec.actions
+        ]
+        by_uuid = {gp_uuid[hp.game_player_id]: hp for hp in hand.players}
+        assert by_uuid[session.hero_uuid].hole_cards == hand_rec.hero_hole
+    assert db_session.get(Game, game.id).players
+
+
+def test_hand_stats_rows_match_a_replay_of_the_stored_hands(db_session):
+    session = _played(20)
+    game = session.persist_incremental(db_session)
+    hero = next(gp for gp in game.players if gp.engine_uuid == session.hero_uuid)
+
+    stored = db_session.scalar(
+        select(func.count()).select_from(HandStat).where(HandStat.game_player_id == hero.id)
+    )
+    assert stored == len(game.hands)
+    db_session.expire_all()
+    hands = db_session.scalars(select(Hand).filter_by(game_id=game.id)).all()
+    assert compute_game_stats(db_session, game.id, hero.id) == _sum_hands(hands, hero.id)
+
+
+def test_user_rollup_tracks_every_persisted_hand(db_session):
+    session = _played(6)
+    game = session.persist_incremental(db_session)
+    for _ in range(10):
+        if session.pending_ask() is None:
+            break
+        session.apply_hero_action("call", 0)
+        game = session.persist_incremental(db_session)
+
+    assert game.hero_user_id is not None
+    rollup = player_rollup(db_session, game.hero_user_id)
+    assert rollup == compute_player_stats(db_session, game.hero_user_id)
+    assert rollup.hands_dealt >= len(game.hands)
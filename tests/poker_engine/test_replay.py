@@ -0,0 +1,99 @@
+"""Tests for the replay log and replayer in src/poker_engine/replay.py.
+
+Pure computation — no DB.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from poker_engine import pk_adapter
+from poker_engine.config import GameConfig, SeatKind, SeatSpec
+from poker_engine.engine import GameEngine
+from poker_engine.replay import CALL, FOLD, RAISE, ReplayLog, replay_engine, rerun
+
+# Heads-up so nobody busts out mid-game.
+_CONFIG = GameConfig(
+    small_blind=5,
+    buy_in=1000,
+    seats=[SeatSpec(name="tag", kind=SeatKind.TAG), SeatSpec(name="rock", kind=SeatKind.ROCK)],
+    max_round=40,
+)
+
+
+def _board(state) -> list[str]:
+    return pk_adapter.cards_to_strs(c for cards in state.board_cards for c in cards)
+
+
+@pytest.fixture(scope="module")
+def played():
+    engine = GameEngine(_CONFIG, seed=3)
+    result = engine.run(record=False)
+    return engine, result
+
+
+def test_encode_decode_roundtrip(played):
+    _, result = played
+    log = result.replay
+    assert len(log.hands) == 40
+    assert log.n_actions >= 40
+
+    decoded = ReplayLog.decode(log.encode())
+    assert decoded.seed == log.seed == 3
+    assert decoded.config == log.config
+    assert decoded.hands == log.hands
+
+
+def test_actions_pack_into_varints():
+    log = ReplayLog(1, _CONFIG)
+    log.start_hand()
+    log.record("FOLD", 0)
+    log.record("CALL", 10)
+    log.record("RAISE", 300)
+    assert log.hands == [[(FOLD, 0), (CALL, 0), (RAISE, 300)]]
+    empty = len(ReplayLog(1, _CONFIG, hands=[[]]).encode())
+    assert len(log.encode()) - empty == 1 + 1 + 2
+
+
+def test_decode_rejects_garbage():
+    data = ReplayLog(1, _CONFIG, hands=[[(RAISE, 5000)]]).encode()
+    with pytest.raises(ValueError):
+        ReplayLog.decode(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        ReplayLog.decode(data[:-1])
+
+
+def test_full_replay_reproduces_the_game(played):
+    engine, result = played
+    position = replay_engine(ReplayLog.decode(result.replay.encode()))
+    assert position.finished
+    assert position.hand == len(result.replay.hands)
+    assert _board(position.state) == _board(engine.state)
+    final = list(position.stacks)
+    for pk_i, payoff in enumerate(position.state.payoffs):
+        final[position.pk_to_seat[pk_i]] += payoff
+    assert final == [p["stack"] for p in result.players]
+
+
+def test_replay_stops_mid_hand(played):
+    _, result = played
+    log = result.replay
+    hand = next(i for i, actions in enumerate(log.hands, 1) if len(actions) >= 2)
+    position = replay_engine(log, hand=hand, action=1)
+    assert not position.finished
+    assert position.hand == hand
+    assert position.state.status
+    assert position.state.actor_index is not None
+    with pytest.raises(ValueError):
+        replay_engine(log, hand=len(log.hands) + 1)
+
+
+def test_rerun_matches_and_native_log_replays(played):
+    _, result = played
+    assert rerun(result.replay).players == result.players
+
+    native = GameEngine(_CONFIG, seed=3, state_machine="native").run(record=False)
+    assert native.replay.state_machine == "native"
+    assert native.replay.hands == result.replay.hands
+    position = replay_engine(ReplayLog.decode(native.replay.encode()))
+    assert position.finished
@@ -0,0 +1,72 @@
+"""Tests for the headless simulation runner in src/poker_engine/simulate.py.
+
+Pure computation — no DB.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from poker_engine.config import GameConfig, SeatKind, SeatSpec
+from poker_engine.engine import GameEngine, HandRecord
+from poker_engine.simulate import aggregate, run_simulation
+
+
+def _config(*kinds: SeatKind) -> GameConfig:
+    return GameConfig(
+        small_blind=5,
+        buy_in=500,
+        seats=[SeatSpec(name=f"s{i}", kind=k) for i, k in enumerate(kinds)],
+    )
+
+
+def test_hands_are_zero_sum_and_start_from_buy_in():
+    config = _config(SeatKind.TAG, SeatKind.LAG, SeatKind.STATION)
+    for record in GameEngine(config, seed=3).simulate(30):
+        assert sum(record.deltas) == 0
+        assert [s - d for s, d in zip(record.stacks, record.deltas)] == [500] * 3
+        assert set(record.winners) <= {0, 1, 2}
+        assert len(record.showdown) != 1
+
+
+def test_simulate_leaves_the_engine_replay_log_alone():
+    engine = GameEngine(_config(SeatKind.TAG, SeatKind.LAG), seed=3)
+    replay = engine.replay
+    assert len(list(engine.simulate(5))) == 5
+    assert engine.replay is replay and replay.hands == []
+
+
+def test_simulation_is_deterministic_for_a_seed():
+    config = _config(SeatKind.TAG, SeatKind.ROCK)
+    first = list(run_simulation(config, 3, 10, seed=7, workers=0))
+    second = list(run_simulation(config, 3, 10, seed=7, workers=0))
+    assert first == second
+    assert len(first) == 30
+
+
+def test_process_pool_matches_in_process():
+    config = _config(SeatKind.LAG, SeatKind.STATION)
+    serial = sorted(run_simulation(config, 4, 5, seed=1, workers=0), key=lambda r: (r[0], r[1].hand))
+    pooled = sorted(run_simulation(config, 4, 5, seed=1, workers=2), key=lambda r: (r[0], r[1].hand))
+    assert pooled == serial
+
+
+def test_aggregate_pools_by_style():
+    config = _config(SeatKind.TAG, SeatKind.TAG, SeatKind.ROCK)
+    records = [
+        HandRecord(1, (510, 500, 490), (10, 0, -10), (0,), (), 0),
+        HandRecord(2, (490, 500, 510), (-10, 0, 10), (2,), (0, 2), 3),
+    ]
+    results = aggregate(config, records)
+    assert results["tag"].hands == 4
+    assert results["tag"].bb_per_100 == 0.0
+    assert results["rock"].hands == 2
+    assert results["rock"].bb_per_100 == 0.0
+    assert results["rock"].showdown_rate == 0.5
+    assert results["rock"].ci95 == pytest.approx(1.96 * 10 / 10 * 100)
+
+
+def test_rejects_human_seats():
+    config = _config(SeatKind.HUMAN, SeatKind.TAG)
+    with pytest.raises(ValueError):
+        list(run_simulation(config, 1, 1, workers=0))
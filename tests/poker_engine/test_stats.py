@@ -7,8 +7,8 @@ functions without a database.
 
 from __future__ import annotations
 
-from poker_engine.db.models import Action, Hand, HandPlayer, Street
-from poker_engine.stats import RawStatCounts, compute_hand_stats, to_display
+from poker_engine.db.models import Action, Hand, HandPlayer, HandStat, Street
+from poker_engine.stats import COUNTER_FIELDS, RawStatCounts, compute_hand_stats, stat_row, to_display
 
 HERO = "hero-gp"
 VILLAIN = "villain-gp"
@@ -266,8 +266,51 @@ def test_rollup_is_sum_not_average():
     assert abs(display["vpip"]["pct"] - 17.5) > 1.0
 
 
+def test_in_place_sum_matches_sum_and_leaves_operands_alone():
+    btn = RawStatCounts(hands_dealt=1, vpip_hands=1)
+    btn.set_position("BTN")
+    bb = RawStatCounts(hands_dealt=1, cbet_flop=1)
+    bb.set_position("BB")
+    other_btn = RawStatCounts(hands_dealt=1, by_position={"BTN": RawStatCounts(hands_dealt=1)})
+
+    total = RawStatCounts()
+    for counts in (btn, bb, other_btn):
+        total += counts
+    assert total == btn + bb + other_btn
+    assert (total.hands_dealt, total.vpip_hands, total.cbet_flop) == (3, 1, 1)
+    assert total.by_position["BTN"].hands_dealt == 2
+    assert total.by_position["BTN"].vpip_hands == 1
+    assert total.by_position["BB"].cbet_flop == 1
+    assert btn.hands_dealt == 1 and btn.by_position["BTN"].hands_dealt == 1
+
+
+def test_by_position_views_write_through_to_the_rows():
+    counts = RawStatCounts(hands_dealt=1, vpip_hands=1)
+    counts.set_position("BTN")
+    values = counts._values
+
+    counts += RawStatCounts(hands_dealt=1)
+    assert counts._values is values  # updated in place
+
+    counts.by_position["BTN"] += RawStatCounts(hands_dealt=2, pfr_hands=1)
+    assert (counts.by_position["BTN"].hands_dealt, counts.by_position["BTN"].pfr_hands) == (3, 1)
+    assert counts.hands_dealt == 2  # the totals are a separate row
+
+
 def test_to_display_zero_denominator_shows_zero_not_error():
     counts = RawStatCounts()
     display = to_display(counts)
     assert display["vpip"] == {"pct": 0.0, "n": 0, "d": 0}
     assert display["hands_dealt"] == 0
+
+
+def test_stat_row_covers_every_hand_stats_column():
+    hand = _hand(
+        Street.PREFLOP, False,
+        [_hp(HERO, position="CO"), _hp(VILLAIN)],
+        [_act(HERO, Street.PREFLOP, "raise", 30, 0), _act(VILLAIN, Street.PREFLOP, "fold", 0, 1)],
+    )
+    row = stat_row(compute_hand_stats(hand, HERO))
+    columns = {c.name for c in HandStat.__table__.columns} - {"hand_id", "game_player_id"}
+    assert set(row) == columns == set(COUNTER_FIELDS) | {"position"}
+    assert (row["position"], row["vpip_hands"], row["pfr_hands"]) == ("CO", 1, 1)
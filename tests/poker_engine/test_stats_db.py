@@ -7,8 +7,19 @@ from __future__ import annotations
 
 import uuid
 
-from poker_engine.db.models import Action, Game, GamePlayer, Hand, HandPlayer, Street, User
-from poker_engine.stats import compute_game_stats, compute_player_stats
+from sqlalchemy import func, select
+
+from poker_engine import stats
+from poker_engine.db.models import Action, Game, GamePlayer, Hand, HandPlayer, HandStat, Street, User, UserStat
+from poker_engine.stats import (
+    add_to_rollups,
+    compute_game_stats,
+    compute_hand_stats,
+    compute_player_stats,
+    player_rollup,
+    rebuild_player_rollup,
+    stat_row,
+)
 
 
 def _make_user(db, email="hero@test.local"):
@@ -139,3 +150,105 @@ def test_compute_player_stats_rollup_across_games_exact_case(db_session):
     counts = compute_player_stats(db, user.id)
     assert counts.hands_dealt == 30
     assert counts.vpip_hands == 4
+
+
+def test_materialized_and_unmaterialized_hands_sum_together(db_session):
+    """Hands with a hand_stats row are summed in SQL; older hands without one
+    are replayed — either way each hand counts exactly once."""
+    db = db_session
+    user = _make_user(db, email="materialized@test.local")
+    game, hero_gp, villain_gp = _make_game(db, user)
+    materialized = _add_hand(db, game, hero_gp, villain_gp, round_count=0, hero_action="raise")
+    _add_hand(db, game, hero_gp, villain_gp, round_count=1, hero_action="call")
+    db.refresh(materialized)
+    db.add(HandStat(
+        hand_id=materialized.id, game_player_id=hero_gp.id,
+        **stat_row(compute_hand_stats(materialized, hero_gp.id)),
+    ))
+    db.flush()
+
+    counts = compute_game_stats(db, game.id, hero_gp.id)
+    assert (counts.hands_dealt, counts.vpip_hands, counts.pfr_hands) == (2, 2, 1)
+    assert counts.by_position["BTN"].hands_dealt == 2
+    assert compute_player_stats(db, user.id) == counts
+
+
+def test_rebuild_player_rollup_backfills_unmaterialized_hands(db_session, monkeypatch):
+    monkeypatch.setattr(stats, "_REPLAY_BATCH", 3)  # page the backfill
+    db = db_session
+    user = _make_user(db, email="rollup@test.local")
+    for _ in range(2):
+        game, hero_gp, villain_gp = _make_game(db, user)
+        _add_hand(db, game, hero_gp, villain_gp, round_count=0, hero_action="raise")
+        _add_hand(db, game, hero_gp, villain_gp, round_count=1, hero_action="call")
+    # Hand-built rows: no rollup yet, so reads fall back to an exact recount.
+    assert db.scalar(select(func.count()).select_from(UserStat).where(UserStat.user_id == user.id)) == 0
+    assert player_rollup(db, user.id).hands_dealt == 4
+
+    rebuilt = rebuild_player_rollup(db, user.id)
+    assert rebuilt == compute_player_stats(db, user.id) == player_rollup(db, user.id)
+    assert (rebuilt.hands_dealt, rebuilt.vpip_hands, rebuilt.pfr_hands) == (4, 4, 2)
+    assert rebuilt.by_position["BTN"].hands_dealt == 4
+    # Idempotent: the second run finds nothing to backfill and recounts the same.
+    assert rebuild_player_rollup(db, user.id) == rebuilt
+    assert db.scalar(select(func.count()).select_from(HandStat)
+                     .where(HandStat.game_player_id == hero_gp.id)) == 2
+
+
+def _materialize(db, hand, *game_players):
+    """Write the hand's hand_stats rows and roll them up, as the recorder does."""
+    db.refresh(hand)
+    db.add_all([
+        HandStat(hand_id=hand.id, game_player_id=gp.id, **stat_row(compute_hand_stats(hand, gp.id)))
+        for gp in game_players
+    ])
+    db.flush()
+    add_to_rollups(db, [hand.id])
+
+
+def test_rollup_includes_hands_older_than_the_first_materialized_one(db_session):
+    """A user with pre-hand_stats games keeps full stats after a new hand
+    starts their rollup."""
+    db = db_session
+    user = _make_user(db, email="partial-rollup@test.local")
+    old_game, old_hero, old_villain = _make_game(db, user)
+    _add_hand(db, old_game, old_hero, old_villain, round_count=0, hero_action="call")
+    game, hero_gp, villain_gp = _make_game(db, user)
+    _materialize(db, _add_hand(db, game, hero_gp, villain_gp, round_count=0, hero_action="raise"), hero_gp)
+
+    assert db.scalar(select(func.count()).select_from(UserStat).where(UserStat.user_id == user.id)) == 1
+    rollup = player_rollup(db, user.id)
+    assert rollup == compute_player_stats(db, user.id)
+    assert (rollup.hands_dealt, rollup.vpip_hands, rollup.pfr_hands) == (2, 2, 1)
+
+
+def test_rollup_only_counts_the_games_hero_seat(db_session):
+    db = db_session
+    hero = _make_user(db, email="rollup-hero@test.local")
+    guest = _make_user(db, email="rollup-guest@test.local")
+    game, hero_gp, villain_gp = _make_game(db, hero)
+    villain_gp.user_id, villain_gp.is_bot = guest.id, False  # a linked human seat, not the hero
+    db.flush()
+    hand = _add_hand(db, game, hero_gp, villain_gp, round_count=0)
+    _materialize(db, hand, hero_gp, villain_gp)
+
+    assert player_rollup(db, hero.id).hands_dealt == 1
+    assert db.scalar(select(func.count()).select_from(UserStat).where(UserStat.user_id == guest.id)) == 0
+
+
+def test_deleting_a_game_deletes_its_hand_stats(db_session):
+    db = db_session
+    user = _make_user(db, email="cascade@test.local")
+    game, hero_gp, villain_gp = _make_game(db, user)
+    for round_count in range(2):
+        _materialize(db, _add_hand(db, game, hero_gp, villain_gp, round_count=round_count), hero_gp)
+    hero_id = hero_gp.id
+    db.expire_all()
+
+    db.delete(db.get(Hand, db.scalars(select(Hand.id).filter_by(game_id=game.id, round_count=0)).one()))
+    db.flush()
+    assert db.scalar(select(func.count()).select_from(HandStat).where(HandStat.game_player_id == hero_id)) == 1
+
+    db.delete(db.get(Game, game.id))
+    db.flush()
+    assert db.scalar(select(func.count()).select_from(HandStat).where(HandStat.game_player_id == hero_id)) == 0
@@ -0,0 +1,115 @@
+"""API tests: GET /api/games and GET /api/games/{game_id}/hands page by keyset
+cursor and read the hero's results from a join.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from poker_engine.db.models import Game, GamePlayer, Hand, HandPlayer, Street, User
+from poker_trainer.auth.deps import get_db, require_user
+from poker_trainer.main import app
+
+_T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _make_user(db, email):
+    user = User(email=email, display_name="Someone")
+    db.add(user)
+    db.flush()
+    return user
+
+
+def _make_game(db, hero_user, started_at, hands=0, net=0):
+    game = Game(
+        small_blind=50, big_blind=100, buy_in=10000, max_round=50,
+        hero_user_id=hero_user.id, started_at=started_at, num_hands=hands,
+    )
+    db.add(game)
+    db.flush()
+    hero = GamePlayer(
+        game_id=game.id, seat_index=0, display_name="Hero", engine_uuid="hero-uuid",
+        user_id=hero_user.id, is_bot=False, starting_stack=10000, total_winnings=net,
+    )
+    bot = GamePlayer(
+        game_id=game.id, seat_index=1, display_name="Bot", engine_uuid="bot-uuid",
+        is_bot=True, starting_stack=10000,
+    )
+    db.add_all([hero, bot])
+    db.flush()
+    for round_count in range(1, hands + 1):
+        hand = Hand(game_id=game.id, round_count=round_count, street_reached=Street.FLOP, pot_total=300)
+        db.add(hand)
+        db.flush()
+        db.add_all([
+            HandPlayer(hand_id=hand.id, game_player_id=hero.id, is_winner=round_count % 2 == 1,
+                       amount_won=150 if round_count % 2 else -150),
+            HandPlayer(hand_id=hand.id, game_player_id=bot.id, is_winner=round_count % 2 == 0,
+                       amount_won=-150 if round_count % 2 else 150),
+        ])
+    db.flush()
+    return game
+
+
+def _client(db, user) -> TestClient:
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[require_user] = lambda: user
+    return TestClient(app)
+
+
+def test_list_games_pages_newest_first(db_session):
+    db = db_session
+    owner = _make_user(db, "pager@test.local")
+    games = [_make_game(db, owner, _T0 + timedelta(days=i), hands=i, net=10 * i) for i in range(5)]
+    games.append(_make_game(db, owner, None))  # not started yet: listed last
+    try:
+        client = _client(db, owner)
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+            body = client.get("/api/games", params=params).json()
+            assert len(body["games"]) <= 2
+            seen += body["games"]
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+    finally:
+        app.dependency_overrides.clear()
+
+    expected = list(reversed(games[:5])) + [games[5]]
+    assert [g["game_id"] for g in seen] == [str(g.id) for g in expected]
+    assert [(g["num_hands"], g["hero_net"]) for g in seen[:5]] == [(i, 10 * i) for i in range(4, -1, -1)]
+
+
+def test_list_games_rejects_a_bad_cursor(db_session):
+    owner = _make_user(db_session, "badcursor@test.local")
+    try:
+        resp = _client(db_session, owner).get("/api/games", params={"cursor": "not-a-cursor"})
+        assert resp.status_code == 400
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_list_hands_pages_by_round_with_hero_results(db_session):
+    db = db_session
+    owner = _make_user(db, "hands-pager@test.local")
+    game = _make_game(db, owner, _T0, hands=5)
+    try:
+        client = _client(db, owner)
+        first = client.get(f"/api/games/{game.id}/hands", params={"limit": 3}).json()
+        rest = client.get(
+            f"/api/games/{game.id}/hands", params={"limit": 3, "cursor": first["next_cursor"]},
+        ).json()
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first["num_hands"] == 5
+    assert [h["round_count"] for h in first["hands"]] == [1, 2, 3]
+    assert first["next_cursor"] == 3
+    assert [h["round_count"] for h in rest["hands"]] == [4, 5]
+    assert rest["next_cursor"] is None
+    assert [(h["hero_won"], h["hero_amount"]) for h in first["hands"] + rest["hands"]] == [
+        (True, 150), (False, -150), (True, 150), (False, -150), (True, 150),
+    ]
@@ -0,0 +1,115 @@
+"""Write-behind save queue: saves run off the loop under the game lock,
+coalesce per game, and report depth/lag. Stub sessions in an in-process
+store — no DB.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from poker_trainer.game.manager import SessionManager
+from poker_trainer.save_queue import SaveQueue
+
+
+class _Stub:
+    def __init__(self, game_id):
+        self.game_id = game_id
+
+
+def _store(tmp_path, *game_ids):
+    store = SessionManager(spill_dir=tmp_path)
+    for game_id in game_ids:
+        asyncio.run(store.add(_Stub(game_id)))
+    return store
+
+
+def test_saves_run_in_a_thread_and_push_results(tmp_path):
+    store = _store(tmp_path, "g1")
+    results = []
+
+    def job(session):
+        return (session.game_id, threading.current_thread() is threading.main_thread())
+
+    async def main():
+        queue = SaveQueue(store, workers=1)
+
+        async def on_done(result):
+            results.append(result)
+
+        queue.submit("g1", job, on_done)
+        await queue.drain()
+        await queue.stop()
+        return queue.stats()
+
+    stats = asyncio.run(main())
+    assert results == [("g1", False)]
+    assert stats["saved"] == 1 and stats["depth"] == 0 and stats["failed"] == 0
+
+
+def test_queued_saves_for_a_game_coalesce(tmp_path):
+    store = _store(tmp_path, "g1")
+    calls, results = [], []
+
+    async def main():
+        queue = SaveQueue(store, workers=2)
+
+        async def on_done(result):
+            results.append(result)
+
+        # Holding the game lock (as the WS handler does mid-stream) keeps the
+        # first save queued while more hands finish.
+        async with store.lock("g1"):
+            for n in range(3):
+                queue.submit("g1", lambda session, n=n: calls.append(n) or n, on_done)
+            await asyncio.sleep(0.05)
+            stats = queue.stats()
+            assert stats["depth"] == 1 and stats["coalesced"] == 2
+            assert stats["oldest_wait_s"] > 0
+            assert calls == []
+        await queue.drain()
+        await queue.stop()
+        return queue.stats()
+
+    stats = asyncio.run(main())
+    assert calls == [2]  # only the latest job runs
+    assert results == [2, 2, 2]  # every submitter hears back
+    assert stats["saved"] == 1 and stats["last_lag_s"] >= 0.05
+
+
+def test_failures_are_counted_and_do_not_stop_the_worker(tmp_path):
+    store = _store(tmp_path, "g1", "g2")
+
+    def boom(session):
+        raise RuntimeError("db down")
+
+    async def main():
+        queue = SaveQueue(store, workers=1)
+        queue.submit("g1", boom)
+        queue.submit("g2", lambda session: None)
+        await queue.drain()
+        await queue.stop()
+        return queue.stats()
+
+    stats = asyncio.run(main())
+    assert stats["failed"] == 1 and stats["saved"] == 1
+
+
+def test_discarded_and_removed_games_are_skipped(tmp_path):
+    store = _store(tmp_path, "g1", "g2")
+    calls = []
+
+    async def main():
+        queue = SaveQueue(store, workers=1)
+        async with store.lock("g1"):
+            queue.submit("g1", lambda session: calls.append("g1"))
+            queue.submit("g2", lambda session: calls.append("g2"))
+            queue.discard("g1")
+            await store.remove("g2")
+        await queue.drain()
+        await queue.stop()
+        return queue.stats()
+
+    stats = asyncio.run(main())
+    assert calls == []
+    assert stats["saved"] == 0 and stats["depth"] == 0
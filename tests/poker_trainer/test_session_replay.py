@@ -0,0 +1,55 @@
+"""GameSession.from_replay rebuilds a live session from its replay log.
+
+Pure computation — no DB.
+"""
+
+from __future__ import annotations
+
+from poker_engine.config import GameConfig, SeatKind, SeatSpec
+from poker_engine.replay import ReplayLog
+from poker_trainer.game.session import GameSession
+
+_CONFIG = GameConfig(
+    small_blind=5,
+    buy_in=1000,
+    seats=[
+        SeatSpec(name="hero", kind=SeatKind.HUMAN),
+        SeatSpec(name="tag", kind=SeatKind.TAG),
+        SeatSpec(name="station", kind=SeatKind.STATION),
+    ],
+)
+
+
+def _strip_uuids(ask: dict) -> dict:
+    """Seat uuids are minted per session object, not derived from the log."""
+    view = dict(ask["view"], seats=[{k: v for k, v in s.items() if k != "uuid"} for s in ask["view"]["seats"]])
+    return dict(ask, view=view)
+
+
+def _play(decisions: int) -> GameSession:
+    session = GameSession(_CONFIG, hero_index=0, seed=4)
+    session.start()
+    for _ in range(decisions):
+        if session.pending_ask() is None:
+            break
+        session.apply_hero_action("call", 0)
+    return session
+
+
+def test_from_replay_restores_the_session():
+    live = _play(12)
+    rebuilt = GameSession.from_replay(ReplayLog.decode(live.replay_log.encode()))
+
+    assert rebuilt.replay_log.hands == live.replay_log.hands
+    assert rebuilt._hand_num == live._hand_num
+    assert rebuilt._stacks == live._stacks
+    assert rebuilt._board == live._board
+    assert rebuilt._hero_hole == live._hero_hole
+    assert _strip_uuids(rebuilt.pending_ask()) == _strip_uuids(live.pending_ask())
+
+
+def test_from_replay_stops_at_a_prefix():
+    live = _play(12)
+    rebuilt = GameSession.from_replay(live.replay_log, hand=2, action=1)
+    assert rebuilt._hand_num == 2
+    assert rebuilt.replay_log.hands == live.replay_log.hands[:1] + [live.replay_log.hands[1][:1]]
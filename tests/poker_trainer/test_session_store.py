@@ -0,0 +1,318 @@
+"""Session stores: GameSession snapshots and the Redis-backed store.
+
+The Redis store runs against ``_FakeRedis``, an in-process stand-in for the
+handful of commands it uses (including its two lock scripts). No DB.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import random
+import time
+
+import pytest
+
+from poker_engine.config import GameConfig, SeatKind, SeatSpec
+from poker_trainer.game import manager as manager_mod
+from poker_trainer.game.manager import RedisSessionStore, SessionManager, create_store
+from poker_trainer.game.session import GameSession
+
+_CONFIG = GameConfig(
+    small_blind=5,
+    buy_in=1000,
+    seats=[
+        SeatSpec(name="hero", kind=SeatKind.HUMAN),
+        SeatSpec(name="tag", kind=SeatKind.TAG),
+        SeatSpec(name="lag", kind=SeatKind.LAG),
+        SeatSpec(name="station", kind=SeatKind.STATION),
+    ],
+)
+
+
+class _FakeRedis:
+    """The async (``redis.asyncio``) surface the store uses, kept in a dict."""
+
+    def __init__(self):
+        self._data: dict[str, tuple[bytes, float | None]] = {}
+        self.transactions = 0
+
+    def _live(self, key):
+        item = self._data.get(key)
+        if item is not None and item[1] is not None and item[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return item
+
+    def _get(self, key):
+        item = self._live(key)
+        return None if item is None else item[0]
+
+    def _set(self, key, value, nx=False, px=None, ex=None):
+        if nx and self._live(key) is not None:
+            return None
+        if isinstance(value, str):
+            value = value.encode()
+        ttl = px / 1000 if px is not None else ex
+        self._data[key] = (value, None if ttl is None else time.monotonic() + ttl)
+        return True
+
+    async def get(self, key):
+        return self._get(key)
+
+    async def set(self, key, value, nx=False, px=None, ex=None):
+        return self._set(key, value, nx=nx, px=px, ex=ex)
+
+    async def incr(self, key):
+        item = self._live(key)
+        value = int(item[0]) + 1 if item else 1
+        self._data[key] = (str(value).encode(), item[1] if item else None)
+        return value
+
+    async def expire(self, key, seconds):
+        item = self._live(key)
+        if item is not None:
+            self._data[key] = (item[0], time.monotonic() + seconds)
+
+    async def strlen(self, key):
+        value = self._get(key)
+        return 0 if value is None else len(value)
+
+    async def scan_iter(self, match="*"):
+        for key in [key for key in list(self._data) if fnmatch.fnmatchcase(key, match) and self._live(key)]:
+            yield key
+
+    async def delete(self, *keys):
+        for key in keys:
+            self._data.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def eval(self, script, numkeys, key, token, *args):
+        if self._get(key) != token.encode():
+            return 0
+        if script is manager_mod._RELEASE_SCRIPT:
+            self._data.pop(key, None)
+        else:
+            self._set(key, token, px=int(args[0]))
+        return 1
+
+
+class _FakePipeline:
+    """Buffers commands and applies them together on ``execute`` (MULTI/EXEC)."""
+
+    def __init__(self, client: _FakeRedis):
+        self._client = client
+        self._calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self._calls.clear()
+
+    def __getattr__(self, name):
+        def buffer(*args, **kwargs):
+            self._calls.append((getattr(self._client, name), args, kwargs))
+            return self
+        return buffer
+
+    async def execute(self):
+        self._client.transactions += 1
+        return [await command(*args, **kwargs) for command, args, kwargs in self._calls]
+
+
+def _session(decisions: int = 8) -> GameSession:
+    session = GameSession(_CONFIG, hero_index=0, seed=21)
+    session.preflop_quick = [2.0, 3.0]
+    session.start()
+    for _ in range(decisions):
+        if session.pending_ask() is None:
+            break
+        session.apply_hero_action("call", 0)
+    return session
+
+
+class _Stub:
+    def __init__(self, game_id):
+        self.game_id = game_id
+
+
+def test_snapshot_roundtrip_mid_game():
+    live = _session()
+    restored = GameSession.decode(live.encode())
+    assert restored.game_id == live.game_id
+    assert restored.seat_uuids == live.seat_uuids
+    assert restored.started_at == live.started_at
+    assert restored.preflop_quick == [2.0, 3.0]
+    assert restored.current_view() == live.current_view()
+    assert restored.pending_ask() == live.pending_ask()
+    assert restored.replay_log.hands == live.replay_log.hands
+
+    # Play continues from the restored decision point with live bots.
+    n_actions = restored.replay_log.n_actions
+    assert restored.apply_hero_action("call", 0)
+    assert restored.replay_log.n_actions > n_actions
+
+
+def test_snapshot_of_unstarted_session_is_not_started():
+    session = GameSession(_CONFIG, hero_index=0)
+    restored = GameSession.decode(session.encode())
+    assert restored._last_view is None
+    assert restored.deal_seed == session.deal_seed
+    assert restored.start() and restored.pending_ask() is not None
+
+
+def test_snapshot_reseeds_bots_from_the_session_seed():
+    seeded = GameSession.decode(_session().encode())
+    assert seeded.seed == 21 and seeded.deal_seed == 21
+    assert seeded._bot_players[1]._rng.getstate() == random.Random(21 + 1).getstate()
+
+    # An unseeded game restores with unseeded bots, not deal_seed + index.
+    unseeded = GameSession(_CONFIG, hero_index=0)
+    unseeded.start()
+    restored = GameSession.decode(unseeded.encode())
+    assert restored.seed is None and restored.deal_seed == unseeded.deal_seed
+    assert restored.current_view() == unseeded.current_view()
+    assert restored._bot_players[1]._rng.getstate() != random.Random(unseeded.deal_seed + 1).getstate()
+
+
+def test_snapshot_rejects_garbage():
+    with pytest.raises(ValueError):
+        GameSession.decode(b"nope")
+
+
+def test_redis_store_is_shared_between_workers():
+    client = _FakeRedis()
+    worker_a, worker_b = RedisSessionStore(client), RedisSessionStore(client)
+    session = _session(0)
+
+    async def main():
+        await worker_a.add(session)
+        seen = await worker_b.get(session.game_id)
+        assert seen is not session
+        assert seen.current_view() == session.current_view()
+        assert await worker_b.get(session.game_id) is seen  # cached until the revision moves
+
+        seen.apply_hero_action("call", 0)
+        await worker_b.save(seen)
+        assert (await worker_a.get(session.game_id)).current_view() == seen.current_view()
+        # Each save is one transaction; the revision expires with its snapshot.
+        assert client.transactions == 2
+        assert client._live(worker_a._key(session.game_id, "rev"))[1] is not None
+
+        await worker_a.remove(session.game_id)
+        assert await worker_b.get(session.game_id) is None
+
+    asyncio.run(main())
+
+
+def test_redis_lock_excludes_other_workers():
+    client = _FakeRedis()
+    worker_a, worker_b = RedisSessionStore(client), RedisSessionStore(client)
+    order = []
+
+    async def hold(store, name):
+        async with store.lock("g1"):
+            order.append(f"{name} in")
+            await asyncio.sleep(0.05)
+            order.append(f"{name} out")
+
+    async def main():
+        await asyncio.gather(hold(worker_a, "a"), hold(worker_b, "b"))
+
+    asyncio.run(main())
+    assert order in (["a in", "a out", "b in", "b out"], ["b in", "b out", "a in", "a out"])
+
+
+def test_redis_lock_is_kept_alive_and_released_only_by_owner():
+    client = _FakeRedis()
+    store = RedisSessionStore(client, lock_ttl_s=0.06)
+    key = store._key("g1", "lock")
+
+    async def main():
+        lock = store.lock("g1")
+        async with lock:
+            await asyncio.sleep(0.15)  # outlives the TTL; the keepalive extends it
+            assert client._get(key) is not None
+            keepalive = lock._keepalive
+            client._set(key, "someone-else")
+        assert keepalive.done()  # stopped before the release ran
+        assert client._get(key) == b"someone-else"
+
+    asyncio.run(main())
+
+
+def test_idle_sessions_spill_to_disk_and_rehydrate(tmp_path):
+    store = SessionManager(idle_s=60, spill_dir=tmp_path, stats_ttl_s=0)
+    idle, busy = _session(), _session(0)
+    now = time.monotonic() + 120
+
+    async def main():
+        await store.add(idle)
+        await store.add(busy)
+        async with store.lock(busy.game_id):  # a stream in flight
+            assert await store.evict_idle(now=now) == [idle.game_id]
+        assert idle.game_id not in store._locks  # nobody holds it: no entry left
+        stats = await store.stats()
+        assert stats["live"] == 1 and stats["spilled"] == 1
+        assert stats["spilled_bytes"] == (tmp_path / f"{idle.game_id}.pkgs").stat().st_size
+        assert stats["live_bytes"] > 10 * stats["spilled_bytes"]
+        assert stats["total_bytes"] == stats["live_bytes"] + stats["spilled_bytes"]
+
+        # Two reconnects at once share one decode.
+        back, again = await asyncio.gather(store.get(idle.game_id), store.get(idle.game_id))
+        assert back is again and back is not idle
+        assert back.pending_ask() == idle.pending_ask()
+        assert (await store.stats())["spilled"] == 0
+        assert await store.evict_idle() == []  # just touched
+
+        assert len(await store.evict_idle(now=time.monotonic() + 120)) == 2
+        await store.remove(idle.game_id)
+        await store.remove(busy.game_id)
+        assert await store.get(idle.game_id) is None
+
+    asyncio.run(main())
+    assert not list(tmp_path.iterdir())
+
+
+def test_redis_store_evicts_only_its_cache():
+    client = _FakeRedis()
+    store = RedisSessionStore(client, idle_s=60, stats_ttl_s=0)
+    session = _session(0)
+
+    async def main():
+        await store.add(session)
+        assert (await store.stats())["live"] == 1
+
+        assert await store.evict_idle(now=time.monotonic() + 120) == [session.game_id]
+        stats = await store.stats()
+        assert stats["live"] == 0 and stats["spilled"] == 1
+        assert stats["spilled_bytes"] == len(session.encode())
+        assert (await store.get(session.game_id)).current_view() == session.current_view()
+
+    asyncio.run(main())
+
+
+def test_stats_are_cached_and_sampled(tmp_path, monkeypatch):
+    monkeypatch.setattr(manager_mod, "_SIZE_SAMPLE", 2)
+    monkeypatch.setattr(manager_mod, "approx_size", lambda session: 100)
+    store = SessionManager(spill_dir=tmp_path, stats_ttl_s=60)
+
+    async def main():
+        for n in range(5):
+            await store.add(_Stub(f"g{n}"))
+        first = await store.stats()
+        await store.add(_Stub("g5"))
+        return first, await store.stats()
+
+    first, cached = asyncio.run(main())
+    assert first["live"] == 5 and first["live_bytes"] == 500  # 2 measured, 5 counted
+    assert cached is first
+
+
+def test_create_store():
+    assert isinstance(create_store("memory"), SessionManager)
+    with pytest.raises(ValueError):
+        create_store("sqlite")
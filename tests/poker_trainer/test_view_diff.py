@@ -0,0 +1,90 @@
+"""View diffs: every event view streamed to a delta client can be rebuilt
+exactly from the keyframes and diffs ``ViewEncoder`` emits.
+
+Pure computation — no DB.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from poker_engine.config import GameConfig, SeatKind, SeatSpec
+from poker_trainer.game.serialize import ViewEncoder, apply_view_diff, diff_view
+from poker_trainer.game.session import GameSession
+from poker_trainer.ws import _event_message, _init_message
+
+_CONFIG = GameConfig(
+    small_blind=5,
+    buy_in=1000,
+    seats=[SeatSpec(name="hero", kind=SeatKind.HUMAN)] + [
+        SeatSpec(name=f"bot{i}", kind=kind)
+        for i, kind in enumerate([SeatKind.TAG, SeatKind.LAG, SeatKind.STATION, SeatKind.ROCK] * 2)
+    ],
+)
+
+
+def _events(decisions: int = 15) -> tuple[GameSession, list[dict]]:
+    session = GameSession(_CONFIG, hero_index=0, seed=11)
+    events = session.start()
+    for _ in range(decisions):
+        if session.pending_ask() is None:
+            break
+        events += session.apply_hero_action("call", 0)
+    return session, events
+
+
+def test_client_rebuilds_every_view():
+    session, events = _events()
+    encoder = ViewEncoder()
+    init = _init_message(session, encoder)
+    assert init["views"] == "delta"
+    base = json.loads(json.dumps(init["view"]))
+    full_bytes = diff_bytes = 0
+    for event in events:
+        if "view" not in event:
+            continue
+        msg = json.loads(json.dumps(_event_message(event, encoder)))["event"]
+        if "view_diff" in msg:
+            base = apply_view_diff(base, msg["view_diff"])
+            diff_bytes += len(json.dumps(msg["view_diff"]))
+            full_bytes += len(json.dumps(event["view"]))
+        else:
+            base = msg["view"]
+        assert base == json.loads(json.dumps(event["view"]))
+    assert diff_bytes * 3 < full_bytes
+
+
+def test_keyframes_on_new_hand_and_interval():
+    _, events = _events()
+    views = [e["view"] for e in events if "view" in e]
+    encoder = ViewEncoder(keyframe_interval=3)
+    kinds = [encoder.encode(v)[0] for v in views]
+    assert kinds[0] == "view"
+    since = 0
+    for prev, view, kind in zip(views, views[1:], kinds[1:]):
+        if view["round_count"] != prev["round_count"]:
+            assert kind == "view"
+        if kind == "view_diff":
+            since += 1
+            assert since <= 3
+        else:
+            since = 0
+    assert "view_diff" in kinds
+
+
+def test_full_views_without_negotiation():
+    session, events = _events(2)
+    assert _init_message(session, None)["views"] == "full"
+    for event in events:
+        assert _event_message(event, None) == {"type": "event", "event": event}
+
+
+def test_diff_against_wrong_version_rejected():
+    _, events = _events(2)
+    views = [e["view"] for e in events if "view" in e]
+    diff = diff_view(views[0], views[1])
+    assert diff["base"] == views[0]["version"]
+    with pytest.raises(ValueError):
+        apply_view_diff(views[1], diff)
@@ -0,0 +1,170 @@
+"""WS pacing: the pipelined stream computes bot turns while the client
+animates, without reordering or dropping events.
+
+Uses a fake socket and a fake event generator whose steps "compute" by
+sleeping, so timings are predictable. No DB.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from poker_trainer import ws
+
+
+class _FakeSocket:
+    def __init__(self):
+        self.sent: list[dict] = []
+
+    async def send_json(self, msg: dict) -> None:
+        self.sent.append(msg)
+
+
+def _gen(n_bots: int, compute_s: float):
+    """Mimics _advance_gen: [to_act] then a bot's compute before the next step."""
+    for i in range(n_bots):
+        yield [{"type": "to_act", "uuid": f"bot{i}"}]
+        time.sleep(compute_s)
+    yield [{"type": "round_finish", "pot_winners": []}]
+
+
+async def _drain(socket, gen) -> bool:
+    stream = ws._Stream(socket, gen)
+    await stream.computed
+    await stream.sent
+    return stream.hand_ended
+
+
+def _run(pipelined: bool, monkeypatch) -> tuple[float, bool, list[dict]]:
+    monkeypatch.setattr(ws, "PIPELINE_EVENTS", pipelined)
+    monkeypatch.setattr(ws, "_pause_after", lambda batch: 0.08 if batch[0]["type"] == "to_act" else 0.0)
+    socket = _FakeSocket()
+    start = time.perf_counter()
+    hand_ended = asyncio.run(_drain(socket, _gen(6, 0.08)))
+    return time.perf_counter() - start, hand_ended, socket.sent
+
+
+def test_pipelined_overlaps_compute_with_animation(monkeypatch):
+    sequential, seq_ended, seq_sent = _run(False, monkeypatch)
+    pipelined, pipe_ended, pipe_sent = _run(True, monkeypatch)
+    assert pipe_sent == seq_sent
+    assert seq_ended and pipe_ended
+    # 6 × (80ms compute + 80ms pause) sequentially vs. ~6 × 80ms overlapped.
+    assert sequential > 0.95
+    assert pipelined < 0.8
+
+
+def test_compute_finishes_before_the_animation(monkeypatch):
+    monkeypatch.setattr(ws, "PIPELINE_EVENTS", True)
+    monkeypatch.setattr(ws, "_pause_after", lambda batch: 0.05)
+
+    async def main():
+        stream = ws._Stream(_FakeSocket(), _gen(4, 0.0))
+        await stream.computed
+        # The caller releases the game lock here; the sends are still pacing.
+        assert stream.hand_ended and not stream.sent.done()
+        await stream.sent
+
+    asyncio.run(main())
+
+
+def test_producer_error_is_raised(monkeypatch):
+    monkeypatch.setattr(ws, "PIPELINE_EVENTS", True)
+
+    def broken():
+        yield [{"type": "ask", "valid_actions": []}]
+        raise RuntimeError("bot crashed")
+
+    socket = _FakeSocket()
+    with pytest.raises(RuntimeError):
+        asyncio.run(_drain(socket, broken()))
+    assert socket.sent == [{"type": "event", "event": {"type": "ask", "valid_actions": []}}]
+
+
+def test_disconnect_lets_producer_finish(monkeypatch):
+    monkeypatch.setattr(ws, "PIPELINE_EVENTS", True)
+    monkeypatch.setattr(ws, "_pause_after", lambda batch: 0.0)
+    steps = []
+
+    def gen():
+        for i in range(3):
+            steps.append(i)
+            yield [{"type": "to_act", "uuid": f"bot{i}"}]
+        yield [{"type": "round_finish", "pot_winners": []}]
+
+    class _Closed(_FakeSocket):
+        async def send_json(self, msg):
+            raise ws.WebSocketDisconnect()
+
+    async def main():
+        stream = ws._Stream(_Closed(), gen())
+        await stream.computed
+        with pytest.raises(ws.WebSocketDisconnect):
+            await stream.sent
+        return stream.hand_ended
+
+    # The hand finished after the drop: the caller still sees it and saves.
+    assert asyncio.run(main())
+    assert steps == [0, 1, 2]
+
+
+class _PlaySocket:
+    """Just enough of a WebSocket for ``ws.play``: the hero folds at the first
+    ask, and the connection drops as soon as the fold's stream starts."""
+
+    query_params: dict = {}
+
+    def __init__(self):
+        self.sent: list[dict] = []
+        self.acted = False
+
+    async def accept(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def send_json(self, msg: dict) -> None:
+        if self.acted:
+            raise ws.WebSocketDisconnect()
+        self.sent.append(msg)
+
+    async def receive_json(self) -> dict:
+        if self.acted:
+            raise ws.WebSocketDisconnect()
+        self.acted = True
+        return {"type": "action", "action": "fold", "amount": 0}
+
+
+def test_hands_finished_after_a_drop_are_queued_for_saving(tmp_path, monkeypatch):
+    from poker_engine.config import GameConfig, SeatKind, SeatSpec
+    from poker_trainer.game.manager import SessionManager
+    from poker_trainer.game.session import GameSession
+
+    store = SessionManager(spill_dir=tmp_path)
+    queued = []
+    monkeypatch.setattr(ws, "manager", store)
+    monkeypatch.setattr(ws, "PIPELINE_EVENTS", True)
+    monkeypatch.setattr(ws, "_pause_after", lambda batch: 0.0)
+    monkeypatch.setattr(ws, "_queue_save", lambda socket, session: queued.append(session.game_id))
+    config = GameConfig(small_blind=5, buy_in=1000, seats=[
+        SeatSpec(name="hero", kind=SeatKind.HUMAN),
+        SeatSpec(name="tag", kind=SeatKind.TAG),
+        SeatSpec(name="station", kind=SeatKind.STATION),
+    ])
+    session = GameSession(config, hero_index=0, seed=2)
+
+    async def main():
+        await store.add(session)
+        await ws.play(_PlaySocket(), session.game_id)
+        return await store.get(session.game_id)
+
+    stored = asyncio.run(main())
+    # The fold's hand finished with nobody listening; the next hand is dealt
+    # and waiting on the hero, and the finished one is queued for saving.
+    assert queued == [session.game_id]
+    assert stored.pending_ask() is not None
+    assert len(stored.recorder._hands) == 2